@@ -1,8 +1,9 @@
 import argparse
 import sys
-from typing import List
+from typing import Any, List, Optional
 from src.config.i18n import get_available_languages
-from src.gui.translator_gui import TranslatorGUI
+from src.config.settings import PROFILE_MODES, get_profile_mode
+from src.core.factories.backend_factory import get_available_backends
 
 languages_available: List[str] = get_available_languages()
 
@@ -14,6 +15,10 @@ def show_usage() -> None:
     print("  python app.py --lang es       # Español")
     print("  python app.py --lang fr       # Francés")
     print("  python app.py --lang ru       # Ruso")
+    print("  python app.py --backend local # Motor de traducción sin conexión")
+    print("  python app.py --file doc.pdf --to es   # Traduce un archivo sin interfaz gráfica")
+    print("  python app.py --file a.pdf b.docx      # Traduce varios archivos en lote")
+    print("  python app.py --file doc.pdf --profile # Guarda un perfil de rendimiento de la traducción")
     print(f"\nIdiomas disponibles: {', '.join(languages_available)}")
     print("======================\n")
 
@@ -30,6 +35,48 @@ def create_argument_parser() -> argparse.ArgumentParser:
         choices=languages_available,
         help="Idioma de la interfaz (por defecto: en)"
     )
+    parser.add_argument(
+        "--backend",
+        type=str,
+        default=None,
+        choices=get_available_backends(),
+        help="Motor de traducción (por defecto: TRANSLATOR_BACKEND o googletrans)"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=None,
+        help="Reutiliza las traducciones de la ejecución anterior y solo traduce los segmentos modificados"
+    )
+    parser.add_argument(
+        "--file",
+        type=str,
+        nargs="+",
+        default=None,
+        help="Traduce estos archivos desde la línea de comandos en lugar de abrir la interfaz"
+    )
+    parser.add_argument(
+        "--from",
+        dest="entry_lang",
+        type=str,
+        default="detect",
+        help="Idioma de origen del archivo (por defecto: detect)"
+    )
+    parser.add_argument(
+        "--to",
+        dest="output_lang",
+        type=str,
+        default=None,
+        help="Idioma de destino del archivo (por defecto: el idioma de la interfaz)"
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="all",
+        default=None,
+        choices=PROFILE_MODES,
+        help="Perfila la traducción de --file y guarda .prof y .collapsed (por defecto: TRANSLATOR_PROFILE)"
+    )
     return parser
 
 def validate_language(language: str) -> bool:
@@ -39,11 +86,55 @@ def validate_language(language: str) -> bool:
         return False
     return True
 
-def start_application(language: str) -> None:
+def start_application(language: str, backend: Optional[str] = None,
+                      incremental: Optional[bool] = None) -> None:
+    from src.gui.translator_gui import TranslatorGUI
     print(f"🚀 Iniciando traductor en idioma: {language}")
-    gui = TranslatorGUI(language)
+    gui = TranslatorGUI(language, backend, incremental)
     gui.run()
 
+def run_file_job(args: argparse.Namespace) -> int:
+    """Traduce un archivo sin interfaz, mostrando el progreso en la terminal."""
+    from src.core.factories.translator_factory import create_translator_app
+    app = create_translator_app(args.lang, args.backend, args.incremental)
+    app.entry_language = args.entry_lang
+    app.output_language = args.output_lang or args.lang
+    profile = args.profile if args.profile is not None else get_profile_mode()
+    if len(args.file) > 1 and not profile:
+        return run_file_batch(app, args.file)
+    # Profiles are taken per job, so a profiled batch translates its files one after another
+    exit_codes = [run_single_file(app, file_path, profile) for file_path in args.file]
+    return 0 if all(code == 0 for code in exit_codes) else 1
+
+def run_single_file(app: Any, file_path: str, profile: str) -> int:
+    """Traduce un archivo como trabajo en segundo plano y muestra su progreso."""
+    job = app.submit_file(file_path, profile=profile)
+    try:
+        for progress in job.progress():
+            print(f"\r⏳ {progress.stage}: {progress.done}/{progress.total}", end="", flush=True)
+    except KeyboardInterrupt:
+        job.cancel()
+    result = job.result()
+    print()
+    print(("✅ " if result.status == "completed" else "❌ ") + result.message)
+    if result.status == "completed":
+        timings = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in result.timings.items())
+        print(f"   {result.segments} segmentos, {result.reused_segments} reutilizados, "
+              f"{result.cache_hits} aciertos de caché ({timings})")
+        print(f"   {result.skipped_segments} segmentos sin traducir por el filtro "
+              f"({result.skipped_fraction:.0%} de llamadas evitadas)")
+    for profile_path in result.profiles:
+        print(f"   📊 Perfil guardado en {profile_path}")
+    return 0 if result.status == "completed" else 1
+
+def run_file_batch(app: Any, file_paths: List[str]) -> int:
+    """Traduce varios archivos leyendo el siguiente mientras se traduce el actual."""
+    import asyncio
+    results = asyncio.run(app.translate_files_async(file_paths))
+    for result in results:
+        print(("✅ " if result.status == "completed" else "❌ ") + f"{result.file_path}: {result.message}")
+    return 0 if all(result.status == "completed" for result in results) else 1
+
 def handle_keyboard_interrupt() -> None:
     """Maneja la interrupción por teclado (Ctrl+C)"""
     print("\n👋 Aplicación cerrada por el usuario")
@@ -68,7 +159,10 @@ def main() -> None:
         if not validate_language(args.lang):
             sys.exit(1)
         
-        start_application(args.lang)
+        if args.file:
+            sys.exit(run_file_job(args))
+        
+        start_application(args.lang, args.backend, args.incremental)
         
     except KeyboardInterrupt:
         handle_keyboard_interrupt()
@@ -1,60 +1,170 @@
 """
 Simplified internationalization (i18n) system for the translator app.
+
+translations.json is compiled into a small pickle cache (one index plus one
+file per language) that is rebuilt whenever the JSON file changes. Languages
+are then loaded lazily, so startup cost does not grow with the number of UI
+languages.
 """
 
 import json
 import os
-from typing import Any
+import pickle
+import tempfile
+import time
+from typing import Any, Optional
 from pathlib import Path
 
+CACHE_VERSION = 1
+
+FALLBACK_TRANSLATIONS: dict[str, dict[str, Any]] = {
+    "en": {
+        "title": "Translator",
+        "insert_text": "Insert text",
+        "translation": "Translation",
+        "translate": "Translate",
+        "translate_file": "Translate File",
+        "select_file": "Select File",
+        "output_path": "Translated file saved at"
+    }
+}
+
 class TranslationManager:
-    """Simple translation manager that loads from JSON."""
+    """Translation manager that loads languages lazily from a compiled catalog cache."""
     
-    def __init__(self):
+    def __init__(self, translations_file: Optional[str] = None, cache_dir: Optional[str] = None,
+                 default_language: str = "en"):
         # Get path to translations.json
         current_dir = Path(__file__).parent
         project_root = current_dir.parent.parent
-        self.translations_file = str(project_root / "translations" / "translations.json")
-        self._cache = None
+        self.translations_file = translations_file or str(project_root / "translations" / "translations.json")
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(self.translations_file).parent / ".catalog_cache"
+        self.default_language = default_language
+        self._cache: Optional[dict[str, dict[str, str]]] = None
+        self._languages: Optional[list[str]] = None
+        self._loaded: dict[str, dict[str, Any]] = {}
+        # Parsed catalog, kept only when it could not be written to the cache directory
+        self._uncached: Optional[dict[str, dict[str, Any]]] = None
     
+    def _source_signature(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = os.stat(self.translations_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _index_path(self) -> Path:
+        return self.cache_dir / "index.pickle"
+
+    def _language_path(self, language: str) -> Path:
+        return self.cache_dir / f"{language}.pickle"
+
+    def _parse_source(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.translations_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            # Fallback to basic English
+            return FALLBACK_TRANSLATIONS
+
+    def compile_catalog(self) -> list[str]:
+        """Parse translations.json and write the per-language cache. Returns the languages.
+
+        Languages are not kept in memory: each one is loaded from the cache when first requested.
+        """
+        catalog = self._parse_source()
+        languages = list(catalog)
+        self._loaded.clear()
+        signature = self._source_signature()
+        if signature is None:
+            self._uncached = catalog
+            return languages
+        self._uncached = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for language, texts in catalog.items():
+                self._write_pickle(self._language_path(language), texts)
+            # The index is written last so a partial compile is never considered valid
+            self._write_pickle(self._index_path(), {
+                "version": CACHE_VERSION, "source": signature, "languages": languages,
+            })
+        except OSError:
+            self._uncached = catalog  # read-only install: keep working from the parsed catalog
+        return languages
+
+    def _write_pickle(self, path: Path, data: Any) -> None:
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def _load_index(self) -> list[str]:
+        if self._languages is None:
+            try:
+                with open(self._index_path(), 'rb') as f:
+                    index = pickle.load(f)
+                valid = index.get("version") == CACHE_VERSION and tuple(index.get("source", ())) == self._source_signature()
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+                valid = False
+            self._languages = index["languages"] if valid else self.compile_catalog()
+        return self._languages
+
+    def _load_language(self, language: str) -> Optional[dict[str, Any]]:
+        if language in self._loaded:
+            return self._loaded[language]
+        if language not in self._load_index():
+            return None
+        texts = self._read_language(language)
+        if texts is None:
+            # Missing or corrupt language file: rebuild the cache and try again
+            self.compile_catalog()
+            texts = self._read_language(language)
+        if texts is not None:
+            self._loaded[language] = texts
+        return texts
+
+    def _read_language(self, language: str) -> Optional[dict[str, Any]]:
+        if self._uncached is not None:
+            return self._uncached.get(language)
+        try:
+            with open(self._language_path(language), 'rb') as f:
+                texts: dict[str, Any] = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        return texts
+
+    def fallback_chain(self, language: str) -> list[str]:
+        """Languages tried for a request, e.g. es-MX -> es -> en."""
+        chain = [language]
+        base = language.replace("_", "-").split("-")[0]
+        if base != language:
+            chain.append(base)
+        if self.default_language not in chain:
+            chain.append(self.default_language)
+        return chain
+
     def load_translations(self) -> dict[str, dict[str, Any]]:
-        """Load translations from JSON file with caching."""
+        """Load every language (only needed by callers that want the whole catalog)."""
         if self._cache is None:
-            try:
-                with open(self.translations_file, 'r', encoding='utf-8') as f:
-                    self._cache = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                # Fallback to basic English
-                self._cache = {
-                    "en": {
-                        "title": "Translator",
-                        "insert_text": "Insert text",
-                        "translation": "Translation",
-                        "translate": "Translate",
-                        "translate_file": "Translate File",
-                        "select_file": "Select File",
-                        "output_path": "Translated file saved at"
-                    }
-                }
+            self._cache = {language: self._load_language(language) or {} for language in self._load_index()}
         return self._cache
     
     def get_text(self, language: str) -> dict[str, Any]:
-        """Get translated text for a key and language."""
-        translations: dict[str, dict[str, Any]] = self.load_translations()
-        
-        # Try target language first
-        if language in translations:
-            return translations[language]
-        
-        # Fallback to English
-        if "en" in translations:
-            return translations["en"]
-        else:
-            raise ValueError("No translations available")
+        """Get the translated texts of a language, following the fallback chain."""
+        for candidate in self.fallback_chain(language):
+            texts = self._load_language(candidate)
+            if texts is not None:
+                return texts
+        raise ValueError("No translations available")
     
     def get_available_languages(self) -> list[str]:
         """Get list of available language codes."""
-        return list(self.load_translations().keys())
+        return list(self._load_index())
 
 # Global instance
 _translation_manager = TranslationManager()
@@ -71,3 +181,36 @@ def get_text(language: str) -> dict[str, Any]:
 def get_available_languages() -> list[str]:
     """Get available language codes."""
     return _translation_manager.get_available_languages()
+
+def main() -> None:
+    """Benchmark cold-start get_available_languages/get_text as the catalog grows."""
+    english = FALLBACK_TRANSLATIONS["en"]
+    print(f"{'languages':>9} {'compile ms':>10} {'languages ms':>12} {'get_text ms':>11} {'json ms':>8}")
+    for count in (4, 40, 400, 4000):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "translations.json")
+            catalog = {f"l{index:04d}": {key: f"{value} {index}" for key, value in english.items()} for index in range(count)}
+            catalog["en"] = english
+            with open(source, 'w', encoding='utf-8') as f:
+                json.dump(catalog, f)
+
+            started = time.perf_counter()
+            TranslationManager(source).get_available_languages()
+            compile_ms = (time.perf_counter() - started) * 1000
+
+            manager = TranslationManager(source)
+            started = time.perf_counter()
+            manager.get_available_languages()
+            languages_ms = (time.perf_counter() - started) * 1000
+            started = time.perf_counter()
+            manager.get_text("l0001")
+            text_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            with open(source, 'r', encoding='utf-8') as f:
+                json.load(f)
+            json_ms = (time.perf_counter() - started) * 1000
+            print(f"{count:>9} {compile_ms:>10.2f} {languages_ms:>12.3f} {text_ms:>11.3f} {json_ms:>8.2f}")
+
+if __name__ == '__main__':
+    main()
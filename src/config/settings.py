@@ -0,0 +1,116 @@
+"""
+Runtime settings for the translator app, read from environment variables.
+"""
+
+import os
+
+DEFAULT_BACKEND = "googletrans"
+
+def _get_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+def _get_float(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+def get_backend_name() -> str:
+    """Translation backend selected with TRANSLATOR_BACKEND."""
+    return os.environ.get("TRANSLATOR_BACKEND", DEFAULT_BACKEND).strip().lower() or DEFAULT_BACKEND
+
+def get_batch_size() -> int:
+    """Maximum number of segments sent to the backend in a single call."""
+    return max(1, _get_int("TRANSLATOR_BATCH_SIZE", 50))
+
+def get_cache_size() -> int:
+    """Maximum number of translated segments kept in memory."""
+    return max(0, _get_int("TRANSLATOR_CACHE_SIZE", 10000))
+
+def get_phrase_table_dir() -> str | None:
+    """Directory holding the phrase tables of the offline backend."""
+    return os.environ.get("TRANSLATOR_PHRASE_TABLE_DIR") or None
+
+def get_echo_latency() -> float:
+    """Artificial latency in seconds added by the echo backend."""
+    return max(0.0, _get_float("TRANSLATOR_ECHO_LATENCY_MS", 0.0) / 1000.0)
+
+def get_cache_dir() -> str:
+    """User cache directory for compiled data that cannot be written next to its source."""
+    configured = os.environ.get("TRANSLATOR_CACHE_DIR", "").strip()
+    if configured:
+        return configured
+    base = os.environ.get("XDG_CACHE_HOME", "").strip() or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "translator")
+
+def get_lexicon_path() -> str | None:
+    """CMUdict-style pronunciation lexicon used by the phonetic transcriber."""
+    return os.environ.get("TRANSLATOR_LEXICON_PATH") or None
+
+def get_ipa_cache_size() -> int:
+    """Maximum number of (word, accent) transcriptions memoized by the phonetic engine."""
+    return max(0, _get_int("TRANSLATOR_IPA_CACHE_SIZE", 50000))
+
+def get_incremental() -> bool:
+    """Whether file translation reuses the segment manifest of the previous run."""
+    return os.environ.get("TRANSLATOR_INCREMENTAL", "").strip().lower() in ("1", "true", "yes", "on")
+
+def get_segment_filter() -> bool:
+    """Whether segments that need no translation (numbers, URLs, code...) skip the backend."""
+    return os.environ.get("TRANSLATOR_SEGMENT_FILTER", "1").strip().lower() not in ("0", "false", "no", "off")
+
+def get_segment_spill_bytes() -> int:
+    """Size after which a segment store moves its text to a memory-mapped temporary file."""
+    return max(0, _get_int("TRANSLATOR_SEGMENT_SPILL_MB", 64)) * 1024 * 1024
+
+def get_detect_confidence() -> float:
+    """Minimum confidence for the local language detector to answer without the remote detect()."""
+    return min(1.0, max(0.0, _get_float("TRANSLATOR_DETECT_CONFIDENCE", 0.9)))
+
+def get_initial_concurrency() -> int:
+    """Concurrent backend requests allowed before the adaptive limiter has measured latency."""
+    return max(1, _get_int("TRANSLATOR_INITIAL_CONCURRENCY", 4))
+
+def get_max_concurrency() -> int:
+    """Upper bound for the adaptive number of concurrent backend requests."""
+    return max(1, _get_int("TRANSLATOR_MAX_CONCURRENCY", 16))
+
+def get_backend_retries() -> int:
+    """Times a failed or throttled backend call is retried, with exponential backoff."""
+    return max(0, _get_int("TRANSLATOR_BACKEND_RETRIES", 3))
+
+def get_out_of_core_segments() -> int:
+    """Documents with more segments than this are written out-of-core (0 disables, 1 always)."""
+    if os.environ.get("TRANSLATOR_OUT_OF_CORE", "").strip().lower() in ("1", "true", "yes", "on"):
+        return 1
+    return max(0, _get_int("TRANSLATOR_OUT_OF_CORE_SEGMENTS", 20000))
+
+PROFILE_MODES = ("cprofile", "sample", "all")
+
+def get_profile_mode() -> str:
+    """Profiler wrapped around each file job: cprofile, sample, all, or empty when off."""
+    mode = os.environ.get("TRANSLATOR_PROFILE", "").strip().lower()
+    if mode in ("1", "true", "yes", "on"):
+        return "all"
+    return mode if mode in PROFILE_MODES else ""
+
+def get_profile_dir() -> str:
+    """Directory where job profiles are written."""
+    return os.environ.get("TRANSLATOR_PROFILE_DIR", "").strip() or "profiles"
+
+def get_glossary_dir() -> str | None:
+    """Directory holding the per-language-pair glossaries of approved terms."""
+    return os.environ.get("TRANSLATOR_GLOSSARY_DIR") or None
+
+def get_io_workers() -> int:
+    """Threads that run blocking file parsing and writing for the async helpers."""
+    return max(1, _get_int("TRANSLATOR_IO_WORKERS", 4))
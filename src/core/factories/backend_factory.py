@@ -0,0 +1,60 @@
+from collections.abc import Callable
+from typing import Optional
+from src.config.settings import get_backend_name, get_echo_latency
+from src.core.interfaces.translation_backend_interface import TranslationBackendInterface
+from src.core.pipeline.translation_pipeline import TranslationPipeline
+
+BackendConstructor = Callable[[], TranslationBackendInterface]
+
+_BACKENDS: dict[str, BackendConstructor] = {}
+
+
+def register_backend(name: str, constructor: BackendConstructor) -> None:
+    """Register a backend constructor under name, replacing any previous one."""
+    _BACKENDS[name.lower()] = constructor
+
+
+def get_available_backends() -> list[str]:
+    return sorted(_BACKENDS)
+
+
+def create_backend(name: Optional[str] = None) -> TranslationBackendInterface:
+    """Create the backend called name, or the one selected in the settings."""
+    backend_name = (name or get_backend_name()).lower()
+    constructor = _BACKENDS.get(backend_name)
+    if constructor is None:
+        available = ", ".join(get_available_backends())
+        raise ValueError(f"Unknown translation backend '{backend_name}'. Available: {available}")
+    return constructor()
+
+
+def create_translation_pipeline(name: Optional[str] = None) -> TranslationPipeline:
+    """Wrap the selected backend in the shared batching, caching and metrics layers."""
+    return TranslationPipeline(create_backend(name))
+
+
+# Backends are imported lazily so offline engines do not need network-only dependencies
+def _create_googletrans_backend() -> TranslationBackendInterface:
+    from src.services.googletrans_services import GoogletransBackend
+    return GoogletransBackend()
+
+
+def _create_local_backend() -> TranslationBackendInterface:
+    from src.services.local_dictionary_services import LocalDictionaryBackend
+    return LocalDictionaryBackend()
+
+
+def _create_echo_backend() -> TranslationBackendInterface:
+    from src.services.echo_services import EchoBackend
+    return EchoBackend(latency=get_echo_latency())
+
+
+def _create_simulated_backend() -> TranslationBackendInterface:
+    from src.services.echo_services import SimulatedCapacityBackend
+    return SimulatedCapacityBackend()
+
+
+register_backend("googletrans", _create_googletrans_backend)
+register_backend("local", _create_local_backend)
+register_backend("echo", _create_echo_backend)
+register_backend("simulated", _create_simulated_backend)
@@ -1,13 +1,20 @@
+from typing import Optional
 from src.core.translator import TranslatorApp
+from src.core.factories.backend_factory import create_translation_pipeline
 from src.core.implements.text_translator_implements import TextTranslatorImplements
 from src.core.implements.file_translator_implements import FileTranslatorImplements
 from src.core.implements.phonetic_transcription_implements import PhoneticTranscriptionImplements
 
 
-def create_translator_app(lang: str = "en") -> TranslatorApp:
-    """Factory that wires default implementations to the app using interfaces."""
-    text_impl = TextTranslatorImplements()
-    file_impl = FileTranslatorImplements()
+def create_translator_app(lang: str = "en", backend: Optional[str] = None,
+                          incremental: Optional[bool] = None) -> TranslatorApp:
+    """Factory that wires default implementations to the app using interfaces.
+
+    The translation backend is taken from backend, or from the TRANSLATOR_BACKEND setting,
+    and incremental file translation from incremental or TRANSLATOR_INCREMENTAL.
+    """
+    pipeline = create_translation_pipeline(backend)
+    text_impl = TextTranslatorImplements(pipeline)
+    file_impl = FileTranslatorImplements(pipeline, incremental)
     phonetic_impl = PhoneticTranscriptionImplements()
     return TranslatorApp(lang=lang, text_translator=text_impl, file_translator=file_impl, phonetic_transcriber=phonetic_impl)
-
@@ -0,0 +1,70 @@
+"""
+CSV format, streamed row by row with the csv module.
+
+The dialect is sniffed from the start of the file and reused for the copy,
+along with the line terminator and byte order mark of the source.
+Every cell with letters in it is a segment; numeric and empty cells are
+copied as they are. The first row is taken as a header of column names and
+copied untranslated, unless the format is created with ``header=False``.
+"""
+
+import codecs
+import csv
+from collections.abc import Iterable, Iterator
+from typing import Optional, TextIO
+from src.core.formats.file_format import FileFormat
+
+SNIFF_BYTES = 64 * 1024
+
+
+def _is_text_cell(cell: str) -> bool:
+    return any(char.isalpha() for char in cell)
+
+
+def _sniff_dialect(source: TextIO, file_path: str) -> type[csv.Dialect] | str:
+    sample = source.read(SNIFF_BYTES)
+    source.seek(0)
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=",;\t|")
+    except csv.Error:
+        return 'excel-tab' if file_path.lower().endswith('.tsv') else 'excel'
+
+
+def _line_terminator(source: TextIO) -> str:
+    # The sniffed dialect always says \r\n; the end of the first line tells what the file uses
+    line = source.readline()
+    source.seek(0)
+    terminator = line[len(line.rstrip("\r\n")):]
+    return terminator or "\r\n"
+
+
+class CsvFormat(FileFormat):
+    name = "csv"
+    suffixes = ('.csv', '.tsv')
+
+    def __init__(self, header: bool = True) -> None:
+        self.header = header
+
+    def _is_segment(self, row_number: int, cell: str) -> bool:
+        return not (self.header and row_number == 0) and _is_text_cell(cell)
+
+    def iter_segments(self, file_path: str) -> Iterator[str]:
+        with open(file_path, 'r', encoding='utf-8-sig', newline='') as source:
+            for number, row in enumerate(csv.reader(source, _sniff_dialect(source, file_path))):
+                yield from (cell for cell in row if self._is_segment(number, cell))
+
+    def write(self, file_path: str, translations: Iterable[str], output_path: str,
+              out_of_core: bool = False) -> Optional[str]:
+        pending = iter(translations)
+        try:
+            with open(file_path, 'rb') as raw:
+                encoding = 'utf-8-sig' if raw.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8 else 'utf-8'
+            with open(file_path, 'r', encoding='utf-8-sig', newline='') as source, \
+                    open(output_path, 'w', encoding=encoding, newline='') as output:
+                dialect = _sniff_dialect(source, file_path)
+                writer = csv.writer(output, dialect, lineterminator=_line_terminator(source))
+                for number, row in enumerate(csv.reader(source, dialect)):
+                    writer.writerow([next(pending, cell) if self._is_segment(number, cell) else cell for cell in row])
+        except Exception as e:
+            return f"Error writing to file: {e}"
+        return None
@@ -0,0 +1,41 @@
+"""
+PDF, DOCX and plain-text formats.
+
+These are rebuilt from the translated lines rather than re-streamed, using
+the writers in help.write_files, or the out-of-core writers in
+help.streaming_writers for very large documents.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import Optional
+from src.core.formats.file_format import FileFormat
+
+
+class DocumentFormat(FileFormat):
+    """Format read line by line and written from scratch (.pdf, .docx, .txt)."""
+
+    def __init__(self, suffix: str) -> None:
+        self.name = suffix.lstrip('.')
+        self.suffixes = (suffix,)
+
+    def iter_segments(self, file_path: str) -> Iterator[str]:
+        # Imported here so markup formats do not need the PDF/DOCX libraries
+        from src.core.help.read_files import LINE_READERS
+        for line in LINE_READERS[self.suffixes[0]](file_path):
+            line = line.strip()
+            if line:
+                yield line
+
+    def write(self, file_path: str, translations: Iterable[str], output_path: str,
+              out_of_core: bool = False) -> Optional[str]:
+        try:
+            # A missing PDF/DOCX library is reported like any other write failure
+            if out_of_core and self.suffixes[0] != '.txt':
+                from src.core.help.streaming_writers import write_docx_file_streaming, write_pdf_file_streaming
+                writer = write_pdf_file_streaming if self.suffixes[0] == '.pdf' else write_docx_file_streaming
+                return writer(translations, output_path)
+            from src.core.help.write_files import SAVERS
+            SAVERS[self.suffixes[0]](translations, output_path)
+        except Exception as e:
+            return f"Error writing to file: {e}"
+        return None
@@ -0,0 +1,86 @@
+"""
+Base classes for file-format plugins.
+
+A format knows how to stream the translatable segments out of a file and how
+to write a translated copy of it. Markup formats re-stream the source while
+writing and substitute translations in the order their segments were read,
+so structure, markup and formatting outside text nodes are kept verbatim and
+only a bounded window of the source is in memory at a time.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from typing import Optional
+from src.core.help.file_errors import FileReadError
+from src.core.help.segment_store import SegmentStore
+
+
+class FileFormat(ABC):
+    """A translatable file format, registered by suffix in format_registry."""
+
+    name: str = ""
+    suffixes: tuple[str, ...] = ()
+
+    @abstractmethod
+    def iter_segments(self, file_path: str) -> Iterator[str]:
+        """Yield the segments of file_path that should be translated, in document order."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def write(self, file_path: str, translations: Iterable[str], output_path: str,
+              out_of_core: bool = False) -> Optional[str]:
+        """Write the translated copy of file_path; return an error message on failure."""
+        raise NotImplementedError
+
+    def read_segments(self, file_path: str, store: Optional[SegmentStore] = None) -> SegmentStore:
+        """Stream the segments of a file into a segment store.
+
+        A file that cannot be read or parsed raises FileReadError; the store is closed first.
+        """
+        store = store if store is not None else SegmentStore()
+        try:
+            store.extend(self.iter_segments(file_path))
+        except Exception as e:
+            store.close()
+            raise FileReadError(file_path, f"Error reading file ({e})") from e
+        return store
+
+
+# A chunk of the source and whether it is a translatable segment
+Chunk = tuple[str, bool]
+
+
+class StreamingFormat(FileFormat):
+    """Format whose reader and writer share one chunk tokenizer over the source."""
+
+    encoding = 'utf-8'
+
+    @abstractmethod
+    def iter_chunks(self, file_path: str) -> Iterator[Chunk]:
+        """Split the source into chunks that together reproduce it (markup unescaped where translatable)."""
+        raise NotImplementedError
+
+    def escape(self, text: str) -> str:
+        """Encode a translated segment for the output format."""
+        return text
+
+    def iter_segments(self, file_path: str) -> Iterator[str]:
+        for chunk, translatable in self.iter_chunks(file_path):
+            if translatable:
+                yield chunk
+
+    def write(self, file_path: str, translations: Iterable[str], output_path: str,
+              out_of_core: bool = False) -> Optional[str]:
+        pending = iter(translations)
+        try:
+            with open(output_path, 'w', encoding=self.encoding, newline='') as output:
+                for chunk, translatable in self.iter_chunks(file_path):
+                    output.write(self.escape(next(pending, chunk)) if translatable else chunk)
+        except Exception as e:
+            return f"Error writing to file: {e}"
+        return None
+
+
+def is_translatable(text: str) -> bool:
+    """Whitespace-only text is copied as is rather than sent for translation."""
+    return bool(text) and not text.isspace()
@@ -0,0 +1,77 @@
+from collections.abc import Callable
+import os
+from src.core.formats.file_format import FileFormat
+
+FormatConstructor = Callable[[], FileFormat]
+
+_FORMATS: dict[str, FormatConstructor] = {}
+_instances: dict[str, FileFormat] = {}
+
+
+def register_format(suffix: str, constructor: FormatConstructor) -> None:
+    """Register a format constructor for a file suffix, replacing any previous one."""
+    suffix = suffix.lower() if suffix.startswith('.') else f".{suffix.lower()}"
+    _FORMATS[suffix] = constructor
+    _instances.pop(suffix, None)
+
+
+def get_supported_suffixes() -> list[str]:
+    return sorted(_FORMATS)
+
+
+def get_format(file_path: str) -> FileFormat:
+    """Return the format handling file_path, chosen by its suffix."""
+    suffix = os.path.splitext(file_path)[1].lower()
+    if suffix not in _instances:
+        constructor = _FORMATS.get(suffix)
+        if constructor is None:
+            raise ValueError(f"Unsupported file format. Please use {', '.join(get_supported_suffixes())} files.")
+        _instances[suffix] = constructor()
+    return _instances[suffix]
+
+
+# Formats are imported lazily so each one only needs its own dependencies
+def _document_format(suffix: str) -> FormatConstructor:
+    def create() -> FileFormat:
+        from src.core.formats.document_formats import DocumentFormat
+        return DocumentFormat(suffix)
+    return create
+
+
+def _create_html_format() -> FileFormat:
+    from src.core.formats.html_format import HtmlFormat
+    return HtmlFormat()
+
+
+def _create_xml_format() -> FileFormat:
+    from src.core.formats.xml_format import XmlFormat
+    return XmlFormat()
+
+
+def _create_markdown_format() -> FileFormat:
+    from src.core.formats.markdown_format import MarkdownFormat
+    return MarkdownFormat()
+
+
+def _create_subtitle_format() -> FileFormat:
+    from src.core.formats.subtitle_format import SubtitleFormat
+    return SubtitleFormat()
+
+
+def _create_csv_format() -> FileFormat:
+    from src.core.formats.csv_format import CsvFormat
+    return CsvFormat()
+
+
+for _suffix in ('.pdf', '.docx', '.txt'):
+    register_format(_suffix, _document_format(_suffix))
+for _suffix in ('.html', '.htm', '.xhtml'):
+    register_format(_suffix, _create_html_format)
+for _suffix in ('.xml', '.svg'):
+    register_format(_suffix, _create_xml_format)
+for _suffix in ('.md', '.markdown'):
+    register_format(_suffix, _create_markdown_format)
+for _suffix in ('.srt', '.vtt'):
+    register_format(_suffix, _create_subtitle_format)
+for _suffix in ('.csv', '.tsv'):
+    register_format(_suffix, _create_csv_format)
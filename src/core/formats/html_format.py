@@ -0,0 +1,84 @@
+"""
+HTML format, tokenized incrementally with the standard library HTMLParser.
+
+The source is fed to the parser in fixed-size blocks; tags, comments and
+declarations are copied verbatim and only text nodes are translated. Text
+inside script, style, pre, code and similar elements is left untouched.
+"""
+
+from collections.abc import Iterator
+from html import escape
+from html.parser import HTMLParser
+from src.core.formats.file_format import Chunk, StreamingFormat, is_translatable
+
+READ_BLOCK_SIZE = 64 * 1024
+
+# Elements whose text content is never translated
+UNTRANSLATED_ELEMENTS = frozenset({"script", "style", "pre", "code", "kbd", "samp", "var", "textarea", "template"})
+
+
+class _ChunkingParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.chunks: list[Chunk] = []
+        self._skip_depth = 0
+        self._end_tag: int | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in UNTRANSLATED_ELEMENTS:
+            self._skip_depth += 1
+        self.chunks.append((self.get_starttag_text() or f"<{tag}>", False))
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.chunks.append((self.get_starttag_text() or f"<{tag}/>", False))
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in UNTRANSLATED_ELEMENTS and self._skip_depth:
+            self._skip_depth -= 1
+        # The text of the tag as written is put back by parse_endtag
+        self._end_tag = len(self.chunks)
+        self.chunks.append((f"</{tag}>", False))
+
+    def parse_endtag(self, i: int) -> int:
+        self._end_tag = None
+        end = super().parse_endtag(i)
+        if self._end_tag is not None and end > i:
+            self.chunks[self._end_tag] = (self.rawdata[i:end], False)
+        return end
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth or self.cdata_elem is not None or not is_translatable(data):
+            # Untranslated text comes back unescaped from the parser
+            self.chunks.append((data if self.cdata_elem is not None else escape(data, quote=False), False))
+        else:
+            self.chunks.append((data, True))
+
+    def handle_comment(self, data: str) -> None:
+        self.chunks.append((f"<!--{data}-->", False))
+
+    def handle_decl(self, decl: str) -> None:
+        self.chunks.append((f"<!{decl}>", False))
+
+    def handle_pi(self, data: str) -> None:
+        self.chunks.append((f"<?{data}>", False))
+
+    def unknown_decl(self, data: str) -> None:
+        self.chunks.append((f"<![{data}]>", False))
+
+
+class HtmlFormat(StreamingFormat):
+    name = "html"
+    suffixes = ('.html', '.htm', '.xhtml')
+
+    def iter_chunks(self, file_path: str) -> Iterator[Chunk]:
+        parser = _ChunkingParser()
+        with open(file_path, 'r', encoding=self.encoding, errors='replace', newline='') as source:
+            while block := source.read(READ_BLOCK_SIZE):
+                parser.feed(block)
+                yield from parser.chunks
+                parser.chunks.clear()
+        parser.close()
+        yield from parser.chunks
+
+    def escape(self, text: str) -> str:
+        return escape(text, quote=False)
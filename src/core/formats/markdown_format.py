@@ -0,0 +1,113 @@
+"""
+Markdown format, streamed line by line.
+
+Block syntax (heading markers, quotes, list bullets, table pipes) is kept and
+only the text after it is translated. Within a line, inline code spans, link
+and image destinations and autolinks are kept as well, so only the prose and
+the link text reach the backend. Front matter, fenced and indented
+code blocks, HTML lines, link definitions and table separators are copied
+verbatim.
+"""
+
+import re
+from collections.abc import Iterator
+from src.core.formats.file_format import Chunk, StreamingFormat, is_translatable
+
+# Leading block markers: indentation, quotes, heading, bullet or number, task box
+_PREFIX_RE = re.compile(r"^(\s{0,3}(?:>\s?)*(?:#{1,6}\s+|(?:[-*+]|\d{1,9}[.)])\s+(?:\[[ xX]\]\s+)?)?)")
+_FENCE_RE = re.compile(r"^\s{0,3}(`{3,}|~{3,})")
+# HTML blocks, link definitions, thematic breaks, setext underlines and table separators
+_RAW_LINE_RE = re.compile(
+    r"^\s{0,3}(?:<[/!?a-zA-Z]|\[[^\]]+\]:\s|[-*_](?:\s*[-*_]){2,}\s*$|=+\s*$|-+\s*$"
+    r"|\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)+\|?\s*$)")
+_TABLE_CELL_RE = re.compile(r"(\|)")
+_HEADING_CLOSE_RE = re.compile(r"(\s+#+\s*)$")
+# Inline spans kept verbatim: code, the brackets and destination of links and images, autolinks
+_INLINE_RE = re.compile(
+    r"(`+).*?(?<!`)\1(?!`)"
+    r"|(!?\[)([^\[\]]*)(\]\([^()\s]*(?:\s+\"[^\"]*\")?\)|\]\[[^\[\]]*\])"
+    r"|<(?:[a-zA-Z][\w+.-]*:[^\s<>]*|[\w.+-]+@[\w-]+(?:\.[\w-]+)+)>")
+
+
+def _split_line_ending(line: str) -> tuple[str, str]:
+    body = line.rstrip("\r\n")
+    return body, line[len(body):]
+
+
+class MarkdownFormat(StreamingFormat):
+    name = "markdown"
+    suffixes = ('.md', '.markdown')
+
+    def iter_chunks(self, file_path: str) -> Iterator[Chunk]:
+        fence = ""
+        in_front_matter = False
+        previous_blank = True
+        with open(file_path, 'r', encoding=self.encoding, newline='') as source:
+            for number, line in enumerate(source):
+                body, ending = _split_line_ending(line)
+                if number == 0 and body.strip() == "---":
+                    in_front_matter = True
+                    yield line, False
+                    continue
+                if in_front_matter:
+                    in_front_matter = body.strip() not in ("---", "...")
+                    yield line, False
+                    continue
+                fence_match = _FENCE_RE.match(body)
+                if fence:
+                    if fence_match and fence_match.group(1)[0] == fence[0] and len(fence_match.group(1)) >= len(fence):
+                        fence = ""
+                    yield line, False
+                    continue
+                if fence_match:
+                    fence = fence_match.group(1)
+                    yield line, False
+                    continue
+                indented_code = previous_blank and (body.startswith("    ") or body.startswith("\t"))
+                previous_blank = not body.strip()
+                if previous_blank or indented_code or _RAW_LINE_RE.match(body):
+                    yield line, False
+                    continue
+                yield from self._line_chunks(body)
+                yield ending, False
+
+    @staticmethod
+    def _line_chunks(body: str) -> Iterator[Chunk]:
+        prefix = _PREFIX_RE.match(body)
+        marker = prefix.group(1) if prefix else ""
+        if marker:
+            yield marker, False
+        text = body[len(marker):]
+        if text.lstrip().startswith("|"):
+            # Table row: every cell is its own segment
+            for part in _TABLE_CELL_RE.split(text):
+                if part == "|":
+                    yield part, False
+                else:
+                    yield from MarkdownFormat._inline_chunks(part)
+            return
+        closing = _HEADING_CLOSE_RE.search(text) if marker.lstrip().startswith("#") else None
+        if closing:
+            yield from MarkdownFormat._inline_chunks(text[:closing.start()])
+            yield closing.group(1), False
+        else:
+            yield from MarkdownFormat._inline_chunks(text)
+
+    @staticmethod
+    def _inline_chunks(text: str) -> Iterator[Chunk]:
+        cursor = 0
+        for match in _INLINE_RE.finditer(text):
+            prose = text[cursor:match.start()]
+            if prose:
+                yield prose, is_translatable(prose)
+            if match.group(2) is not None:
+                # Link or image: only the text between the brackets is translated
+                yield match.group(2), False
+                if match.group(3):
+                    yield match.group(3), is_translatable(match.group(3))
+                yield match.group(4), False
+            else:
+                yield match.group(), False
+            cursor = match.end()
+        if cursor < len(text):
+            yield text[cursor:], is_translatable(text[cursor:])
@@ -0,0 +1,34 @@
+"""
+SubRip (.srt) and WebVTT (.vtt) subtitles, streamed line by line.
+
+Cue numbers, identifiers, timing lines, the WEBVTT header and NOTE/STYLE
+blocks are copied verbatim; only the text lines that follow a timing line
+in the same block are translated.
+"""
+
+from collections.abc import Iterator
+from src.core.formats.file_format import Chunk, StreamingFormat, is_translatable
+
+TIMING_SEPARATOR = "-->"
+
+
+class SubtitleFormat(StreamingFormat):
+    name = "subtitles"
+    suffixes = ('.srt', '.vtt')
+
+    def iter_chunks(self, file_path: str) -> Iterator[Chunk]:
+        in_cue_text = False
+        # The byte order mark many subtitle tools write stays on the first line,
+        # which is never cue text, so the copy keeps it
+        with open(file_path, 'r', encoding=self.encoding, newline='') as source:
+            for line in source:
+                body = line.rstrip("\r\n")
+                if not body.strip():
+                    in_cue_text = False
+                    yield line, False
+                elif in_cue_text:
+                    yield body, is_translatable(body)
+                    yield line[len(body):], False
+                else:
+                    in_cue_text = TIMING_SEPARATOR in body
+                    yield line, False
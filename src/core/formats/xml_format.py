@@ -0,0 +1,147 @@
+"""
+XML format, tokenized incrementally with expat.
+
+Character data is reported through its own handler and everything else
+(tags, comments, processing instructions, the doctype) reaches the default
+handler as the original markup, so the copy keeps the source byte for byte
+outside translated text nodes. Expat reports line breaks in character data
+as \n; they are written back with the line ending of the source. CDATA sections are copied untranslated, as
+is the text of style and script elements and of elements marked
+``translate="no"`` (or ``its:translate="no"``), which their descendants
+inherit. Inside ``xml:space="preserve"`` the whitespace around a text node
+is kept out of the segment, so the backend cannot change it.
+
+XLIFF is not handled here: its translations belong in ``<target>`` rather
+than in place of ``<source>``.
+"""
+
+import re
+from collections.abc import Iterator
+from xml.parsers import expat
+from xml.sax.saxutils import escape
+from src.core.formats.file_format import Chunk, StreamingFormat, is_translatable
+
+READ_BLOCK_SIZE = 64 * 1024
+
+# Elements whose text content is never translated, by local name
+UNTRANSLATED_ELEMENTS = frozenset({"style", "script"})
+
+_START_TAG_RE = re.compile(r"<([^\s/>!?]+)")
+_ATTRIBUTE_RE = re.compile(r"([^\s=/>]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)')")
+_SURROUNDING_SPACE_RE = re.compile(r"^(\s*)(.*?)(\s*)$", re.DOTALL)
+
+
+def _local_name(name: str) -> str:
+    return name.rpartition(":")[2]
+
+
+def _line_ending(block: bytes) -> str:
+    end = block.find(b"\n")
+    return "\r\n" if end > 0 and block[end - 1:end] == b"\r" else "\n"
+
+
+class _ChunkCollector:
+    def __init__(self, newline: str = "\n") -> None:
+        self.newline = newline
+        self.chunks: list[Chunk] = []
+        self._text: list[str] = []
+        self._in_cdata = False
+        # (translate, preserve space) of every open element, inherited from its parent
+        self._context: list[tuple[bool, bool]] = [(True, False)]
+
+    def flush_text(self) -> None:
+        if self._text:
+            text = "".join(self._text)
+            self._text.clear()
+            translate, preserve = self._context[-1]
+            if not translate or not is_translatable(text):
+                self.chunks.append((escape(text), False))
+            elif preserve:
+                match = _SURROUNDING_SPACE_RE.match(text)
+                leading, segment, trailing = match.groups() if match else ("", text, "")
+                if leading:
+                    self.chunks.append((leading, False))
+                self.chunks.append((segment, True))
+                if trailing:
+                    self.chunks.append((trailing, False))
+            else:
+                self.chunks.append((text, True))
+
+    def character_data(self, data: str) -> None:
+        if self.newline != "\n":
+            data = data.replace("\n", self.newline)
+        if self._in_cdata:
+            self.chunks.append((data, False))
+        else:
+            self._text.append(data)
+
+    def markup(self, data: str) -> None:
+        self.flush_text()
+        self.chunks.append((data, False))
+        if data.startswith("</"):
+            if len(self._context) > 1:
+                self._context.pop()
+            return
+        start = _START_TAG_RE.match(data)
+        if start and not data.endswith("/>"):
+            self._context.append(self._element_context(start.group(1), data))
+
+    def _element_context(self, name: str, tag: str) -> tuple[bool, bool]:
+        translate, preserve = self._context[-1]
+        if _local_name(name) in UNTRANSLATED_ELEMENTS:
+            translate = False
+        for attribute, double_quoted, single_quoted in _ATTRIBUTE_RE.findall(tag):
+            value = (double_quoted or single_quoted).strip()
+            if attribute == "xml:space":
+                preserve = value == "preserve"
+            elif _local_name(attribute) == "translate" and value in ("yes", "no"):
+                translate = value == "yes"
+        return translate, preserve
+
+    def xml_declaration(self, version: str, encoding: str | None, standalone: int) -> None:
+        # The copy is always written as UTF-8, whatever the source declared
+        declaration = f'<?xml version="{version}" encoding="UTF-8"'
+        if standalone != -1:
+            declaration += f' standalone="{"yes" if standalone else "no"}"'
+        self.chunks.append((declaration + "?>", False))
+
+    def start_cdata(self) -> None:
+        self.markup("<![CDATA[")
+        self._in_cdata = True
+
+    def end_cdata(self) -> None:
+        self._in_cdata = False
+        self.chunks.append(("]]>", False))
+
+
+class XmlFormat(StreamingFormat):
+    name = "xml"
+    suffixes = ('.xml', '.svg')
+
+    def iter_chunks(self, file_path: str) -> Iterator[Chunk]:
+        with open(file_path, 'rb') as source:
+            block = source.read(READ_BLOCK_SIZE)
+            collector = _ChunkCollector(_line_ending(block))
+            parser = self._create_parser(collector)
+            while block:
+                parser.Parse(block, False)
+                yield from collector.chunks
+                collector.chunks.clear()
+                block = source.read(READ_BLOCK_SIZE)
+        parser.Parse(b"", True)
+        collector.flush_text()
+        yield from collector.chunks
+
+    @staticmethod
+    def _create_parser(collector: _ChunkCollector) -> expat.XMLParserType:
+        parser = expat.ParserCreate()
+        parser.buffer_text = True
+        parser.CharacterDataHandler = collector.character_data
+        parser.DefaultHandler = collector.markup
+        parser.XmlDeclHandler = collector.xml_declaration
+        parser.StartCdataSectionHandler = collector.start_cdata
+        parser.EndCdataSectionHandler = collector.end_cdata
+        return parser
+
+    def escape(self, text: str) -> str:
+        return escape(text)
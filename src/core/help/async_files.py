@@ -0,0 +1,100 @@
+"""
+Async helpers for blocking file I/O.
+
+pdfplumber, python-docx and FPDF are blocking libraries, so these helpers run
+them on a small bounded thread pool and can be awaited from an event loop.
+Unlike read_files and write_files, they never hide failures: problems are
+raised as FileReadError or FileWriteError (see help.file_errors) with the
+original exception as the cause.
+"""
+
+import asyncio
+import os
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, TypeVar
+from src.config.settings import get_io_workers
+from src.core.formats.format_registry import get_format
+from src.core.help.file_errors import FileReadError, FileWriteError
+from src.core.help.segment_store import SegmentStore
+
+T = TypeVar("T")
+
+
+_io_executor: Optional[ThreadPoolExecutor] = None
+_io_executor_lock = threading.Lock()
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is None:
+            _io_executor = ThreadPoolExecutor(max_workers=get_io_workers(), thread_name_prefix="file-io")
+        return _io_executor
+
+
+async def run_blocking_io(function: Callable[..., T], *args: object) -> T:
+    """Run a blocking file operation on the I/O pool."""
+    return await asyncio.get_running_loop().run_in_executor(_get_io_executor(), function, *args)
+
+
+def _read_lines(file_path: str) -> list[str]:
+    from src.core.help.read_files import LINE_READERS
+    reader = LINE_READERS.get(os.path.splitext(file_path)[1].lower())
+    if reader is None:
+        raise FileReadError(file_path, f"Unsupported file format. Please use {', '.join(LINE_READERS)} files")
+    try:
+        return [line for line in (raw.strip() for raw in reader(file_path)) if line]
+    except Exception as e:
+        raise FileReadError(file_path, f"Error reading file ({e})") from e
+
+
+def _save_lines(paragraphs: list[str], output_path: str, unicode_font: bool) -> None:
+    from src.core.help.write_files import SAVERS, save_pdf_file
+    suffix = os.path.splitext(output_path)[1].lower()
+    saver = SAVERS.get(suffix)
+    if saver is None:
+        raise FileWriteError(output_path, f"Unsupported file format. Please use {', '.join(SAVERS)} files")
+    try:
+        if suffix == '.pdf':
+            save_pdf_file(paragraphs, output_path, unicode_font)
+        else:
+            saver(paragraphs, output_path)
+    except Exception as e:
+        raise FileWriteError(output_path, f"Error writing to file ({e})") from e
+
+
+def _read_segments(file_path: str) -> SegmentStore:
+    try:
+        file_format = get_format(file_path)
+    except ValueError as e:
+        raise FileReadError(file_path, str(e).rstrip(".")) from e
+    return file_format.read_segments(file_path)
+
+
+def _write_segments(file_path: str, translations: Iterable[str], output_path: str, out_of_core: bool) -> None:
+    error = get_format(file_path).write(file_path, translations, output_path, out_of_core=out_of_core)
+    if error:
+        raise FileWriteError(output_path, error)
+
+
+async def read_file_async(file_path: str) -> list[str]:
+    """Non-empty, stripped lines of a .pdf, .docx or .txt file."""
+    return await run_blocking_io(_read_lines, file_path)
+
+
+async def write_file_async(paragraphs: list[str], output_path: str, unicode_font: bool = False) -> None:
+    """Write paragraphs as a .pdf, .docx or .txt file, chosen by the suffix of output_path."""
+    await run_blocking_io(_save_lines, paragraphs, output_path, unicode_font)
+
+
+async def read_segments_async(file_path: str) -> SegmentStore:
+    """Segments of a file in any registered format; the caller closes the store."""
+    return await run_blocking_io(_read_segments, file_path)
+
+
+async def write_segments_async(file_path: str, translations: Iterable[str], output_path: str,
+                               out_of_core: bool = False) -> None:
+    """Write the translated copy of file_path with its format's writer."""
+    await run_blocking_io(_write_segments, file_path, translations, output_path, out_of_core)
@@ -0,0 +1,22 @@
+"""
+Errors raised when a file cannot be read or written.
+
+Kept apart from async_files so the format plugins can raise them without
+importing the I/O pool.
+"""
+
+
+class FileIOError(Exception):
+    """A file could not be read or written."""
+
+    def __init__(self, file_path: str, message: str) -> None:
+        super().__init__(f"{message}: {file_path}")
+        self.file_path = file_path
+
+
+class FileReadError(FileIOError):
+    """Reading or parsing a file failed."""
+
+
+class FileWriteError(FileIOError):
+    """Writing a file failed."""
@@ -0,0 +1,214 @@
+"""
+ARPAbet to IPA conversion for the supported English accents, plus a
+rule-based grapheme-to-phoneme fallback for words missing from the lexicon.
+"""
+
+from typing import Optional
+
+VOWELS: frozenset[str] = frozenset({
+    "AA", "AE", "AH", "AO", "AW", "AY", "EH", "ER", "EY", "IH", "IY", "OW", "OY", "UH", "UW",
+})
+
+CONSONANTS: dict[str, str] = {
+    "B": "b", "CH": "tʃ", "D": "d", "DH": "ð", "F": "f", "G": "ɡ", "HH": "h", "JH": "dʒ",
+    "K": "k", "L": "l", "M": "m", "N": "n", "NG": "ŋ", "P": "p", "R": "ɹ", "S": "s",
+    "SH": "ʃ", "T": "t", "TH": "θ", "V": "v", "W": "w", "Y": "j", "Z": "z", "ZH": "ʒ",
+}
+
+# Two-consonant onsets that carry the stress mark together with the following vowel
+_ONSET_CLUSTERS: frozenset[tuple[str, str]] = frozenset({
+    ("S", "T"), ("S", "P"), ("S", "K"), ("S", "M"), ("S", "N"), ("S", "L"), ("S", "W"),
+    ("T", "R"), ("D", "R"), ("P", "R"), ("B", "R"), ("K", "R"), ("G", "R"), ("F", "R"), ("TH", "R"),
+    ("P", "L"), ("B", "L"), ("K", "L"), ("G", "L"), ("F", "L"), ("S", "L"),
+    ("K", "W"), ("T", "W"), ("D", "W"),
+})
+
+# Words of the BATH lexical set, pronounced with a long open vowel in RP
+_BATH_WORDS: frozenset[str] = frozenset({
+    "after", "answer", "ask", "asked", "aunt", "banana", "bath", "can't", "castle", "class",
+    "dance", "demand", "example", "fast", "glass", "grass", "half", "last", "laugh", "master",
+    "pass", "past", "path", "plant", "rather", "staff",
+})
+
+
+class AccentSpec:
+    """Vowel inventory and rhoticity of an English accent."""
+
+    __slots__ = ("code", "name", "rhotic", "stressed", "unstressed", "before_r", "lot", "bath")
+
+    def __init__(self, code: str, name: str, rhotic: bool, stressed: dict[str, str],
+                 unstressed: dict[str, str], before_r: dict[str, str],
+                 lot: Optional[str] = None, bath: Optional[str] = None) -> None:
+        self.code = code
+        self.name = name
+        self.rhotic = rhotic
+        self.stressed = stressed
+        self.unstressed = unstressed
+        self.before_r = before_r
+        self.lot = lot
+        self.bath = bath
+
+
+ACCENTS: dict[str, AccentSpec] = {
+    "rp": AccentSpec(
+        "rp", "Received Pronunciation", rhotic=False,
+        stressed={"AA": "ɑː", "AE": "æ", "AH": "ʌ", "AO": "ɔː", "AW": "aʊ", "AY": "aɪ", "EH": "e",
+                  "ER": "ɜː", "EY": "eɪ", "IH": "ɪ", "IY": "iː", "OW": "əʊ", "OY": "ɔɪ", "UH": "ʊ", "UW": "uː"},
+        unstressed={"AH": "ə", "ER": "ə", "IY": "i", "UW": "u"},
+        before_r={"AA": "ɑː", "AO": "ɔː", "IH": "ɪə", "IY": "ɪə", "EH": "eə", "EY": "eə",
+                  "UH": "ʊə", "UW": "ʊə", "AY": "aɪə", "AW": "aʊə"},
+        lot="ɒ", bath="ɑː",
+    ),
+    "ga": AccentSpec(
+        "ga", "General American", rhotic=True,
+        stressed={"AA": "ɑ", "AE": "æ", "AH": "ʌ", "AO": "ɔ", "AW": "aʊ", "AY": "aɪ", "EH": "ɛ",
+                  "ER": "ɝ", "EY": "eɪ", "IH": "ɪ", "IY": "i", "OW": "oʊ", "OY": "ɔɪ", "UH": "ʊ", "UW": "u"},
+        unstressed={"AH": "ə", "ER": "ɚ"},
+        before_r={},
+    ),
+    "au": AccentSpec(
+        "au", "General Australian", rhotic=False,
+        stressed={"AA": "aː", "AE": "æ", "AH": "ɐ", "AO": "oː", "AW": "æɔ", "AY": "ɑe", "EH": "e",
+                  "ER": "ɜː", "EY": "æɪ", "IH": "ɪ", "IY": "iː", "OW": "əʉ", "OY": "oɪ", "UH": "ʊ", "UW": "ʉː"},
+        unstressed={"AH": "ə", "ER": "ə", "IY": "i", "UW": "ʉ"},
+        before_r={"AA": "aː", "AO": "oː", "IH": "ɪə", "IY": "ɪə", "EH": "eː", "EY": "eː",
+                  "UH": "ʊə", "UW": "ʉə", "AY": "ɑeə", "AW": "æɔə"},
+        lot="ɔ", bath="ɐː",
+    ),
+}
+
+
+def _split(phone: str) -> tuple[str, str]:
+    base = phone.rstrip("012")
+    return base, phone[len(base):]
+
+
+def _is_vowel(phone: Optional[str]) -> bool:
+    return phone is not None and _split(phone)[0] in VOWELS
+
+
+def arpabet_to_ipa(phones: list[str], accent: str, word: str = "") -> str:
+    """Convert ARPAbet phones to an IPA string for accent."""
+    spec = ACCENTS[accent]
+    word = word.lower()
+    vowel_count = sum(1 for phone in phones if _is_vowel(phone))
+    symbols: list[str] = []
+    stress_marks: dict[int, str] = {}
+    for index, phone in enumerate(phones):
+        base, stress = _split(phone)
+        following = phones[index + 1] if index + 1 < len(phones) else None
+        if base not in VOWELS:
+            if base == "R" and not spec.rhotic and not _is_vowel(following):
+                continue  # non-rhotic accents only pronounce R before a vowel
+            symbols.append(CONSONANTS.get(base, base.lower()))
+            continue
+
+        r_follows = following is not None and _split(following)[0] == "R"
+        r_dropped = r_follows and not spec.rhotic and not _is_vowel(
+            phones[index + 2] if index + 2 < len(phones) else None)
+        if stress == "0" and base in spec.unstressed:
+            symbol = spec.unstressed[base]
+        elif r_dropped and base in spec.before_r:
+            symbol = spec.before_r[base]
+        elif base == "AA" and spec.lot and not r_follows and ("o" in word or _preceded_by_w(phones, index)):
+            symbol = spec.lot
+        elif base == "AE" and spec.bath and word in _BATH_WORDS:
+            symbol = spec.bath
+        else:
+            symbol = spec.stressed[base]
+
+        if vowel_count > 1 and stress in ("1", "2"):
+            stress_marks[_onset_start(phones, index, len(symbols))] = "ˈ" if stress == "1" else "ˌ"
+        symbols.append(symbol)
+
+    for position in sorted(stress_marks, reverse=True):
+        symbols.insert(position, stress_marks[position])
+    return "".join(symbols)
+
+
+def _preceded_by_w(phones: list[str], index: int) -> bool:
+    return index > 0 and _split(phones[index - 1])[0] == "W"
+
+
+def _onset_start(phones: list[str], vowel_index: int, symbol_index: int) -> int:
+    """Position in the output symbols where the syllable holding vowel_index starts."""
+    previous = [_split(phone)[0] for phone in phones[max(0, vowel_index - 2):vowel_index]]
+    if len(previous) == 2 and tuple(previous) in _ONSET_CLUSTERS and previous[0] not in VOWELS:
+        return max(0, symbol_index - 2)
+    if previous and previous[-1] not in VOWELS:
+        return max(0, symbol_index - 1)
+    return symbol_index
+
+
+# Grapheme rules tried longest first; vowels get their stress digit afterwards
+_GRAPHEMES: dict[str, str] = {
+    "tion": "SH AH N", "sion": "ZH AH N", "ture": "CH ER", "ough": "AO", "augh": "AO",
+    "eigh": "EY", "igh": "AY", "tch": "CH", "dge": "JH", "sch": "S K",
+    "ch": "CH", "sh": "SH", "th": "TH", "ph": "F", "wh": "W", "ck": "K", "ng": "NG", "qu": "K W",
+    "ee": "IY", "ea": "IY", "ie": "IY", "oo": "UW", "ou": "AW", "ow": "OW", "oa": "OW", "oe": "OW",
+    "ai": "EY", "ay": "EY", "ei": "EY", "ey": "IY", "oi": "OY", "oy": "OY", "au": "AO", "aw": "AO",
+    "ew": "UW", "ue": "UW", "ui": "UW", "ar": "AA R", "or": "AO R", "er": "ER", "ir": "ER", "ur": "ER",
+    "a": "AE", "b": "B", "c": "K", "d": "D", "e": "EH", "f": "F", "g": "G", "h": "HH", "i": "IH",
+    "j": "JH", "k": "K", "l": "L", "m": "M", "n": "N", "o": "AA", "p": "P", "q": "K", "r": "R",
+    "s": "S", "t": "T", "u": "AH", "v": "V", "w": "W", "x": "K S", "z": "Z",
+}
+_MAX_GRAPHEME = max(len(grapheme) for grapheme in _GRAPHEMES)
+_LONG_VOWELS: dict[str, str] = {"a": "EY", "e": "IY", "i": "AY", "o": "OW", "u": "UW"}
+_VOICED: frozenset[str] = frozenset({"B", "D", "G", "V", "DH", "Z", "ZH", "JH", "M", "N", "NG", "L", "R"})
+
+
+def guess_phones(word: str) -> list[str]:
+    """Approximate ARPAbet phones for an out-of-vocabulary English word."""
+    letters = "".join(char for char in word.lower() if char.isalpha())
+    if not letters:
+        return []
+    # Silent final e that lengthens the previous vowel ("make", "line", "home")
+    magic_e = len(letters) > 3 and letters.endswith("e") and letters[-2] not in "aeiouy" \
+        and letters[-3] in _LONG_VOWELS
+    if len(letters) > 2 and letters.endswith("e") and letters[-2] not in "aeiouy":
+        letters = letters[:-1]
+
+    phones: list[str] = []
+    index = 0
+    while index < len(letters):
+        if index > 0 and letters[index] == letters[index - 1] and letters[index] not in "aeiou":
+            index += 1  # double consonants are pronounced once
+            continue
+        char = letters[index]
+        following = letters[index + 1] if index + 1 < len(letters) else ""
+        if magic_e and index == len(letters) - 2:
+            phones.append(_LONG_VOWELS[char])
+            index += 1
+            continue
+        if char == "y":
+            phones.append("Y" if index == 0 else ("IY" if index == len(letters) - 1 else "IH"))
+            index += 1
+            continue
+        if char == "c" and following in ("e", "i", "y"):
+            phones.append("S")
+            index += 1
+            continue
+        if char == "s" and 0 < index < len(letters) - 1 and letters[index - 1] in "aeiou" and following in "aeiou":
+            phones.append("Z")
+            index += 1
+            continue
+        if index == 0 and letters[:2] in ("kn", "wr", "gn"):
+            index += 1
+            continue
+        for size in range(min(_MAX_GRAPHEME, len(letters) - index), 0, -1):
+            grapheme = letters[index:index + size]
+            if grapheme in _GRAPHEMES:
+                phones.extend(_GRAPHEMES[grapheme].split())
+                index += size
+                break
+        else:
+            index += 1
+
+    if len(phones) > 1 and phones[-1] == "S" and phones[-2] in _VOICED and not letters.endswith("ss"):
+        phones[-1] = "Z"
+    stressed = False
+    for position, phone in enumerate(phones):
+        if phone in VOWELS:
+            phones[position] = phone + ("0" if stressed else "1")
+            stressed = True
+    return phones
@@ -0,0 +1,181 @@
+"""
+Opt-in profiling of file translation jobs.
+
+Enabled with TRANSLATOR_PROFILE (or ``app.py --profile``). A JobProfiler wraps
+one job and writes, to TRANSLATOR_PROFILE_DIR:
+
+- ``<file>-<format>-<n>seg-<time>.prof``: cProfile statistics of the job
+  thread, for pstats or snakeviz ("cprofile" mode).
+- ``<file>-<format>-<n>seg-<time>.collapsed``: stacks sampled from the job
+  thread and from the backend worker threads while they work for it (see
+  working_for), one ``frame;frame;... count`` line per stack, for
+  flamegraph.pl or speedscope ("sample" mode). Idle pool threads and work
+  done for other jobs are left out.
+
+"all" writes both. When profiling is off, profile_job returns a nullcontext,
+so jobs pay nothing for the hook.
+"""
+
+import cProfile
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from types import FrameType, TracebackType
+from typing import Optional
+from src.config.settings import get_profile_dir, get_profile_mode
+
+SAMPLE_INTERVAL = 0.005
+# Characters kept out of file names and of the collapsed-stack root frame
+_UNSAFE_RE = re.compile(r"[^\w.-]+")
+
+
+# Pool thread -> thread of the job it is currently working for
+_working_for: dict[int, int] = {}
+# Stack samplers currently running; only they read _working_for
+_running_samplers = 0
+_running_samplers_lock = threading.Lock()
+
+
+def is_sampling() -> bool:
+    """Whether a stack sampler is running, i.e. whether working_for is worth entering."""
+    return _running_samplers > 0
+
+
+@contextmanager
+def working_for(owner: int) -> Iterator[None]:
+    """Attribute the work done by the current thread to the owner thread while profiling it."""
+    ident = threading.get_ident()
+    _working_for[ident] = owner
+    try:
+        yield
+    finally:
+        _working_for.pop(ident, None)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Samples the stacks of selected threads, and of the threads working for them, and counts them."""
+
+    def __init__(self, thread_ids: set[int], interval: float = SAMPLE_INTERVAL) -> None:
+        self.thread_ids = thread_ids
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        global _running_samplers
+        with _running_samplers_lock:
+            _running_samplers += 1
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        global _running_samplers
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            with _running_samplers_lock:
+                _running_samplers -= 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident in self.thread_ids or _working_for.get(ident) in self.thread_ids:
+                    self._record(names.get(ident, ""), frame)
+            self.samples += 1
+
+    def _record(self, thread_name: str, frame: Optional[FrameType]) -> None:
+        labels: list[str] = []
+        while frame is not None:
+            labels.append(_frame_label(frame))
+            frame = frame.f_back
+        # Pool threads are numbered; merging them keeps one tower per role in the flamegraph
+        labels.append(thread_name.rstrip("_0123456789") or "thread")
+        self.stacks[";".join(reversed(labels))] += 1
+
+    def write_collapsed(self, path: str, root: str) -> None:
+        with open(path, 'w', encoding='utf-8') as output:
+            for stack, count in self.stacks.most_common():
+                output.write(f"{root};{stack} {count}\n")
+
+
+class JobProfiler:
+    """Context manager that profiles the current thread, and the backend work done for it, for one job."""
+
+    def __init__(self, file_path: str, mode: str = "all", output_dir: Optional[str] = None,
+                 interval: float = SAMPLE_INTERVAL) -> None:
+        self.file_path = file_path
+        self.mode = mode
+        self.output_dir = output_dir or get_profile_dir()
+        self.interval = interval
+        self.segments = 0
+        self.paths: list[str] = []
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[StackSampler] = None
+        self._started = 0.0
+
+    def __enter__(self) -> "JobProfiler":
+        self._started = time.time()
+        if self.mode in ("sample", "all"):
+            self._sampler = StackSampler({threading.get_ident()}, interval=self.interval)
+            self._sampler.start()
+        if self.mode in ("cprofile", "all"):
+            self._profile = cProfile.Profile()
+            try:
+                self._profile.enable()
+            except ValueError as e:
+                # Python 3.12+ allows one active cProfile at a time; concurrent jobs keep only the sampler
+                print(f"cProfile unavailable for {self.file_path}: {e}", file=sys.stderr)
+                self._profile = None
+        return self
+
+    def __exit__(self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        if self._profile is not None:
+            self._profile.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+        try:
+            self.save()
+        except OSError as e:
+            print(f"Could not write profile for {self.file_path}: {e}", file=sys.stderr)
+
+    @property
+    def label(self) -> str:
+        """File name, format and segment count, used for the output names and the flamegraph root."""
+        stem, suffix = os.path.splitext(os.path.basename(self.file_path))
+        stem = _UNSAFE_RE.sub("_", stem)
+        return f"{stem}-{suffix.lstrip('.').lower() or 'none'}-{self.segments}seg"
+
+    def save(self) -> list[str]:
+        os.makedirs(self.output_dir, exist_ok=True)
+        started = time.strftime('%Y%m%d-%H%M%S', time.localtime(self._started))
+        base = os.path.join(self.output_dir, f"{self.label}-{started}")
+        if self._profile is not None:
+            self._profile.dump_stats(f"{base}.prof")
+            self.paths.append(f"{base}.prof")
+        if self._sampler is not None:
+            self._sampler.write_collapsed(f"{base}.collapsed", self.label)
+            self.paths.append(f"{base}.collapsed")
+        return self.paths
+
+
+def profile_job(file_path: str, mode: Optional[str] = None) -> AbstractContextManager[Optional[JobProfiler]]:
+    """JobProfiler for file_path when profiling is enabled (mode or TRANSLATOR_PROFILE), else a nullcontext."""
+    mode = get_profile_mode() if mode is None else mode
+    if not mode:
+        return nullcontext()
+    return JobProfiler(file_path, mode)
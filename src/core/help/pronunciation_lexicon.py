@@ -0,0 +1,166 @@
+"""
+Compact pronunciation lexicon stored as a sorted, memory-mapped binary file.
+
+Binary layout (little endian):
+    magic            8 bytes  b"IPALEX01"
+    count            uint32   number of entries
+    offsets          uint32 * (count + 1), relative to the start of the data section
+    data             entries sorted by word bytes, each ``WORD\\x00PHONES``
+
+Opening the file only maps it into memory, and lookups are a binary search
+over the offset table, so startup cost does not grow with the lexicon size.
+The compiled file is kept next to its source, or in the user cache directory
+when the source sits in a read-only install.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from typing import BinaryIO, Optional
+from src.config.settings import get_cache_dir
+
+MAGIC = b"IPALEX01"
+_HEADER = struct.Struct("<8sI")
+_OFFSET = struct.Struct("<I")
+
+
+def parse_cmudict(source_path: str) -> dict[str, str]:
+    """Parse a CMUdict-style text file into {WORD: "PH1 PH2 ..."}, keeping the first variant."""
+    entries: dict[str, str] = {}
+    with open(source_path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if not line.strip() or line.startswith(";;;"):
+                continue
+            parts = line.split(None, 1)
+            if len(parts) != 2:
+                continue
+            word, phones = parts[0].upper(), " ".join(parts[1].split())
+            if word.endswith(")") and "(" in word:
+                continue  # alternative pronunciations such as WORD(2)
+            entries.setdefault(word, phones)
+    return entries
+
+
+def encode_lexicon(entries: dict[str, str]) -> bytes:
+    """Encode entries in the sorted binary layout."""
+    encoded = sorted((word.upper().encode('utf-8'), phones.encode('ascii')) for word, phones in entries.items())
+    offsets: list[int] = [0]
+    data = bytearray()
+    for word, phones in encoded:
+        data += word + b"\x00" + phones
+        offsets.append(len(data))
+    return _HEADER.pack(MAGIC, len(encoded)) + struct.pack(f"<{len(offsets)}I", *offsets) + bytes(data)
+
+
+def compile_lexicon(entries: dict[str, str], binary_path: str) -> None:
+    """Write entries to binary_path in the sorted binary layout."""
+    temp_path = f"{binary_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(encode_lexicon(entries))
+        os.replace(temp_path, binary_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+class PronunciationLexicon:
+    """Read-only view over a compiled lexicon file."""
+
+    __slots__ = ("path", "_file", "_map", "_count", "_data_start")
+
+    def __init__(self, binary_path: str) -> None:
+        self.path = binary_path
+        self._file: Optional[BinaryIO] = open(binary_path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Empty lexicon file: {binary_path}")
+        self._read_header()
+
+    @classmethod
+    def from_entries(cls, entries: dict[str, str]) -> "PronunciationLexicon":
+        """Lexicon compiled into anonymous memory, for when no file can be written."""
+        data = encode_lexicon(entries)
+        lexicon = cls.__new__(cls)
+        lexicon.path = ""
+        lexicon._file = None
+        lexicon._map = mmap.mmap(-1, len(data))
+        lexicon._map.write(data)
+        lexicon._read_header()
+        return lexicon
+
+    def _read_header(self) -> None:
+        magic, self._count = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Invalid lexicon file: {self.path}")
+        self._data_start = _HEADER.size + _OFFSET.size * (self._count + 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, word: str) -> bool:
+        return self.lookup(word) is not None
+
+    def _entry(self, index: int) -> tuple[bytes, bytes]:
+        position = _HEADER.size + _OFFSET.size * index
+        start = _OFFSET.unpack_from(self._map, position)[0] + self._data_start
+        end = _OFFSET.unpack_from(self._map, position + _OFFSET.size)[0] + self._data_start
+        word, _, phones = self._map[start:end].partition(b"\x00")
+        return word, phones
+
+    def lookup(self, word: str) -> Optional[list[str]]:
+        """Return the ARPAbet phones of word, or None when it is not in the lexicon."""
+        key = word.upper().encode('utf-8')
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            current, phones = self._entry(middle)
+            if current < key:
+                low = middle + 1
+            elif current > key:
+                high = middle
+            else:
+                return phones.decode('ascii').split()
+        return None
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+        if self._file is not None:
+            self._file.close()
+
+
+def _cache_path(source_path: str) -> str:
+    # Named after the absolute source path, so lexicons with the same file name do not collide
+    digest = hashlib.sha1(os.path.abspath(source_path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(get_cache_dir(), "lexicons", f"{os.path.basename(source_path)}.{digest}.bin")
+
+
+def _is_current(binary_path: str, source_path: str) -> bool:
+    return os.path.isfile(binary_path) and os.path.getmtime(binary_path) >= os.path.getmtime(source_path)
+
+
+def open_lexicon(source_path: str) -> PronunciationLexicon:
+    """Open the compiled lexicon for source_path, compiling it first if missing or stale.
+
+    When neither the source directory nor the user cache directory can be written,
+    the lexicon is compiled in memory instead.
+    """
+    entries: Optional[dict[str, str]] = None
+    for binary_path in (source_path + ".bin", _cache_path(source_path)):
+        if _is_current(binary_path, source_path):
+            return PronunciationLexicon(binary_path)
+        if entries is None:
+            entries = parse_cmudict(source_path)
+        try:
+            os.makedirs(os.path.dirname(binary_path) or ".", exist_ok=True)
+            compile_lexicon(entries, binary_path)
+        except OSError:
+            continue  # read-only location, try the next one
+        return PronunciationLexicon(binary_path)
+    return PronunciationLexicon.from_entries(entries or {})
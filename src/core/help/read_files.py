@@ -1,19 +1,35 @@
+from collections.abc import Callable, Iterator
 import pdfplumber as PDF
 import docx
 import os
 
+def iter_pdf_lines(file_path: str) -> Iterator[str]:
+        with PDF.open(file_path) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    yield from page_text.split('\n')
+                page.flush_cache()
+
+
+def iter_docx_lines(file_path: str) -> Iterator[str]:
+        doc = docx.Document(file_path)
+        for para in doc.paragraphs:
+            yield para.text
+
+
+def iter_txt_lines(file_path: str) -> Iterator[str]:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            yield from file
+
+
 def read_pdf_file(file_path: str) -> list[str]:
         text: list[str] = []
         try:
-            with PDF.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        paragraphs = page_text.split('\n')
-                        for para in paragraphs:
-                            para = para.strip()
-                            if para:
-                                text.append(para)
+            for para in iter_pdf_lines(file_path):
+                para = para.strip()
+                if para:
+                    text.append(para)
         except Exception:
             # On error, return empty list to maintain a consistent return type
             return []
@@ -23,8 +39,7 @@ def read_pdf_file(file_path: str) -> list[str]:
 def read_docx_file(file_path: str) -> list[str]:
         text: list[str] = []
         try:
-            doc = docx.Document(file_path)
-            text = [para.text for para in doc.paragraphs if para.text.strip()]
+            text = [para for para in iter_docx_lines(file_path) if para.strip()]
         except Exception:
             return []
         return text
@@ -37,3 +52,17 @@ def read_txt_file(file_path: str) -> list[str]:
         except FileNotFoundError:
             return []
         return text
+
+# Reader for each supported file suffix
+READERS: dict[str, Callable[[str], list[str]]] = {
+    '.pdf': read_pdf_file,
+    '.docx': read_docx_file,
+    '.txt': read_txt_file,
+}
+
+# Streaming line reader for each supported file suffix
+LINE_READERS: dict[str, Callable[[str], Iterator[str]]] = {
+    '.pdf': iter_pdf_lines,
+    '.docx': iter_docx_lines,
+    '.txt': iter_txt_lines,
+}
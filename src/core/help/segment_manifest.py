@@ -0,0 +1,76 @@
+"""
+Segment manifest used for incremental re-translation.
+
+The manifest is stored next to the translated output and maps the hash of
+every source segment to its translation, so an edited document only sends
+new or changed segments to the backend on the next run.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Sequence
+from typing import Optional
+
+MANIFEST_VERSION = 1
+
+
+def segment_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def manifest_path_for(output_path: str) -> str:
+    return f"{output_path}.segments.json"
+
+
+class SegmentManifest:
+    """Translations of the previous run keyed by source segment hash."""
+
+    def __init__(self, path: str, entry_lang: str, output_lang: str, backend: str,
+                 segments: Optional[dict[str, str]] = None) -> None:
+        self.path = path
+        self.entry_lang = entry_lang
+        self.output_lang = output_lang
+        self.backend = backend
+        self.segments: dict[str, str] = segments or {}
+
+    @classmethod
+    def load(cls, path: str, entry_lang: str, output_lang: str, backend: str) -> "SegmentManifest":
+        """Load the manifest at path, or an empty one if it is missing, corrupt or for other settings."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return cls(path, entry_lang, output_lang, backend)
+        if (data.get("version") != MANIFEST_VERSION or data.get("entry_lang") != entry_lang
+                or data.get("output_lang") != output_lang or data.get("backend") != backend
+                or not isinstance(data.get("segments"), dict)):
+            return cls(path, entry_lang, output_lang, backend)
+        return cls(path, entry_lang, output_lang, backend, data["segments"])
+
+    def diff(self, segments: Sequence[str]) -> tuple[list[Optional[str]], list[int]]:
+        """Return the known translation of each segment (None if unknown) and the unknown indices."""
+        known: list[Optional[str]] = [self.segments.get(segment_hash(segment)) for segment in segments]
+        missing: list[int] = [index for index, translation in enumerate(known) if translation is None]
+        return known, missing
+
+    @staticmethod
+    def entries(segments: Sequence[str], translations: Sequence[str]) -> dict[str, str]:
+        return {segment_hash(segment): translation for segment, translation in zip(segments, translations)}
+
+    def replace(self, segments: Sequence[str], translations: Sequence[str]) -> None:
+        """Keep only the current segments, dropping those removed from the document."""
+        self.segments = self.entries(segments, translations)
+
+    def save(self) -> None:
+        data = {
+            "version": MANIFEST_VERSION,
+            "entry_lang": self.entry_lang,
+            "output_lang": self.output_lang,
+            "backend": self.backend,
+            "segments": self.segments,
+        }
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
@@ -0,0 +1,124 @@
+"""
+Compact store for the text segments of a document.
+
+All segments live in one contiguous UTF-8 buffer with an ``array`` of start
+offsets, instead of one Python ``str`` object per line. Once the buffer grows
+past the spill threshold it is moved to a temporary file and read back
+through ``mmap``, so very large documents do not have to fit in memory.
+"""
+
+import mmap
+import tempfile
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO, Optional
+from src.config.settings import get_segment_spill_bytes
+
+
+class SegmentStore:
+    """Append-only sequence of text segments backed by a single UTF-8 buffer."""
+
+    __slots__ = ("spill_threshold", "_offsets", "_buffer", "_file", "_map", "_size")
+
+    def __init__(self, segments: Optional[Iterable[str]] = None, spill_threshold: Optional[int] = None) -> None:
+        self.spill_threshold = get_segment_spill_bytes() if spill_threshold is None else spill_threshold
+        self._offsets = array('Q', [0])
+        self._buffer: Optional[bytearray] = bytearray()
+        self._file: Optional[BinaryIO] = None
+        self._map: Optional[mmap.mmap] = None
+        self._size = 0
+        if segments is not None:
+            self.extend(segments)
+
+    @property
+    def nbytes(self) -> int:
+        return self._size
+
+    @property
+    def spilled(self) -> bool:
+        return self._file is not None
+
+    def append(self, text: str) -> None:
+        data = text.encode('utf-8')
+        if self._buffer is not None:
+            self._buffer += data
+            if self.spill_threshold and len(self._buffer) > self.spill_threshold:
+                self._spill()
+        else:
+            assert self._file is not None
+            self._file.write(data)
+        self._size += len(data)
+        self._offsets.append(self._size)
+
+    def extend(self, segments: Iterable[str]) -> None:
+        for segment in segments:
+            self.append(segment)
+
+    def _spill(self) -> None:
+        assert self._buffer is not None
+        self._file = tempfile.TemporaryFile(prefix="segments-")
+        self._file.write(self._buffer)
+        self._buffer = None
+
+    def _data(self) -> memoryview:
+        if self._buffer is not None:
+            return memoryview(self._buffer)
+        assert self._file is not None
+        if self._map is None or len(self._map) < self._size:
+            self._file.flush()
+            # The previous map is left to the garbage collector, views into it may still be alive
+            self._map = mmap.mmap(self._file.fileno(), self._size, access=mmap.ACCESS_READ)
+        return memoryview(self._map)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def view(self, index: int) -> memoryview:
+        """Raw UTF-8 bytes of a segment, without copying."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("segment index out of range")
+        return self._data()[self._offsets[index]:self._offsets[index + 1]]
+
+    def __getitem__(self, index: int) -> str:
+        return str(self.view(index), 'utf-8')
+
+    def slice(self, start: int, stop: int) -> list[str]:
+        """Decode the segments in [start, stop) into a list, e.g. one batch for the backend."""
+        stop = min(stop, len(self))
+        data = self._data()
+        offsets = self._offsets
+        return [str(data[offsets[index]:offsets[index + 1]], 'utf-8') for index in range(start, stop)]
+
+    def __iter__(self) -> Iterator[str]:
+        data = self._data()
+        offsets = self._offsets
+        for index in range(len(self)):
+            yield str(data[offsets[index]:offsets[index + 1]], 'utf-8')
+
+    def iter_views(self) -> Iterator[memoryview]:
+        data = self._data()
+        offsets = self._offsets
+        for index in range(len(self)):
+            yield data[offsets[index]:offsets[index + 1]]
+
+    def close(self) -> None:
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass  # closed when the last view is released
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._buffer = bytearray()
+        self._offsets = array('Q', [0])
+        self._size = 0
+
+    def __enter__(self) -> "SegmentStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
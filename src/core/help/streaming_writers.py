@@ -0,0 +1,182 @@
+"""
+Out-of-core writers for DOCX and PDF output.
+
+python-docx and FPDF build the whole document in memory before saving. These
+writers instead stream paragraphs, usually read from a disk-backed
+SegmentStore, straight into the output file: the DOCX body is written as
+WordprocessingML into the zip entry as it is produced, and each PDF page is
+flushed as soon as it is full. Peak memory does not depend on document length.
+"""
+
+import zipfile
+import zlib
+from collections.abc import Iterable
+from typing import BinaryIO, Optional
+from xml.sax.saxutils import escape
+from src.core.help.text_process import clean_text
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+_PACKAGE_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+_DOCUMENT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"/>'
+)
+_DOCUMENT_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+)
+_DOCUMENT_END = (
+    '<w:sectPr><w:pgSz w:w="11906" w:h="16838"/>'
+    '<w:pgMar w:top="1440" w:right="1440" w:bottom="1440" w:left="1440" w:header="708" w:footer="708" w:gutter="0"/>'
+    '</w:sectPr></w:body></w:document>'
+)
+
+# Characters not allowed in XML 1.0 documents
+_XML_INVALID = dict.fromkeys(c for c in range(32) if c not in (9, 10, 13))
+
+
+def write_docx_file_streaming(paragraphs: Iterable[str], output_path: str) -> Optional[str]:
+    try:
+        with zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_DEFLATED) as package:
+            package.writestr("[Content_Types].xml", _CONTENT_TYPES)
+            package.writestr("_rels/.rels", _PACKAGE_RELS)
+            package.writestr("word/_rels/document.xml.rels", _DOCUMENT_RELS)
+            with package.open("word/document.xml", 'w', force_zip64=True) as document:
+                document.write(_DOCUMENT_START.encode('utf-8'))
+                for para in paragraphs:
+                    text = escape(para.translate(_XML_INVALID))
+                    document.write(f'<w:p><w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>'.encode('utf-8'))
+                document.write(_DOCUMENT_END.encode('utf-8'))
+    except Exception as e:
+        return f"Error writing to file: {e}"
+    return None
+
+
+# Helvetica glyph widths (1/1000 em) for ASCII 32..126, from the standard AFM metrics
+_HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+
+
+class StreamingPdfWriter:
+    """Minimal PDF writer that flushes every page to disk as soon as it is full."""
+
+    # A4 in points, margins close to FPDF's defaults
+    PAGE_WIDTH = 595.28
+    PAGE_HEIGHT = 841.89
+    MARGIN = 42.52
+
+    def __init__(self, output: BinaryIO, font_size: float = 12.0, leading: float = 16.0) -> None:
+        self.output = output
+        self.font_size = font_size
+        self.leading = leading
+        self.max_width = self.PAGE_WIDTH - 2 * self.MARGIN
+        self._offsets: dict[int, int] = {}
+        self._page_ids: list[int] = []
+        self._next_id = 4  # 1 catalog, 2 page tree, 3 font
+        self._lines: list[bytes] = []
+        self._lines_per_page = int((self.PAGE_HEIGHT - 2 * self.MARGIN) // leading)
+        self._position = 0
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+
+    def _write(self, data: bytes) -> None:
+        self.output.write(data)
+        self._position += len(data)
+
+    def _object(self, object_id: int, body: bytes) -> None:
+        self._offsets[object_id] = self._position
+        self._write(b"%d 0 obj\n" % object_id + body + b"\nendobj\n")
+
+    def _text_width(self, text: str) -> float:
+        width = sum(_HELVETICA_WIDTHS[ord(char) - 32] if 32 <= ord(char) <= 126 else 556 for char in text)
+        return width * self.font_size / 1000
+
+    def _wrap(self, text: str) -> list[str]:
+        lines: list[str] = []
+        current = ""
+        for word in text.split(" "):
+            candidate = f"{current} {word}" if current else word
+            if self._text_width(candidate) <= self.max_width or not current:
+                current = candidate
+            else:
+                lines.append(current)
+                current = word
+            while self._text_width(current) > self.max_width and len(current) > 1:
+                # A single word wider than the page is split by characters
+                cut = len(current)
+                while cut > 1 and self._text_width(current[:cut]) > self.max_width:
+                    cut -= 1
+                lines.append(current[:cut])
+                current = current[cut:]
+        lines.append(current)
+        return lines
+
+    def add_paragraph(self, text: str) -> None:
+        for line in self._wrap(text):
+            # Same replacement as the FPDF writer, so both outputs show '*' for unsupported characters
+            encoded = clean_text(line).encode('latin-1')
+            escaped = encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+            self._lines.append(escaped)
+            if len(self._lines) >= self._lines_per_page:
+                self._flush_page()
+
+    def _flush_page(self) -> None:
+        top = self.PAGE_HEIGHT - self.MARGIN - self.font_size
+        content = b"BT /F1 %.1f Tf %.2f TL %.2f %.2f Td\n" % (self.font_size, self.leading, self.MARGIN, top)
+        content += b"".join(b"(" + line + b") Tj T*\n" for line in self._lines) + b"ET"
+        compressed = zlib.compress(content)
+        stream_id, page_id = self._next_id, self._next_id + 1
+        self._next_id += 2
+        self._object(stream_id, b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(compressed)
+                     + compressed + b"\nendstream")
+        self._object(page_id, b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.2f %.2f] "
+                     b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+                     % (self.PAGE_WIDTH, self.PAGE_HEIGHT, stream_id))
+        self._page_ids.append(page_id)
+        self._lines = []
+
+    def close(self) -> None:
+        if self._lines or not self._page_ids:
+            self._flush_page()
+        kids = b" ".join(b"%d 0 R" % page_id for page_id in self._page_ids)
+        self._object(2, b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(self._page_ids))
+        self._object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        xref_position = self._position
+        count = self._next_id
+        self._write(b"xref\n0 %d\n0000000000 65535 f \n" % count)
+        for object_id in range(1, count):
+            self._write(b"%010d 00000 n \n" % self._offsets[object_id])
+        self._write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (count, xref_position))
+
+
+def write_pdf_file_streaming(paragraphs: Iterable[str], output_path: str) -> Optional[str]:
+    try:
+        with open(output_path, 'wb') as output:
+            writer = StreamingPdfWriter(output)
+            for para in paragraphs:
+                writer.add_paragraph(para)
+            writer.close()
+    except Exception as e:
+        return f"Error writing to file: {e}"
+    return None
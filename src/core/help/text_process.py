@@ -0,0 +1,5 @@
+import re
+
+def clean_text(text):
+    """Replace characters outside Latin-1, which the core PDF fonts cannot show, with '*'."""
+    return re.sub(r'[^\x00-\xff]', '*', text)
@@ -1,36 +1,90 @@
+from collections.abc import Callable
 import docx
 from fpdf import FPDF
-import re
+import os
+from src.core.help.segment_store import SegmentStore
+from src.core.help.text_process import clean_text
 
-def clean_text(text):
-    return re.sub(r'[^\x00-\xff]', '*', text)
+# Unicode TrueType fonts looked up when text falls outside Latin-1 (e.g. IPA symbols)
+UNICODE_FONT_CANDIDATES = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+    "/Library/Fonts/Arial Unicode.ttf",
+    "C:\\Windows\\Fonts\\arialuni.ttf",
+    "C:\\Windows\\Fonts\\seguisym.ttf",
+]
 
+def find_unicode_font():
+    font_path = os.environ.get("TRANSLATOR_PDF_FONT")
+    if font_path and os.path.isfile(font_path):
+        return font_path
+    for candidate in UNICODE_FONT_CANDIDATES:
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+def save_docx_file(paragraphs, output_path):
+    doc = docx.Document()
+    for para in paragraphs:
+        doc.add_paragraph(para)
+    doc.save(output_path)
+
+def save_txt_file(text, output_path):
+    if isinstance(text, SegmentStore):
+        # Segments are already UTF-8, copy them straight from the store
+        with open(output_path, 'wb') as out_file:
+            for view in text.iter_views():
+                out_file.write(view)
+                out_file.write(b'\n')
+        return
+    with open(output_path, 'w', encoding='utf-8') as out_file:
+        for line in text:
+            out_file.write(line + '\n')
+
+def save_pdf_file(paragraphs, output_path, unicode_font=False):
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    font_path = find_unicode_font() if unicode_font else None
+    if font_path:
+        pdf.add_font("Unicode", fname=font_path)
+        pdf.set_font("Unicode", size=12)
+    else:
+        pdf.set_font("Arial", size=12)
+    for para in paragraphs:
+        pdf.multi_cell(0, 10, para if font_path else clean_text(para))
+    pdf.output(output_path)
+
+# The write_* functions report failures as a message; the save_* ones raise
 def write_docx_file(paragraphs, output_path):
     try:
-      doc = docx.Document()
-      for para in paragraphs:
-          doc.add_paragraph(para)
-      doc.save(output_path)
+        save_docx_file(paragraphs, output_path)
     except Exception as e:
         return "Error writing to file"
 
 def write_txt_file(text, output_path):
     try:
-        with open(output_path, 'w', encoding='utf-8') as out_file:
-            for line in text:
-                out_file.write(line + '\n')
+        save_txt_file(text, output_path)
     except Exception:
         return "Error writing to file"
     
-def write_pdf_file(paragraphs, output_path):
+def write_pdf_file(paragraphs, output_path, unicode_font=False):
     try:
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_auto_page_break(auto=True, margin=15)
-        pdf.set_font("Arial", size=12)
-        for para in paragraphs:
-            pdf.multi_cell(0, 10, clean_text(para))
-        print(pdf.output(output_path))
+        save_pdf_file(paragraphs, output_path, unicode_font)
     except Exception as e:
         print(f"Error writing PDF: {e}")  # <-- Esto te da información útil
-        return "Error writing to file"
\ No newline at end of file
+        return "Error writing to file"
+
+# Writer for each supported file suffix
+WRITERS: dict[str, Callable[..., object]] = {
+    '.pdf': write_pdf_file,
+    '.docx': write_docx_file,
+    '.txt': write_txt_file,
+}
+
+# Raising writer for each supported file suffix
+SAVERS: dict[str, Callable[..., None]] = {
+    '.pdf': save_pdf_file,
+    '.docx': save_docx_file,
+    '.txt': save_txt_file,
+}
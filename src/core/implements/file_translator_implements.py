@@ -1,45 +1,226 @@
-from collections.abc import Callable
+import asyncio
 import os
-from src.core.interfaces.file_translator_interface import FileTranslatorInterface
-from src.core.help.read_files import read_pdf_file, read_docx_file, read_txt_file
-from src.core.help.write_files import write_pdf_file, write_docx_file, write_txt_file
-from src.services.googletrans_services import translate_text_delegate
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any, Optional
+from src.config.settings import get_incremental, get_out_of_core_segments
+from src.core.interfaces.file_translator_interface import FileTranslatorInterface, ProgressReporter
+from src.core.formats.format_registry import get_format
+from src.core.help.async_files import read_segments_async, write_segments_async
+from src.core.help.file_errors import FileIOError, FileReadError
+from src.core.help.segment_manifest import SegmentManifest, manifest_path_for
+from src.core.help.segment_store import SegmentStore
+from src.core.jobs.translation_job import COMPLETED, FAILED, FileTranslationResult, JobCancelled
+from src.core.pipeline.translation_pipeline import TranslationPipeline
 
 class FileTranslatorImplements(FileTranslatorInterface):
-    def __init__(self) -> None:
+    def __init__(self, pipeline: Optional[TranslationPipeline] = None, incremental: Optional[bool] = None) -> None:
         super().__init__()
-        self.suffixes_enable = {
-            '.pdf': self.translate_pdf_file,
-            '.docx': self.translate_docx_file,
-            '.txt': self.translate_txt_file,
-        }
+        if pipeline is None:
+            from src.core.factories.backend_factory import create_translation_pipeline
+            pipeline = create_translation_pipeline()
+        self.pipeline = pipeline
+        self.incremental = get_incremental() if incremental is None else incremental
+        self.out_of_core_segments = get_out_of_core_segments()
+
+    def is_out_of_core(self, segment_count: int) -> bool:
+        return 0 < self.out_of_core_segments <= segment_count
 
     def translate_file(self, file_path: str, entry_lang: str, output_lang: str) -> str:
         self.validate_path(file_path)
-        file_extension: str = os.path.splitext(file_path)[1].lower()
-        if file_extension in self.suffixes_enable:
-            translation_function: Callable[[str, str, str], str] = self.suffixes_enable[file_extension]
-            return translation_function(file_path, entry_lang, output_lang)
-        else:
-            return "Unsupported file format. Please use .pdf, .docx, or .txt files."
-
-    def translate_pdf_file(self, file_path: str, entry_lang: str, output_lang: str) -> str:
-        text: list[str] = read_pdf_file(file_path)
-        translated: list[str] = [translate_text_delegate((line.strip(), entry_lang, output_lang)) for line in text if line.strip()]
-        output_path: str = file_path.replace('.pdf', '_translated.pdf')
-        write_pdf_file(translated, output_path)
-        return f"File translated successfully and saved as {output_path.split('/')[-1]}"
-
-    def translate_docx_file(self, file_path: str, entry_lang: str, output_lang: str) -> str:
-        text: list[str] = read_docx_file(file_path)
-        translated: list[str] = [translate_text_delegate((line.strip(), entry_lang, output_lang)) for line in text if line.strip()]
-        output_path: str = file_path.replace('.docx', '_translated.docx')
-        write_docx_file(translated, output_path)
-        return f"File translated successfully and saved as {output_path.split('/')[-1]}"
-
-    def translate_txt_file(self, file_path: str, entry_lang: str, output_lang: str) -> str:
-        text: list[str] = read_txt_file(file_path)
-        translated: list[str] = [translate_text_delegate((line.strip(), entry_lang, output_lang)) for line in text if line.strip()]
-        output_path: str = file_path.replace('.txt', '_translated.txt')
-        write_txt_file(translated, output_path)
-        return f"File translated successfully and saved as {output_path.split('/')[-1]}"
+        try:
+            get_format(file_path)
+        except ValueError as e:
+            return str(e)
+        return self.translate_document(file_path, entry_lang, output_lang).message
+
+    def translate_document(self, file_path: str, entry_lang: str, output_lang: str,
+                           progress: Optional[ProgressReporter] = None,
+                           cancel_event: Optional[threading.Event] = None) -> FileTranslationResult:
+        """Read, translate and write a document, reporting progress per stage."""
+        self.validate_path(file_path)
+        file_format = get_format(file_path)
+        output_path = self.output_path_for(file_path)
+        result = FileTranslationResult(file_path, output_path)
+
+        started = time.perf_counter()
+        try:
+            text = file_format.read_segments(file_path)
+        except FileReadError as e:
+            self._fail(result, e)
+            return result
+        with text:
+            result.timings["read"] = time.perf_counter() - started
+            if progress:
+                progress("read", len(text), len(text))
+            started = time.perf_counter()
+            translated, stats = self.translate_segments(text, entry_lang, output_lang, output_path,
+                                                        progress, cancel_event)
+            with translated:
+                result.timings["translate"] = time.perf_counter() - started
+                # Last chance to cancel: once the output is being written the job completes
+                if cancel_event is not None and cancel_event.is_set():
+                    raise JobCancelled()
+                if progress:
+                    progress("write", 0, 1)
+                started = time.perf_counter()
+                error = file_format.write(file_path, translated, output_path,
+                                          out_of_core=self.is_out_of_core(len(text)))
+                result.timings["write"] = time.perf_counter() - started
+        if progress:
+            try:
+                progress("write", 1, 1)
+            except JobCancelled:
+                pass  # the output is already on disk, a late cancel does not undo it
+
+        self._record_run(result, stats)
+        if error:
+            result.errors.append(str(error))
+            result.status = FAILED
+            result.message = f"Error translating file: {error}"
+            return result
+        result.status = COMPLETED
+        result.message = self._success_message(output_path, stats)
+        return result
+
+    async def translate_files_async(self, file_paths: Iterable[str], entry_lang: str,
+                                    output_lang: str) -> list[FileTranslationResult]:
+        """Translate several files, reading the next one while the current one is translated.
+
+        Reading and writing run on the I/O pool of help.async_files and translation on
+        the loop's default executor, so the backend is not left idle while the next file
+        is parsed or the previous one written. A file that fails is reported in its
+        result and does not stop the batch.
+        """
+        loop = asyncio.get_running_loop()
+        paths = list(file_paths)
+        results: list[FileTranslationResult] = []
+        writes: list[asyncio.Task[None]] = []
+        reading = asyncio.ensure_future(read_segments_async(paths[0])) if paths else None
+        for position, file_path in enumerate(paths):
+            result = FileTranslationResult(file_path, self.output_path_for(file_path))
+            results.append(result)
+            started = time.perf_counter()
+            assert reading is not None
+            try:
+                text = await reading
+            except FileIOError as e:
+                self._fail(result, e)
+                continue
+            finally:
+                reading = (asyncio.ensure_future(read_segments_async(paths[position + 1]))
+                           if position + 1 < len(paths) else None)
+            result.timings["read"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            try:
+                translated, stats = await loop.run_in_executor(None, self.translate_segments, text, entry_lang,
+                                                               output_lang, result.output_path)
+            except Exception as e:
+                self._fail(result, e)
+                continue
+            finally:
+                text.close()
+            result.timings["translate"] = time.perf_counter() - started
+            self._record_run(result, stats)
+            writes.append(asyncio.ensure_future(self._write_async(result, translated)))
+        await asyncio.gather(*writes)
+        return results
+
+    async def _write_async(self, result: FileTranslationResult, translated: SegmentStore) -> None:
+        assert result.output_path is not None
+        started = time.perf_counter()
+        try:
+            await write_segments_async(result.file_path, translated, result.output_path,
+                                       self.is_out_of_core(len(translated)))
+        except FileIOError as e:
+            self._fail(result, e)
+            return
+        finally:
+            translated.close()
+            result.timings["write"] = time.perf_counter() - started
+        result.status = COMPLETED
+        result.message = f"File translated successfully and saved as {os.path.basename(result.output_path)}"
+
+    @staticmethod
+    def output_path_for(file_path: str) -> str:
+        root, suffix = os.path.splitext(file_path)
+        return f"{root}_translated{suffix}"
+
+    @staticmethod
+    def _record_run(result: FileTranslationResult, stats: dict[str, Any]) -> None:
+        result.segments = stats["segments"]
+        result.reused_segments = stats["reused"]
+        result.translated_segments = stats["translated"]
+        result.skipped_segments = stats["skipped"]
+        result.cache_hits = stats["cache_hits"]
+
+    @staticmethod
+    def _fail(result: FileTranslationResult, error: Exception) -> None:
+        result.errors.append(f"{type(error).__name__}: {error}")
+        result.status = FAILED
+        result.message = f"Error translating file: {error}"
+
+    def translate_segments(self, segments: SegmentStore, entry_lang: str, output_lang: str,
+                           output_path: Optional[str] = None, progress: Optional[ProgressReporter] = None,
+                           cancel_event: Optional[threading.Event] = None) -> tuple[SegmentStore, dict[str, Any]]:
+        """Translate a document's segments window by window through the pipeline.
+
+        Only one window of decoded strings is alive at a time; translations are
+        appended to a new store, which goes straight to disk for documents
+        large enough to be written out-of-core. In incremental mode, segments already present in
+        the manifest next to output_path are reused and only new or changed ones
+        reach the backend. Progress is reported and cancellation checked after
+        every window. Returns the translations and the statistics of the run
+        (segment, reused, translated, skipped and cache hit counts).
+        """
+        manifest: Optional[SegmentManifest] = None
+        current: dict[str, str] = {}
+        if self.incremental and output_path is not None:
+            manifest = SegmentManifest.load(manifest_path_for(output_path), entry_lang, output_lang,
+                                            self.pipeline.backend.name)
+        translated = SegmentStore(spill_threshold=1) if self.is_out_of_core(len(segments)) else SegmentStore()
+        reused = 0
+        # Counted for this call only; the pipeline metrics are shared with concurrent jobs
+        counts: Counter[str] = Counter()
+        window = self.pipeline.batch_size * 20
+        try:
+            for start in range(0, len(segments), window):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise JobCancelled()
+                lines = segments.slice(start, start + window)
+                if manifest is None:
+                    translated.extend(self.pipeline.translate_batch(lines, entry_lang, output_lang, counts))
+                else:
+                    known, missing = manifest.diff(lines)
+                    if missing:
+                        fresh = self.pipeline.translate_batch([lines[index] for index in missing],
+                                                              entry_lang, output_lang, counts)
+                        for index, translation in zip(missing, fresh):
+                            known[index] = translation
+                    reused += len(lines) - len(missing)
+                    window_translations = [translation or "" for translation in known]
+                    current.update(manifest.entries(lines, window_translations))
+                    translated.extend(window_translations)
+                if progress:
+                    progress("translate", len(translated), len(segments))
+        except BaseException:
+            translated.close()
+            raise
+
+        if manifest is not None:
+            manifest.segments = current
+            manifest.save()
+        skipped = counts["skipped"]
+        stats = {"segments": len(segments), "reused": reused, "translated": len(segments) - reused,
+                 "skipped": skipped, "skipped_fraction": skipped / len(segments) if len(segments) else 0.0,
+                 "cache_hits": counts["cache_hits"]}
+        return translated, stats
+
+    def _success_message(self, output_path: str, stats: dict[str, Any]) -> str:
+        message = f"File translated successfully and saved as {output_path.split('/')[-1]}"
+        if self.incremental:
+            message += f" ({stats['reused']} of {stats['segments']} segments reused)"
+        return message
@@ -0,0 +1,103 @@
+import os
+import re
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+from src.config.settings import get_ipa_cache_size, get_lexicon_path
+from src.core.interfaces.phonetic_transcription_interface import PhoneticTranscriptionInterface
+from src.core.help.pronunciation_lexicon import PronunciationLexicon, open_lexicon
+from src.core.help.phonetic_rules import ACCENTS, arpabet_to_ipa, guess_phones
+
+DEFAULT_LEXICON_PATH = Path(__file__).parent.parent.parent.parent / "translations" / "lexicon" / "en.dict"
+
+_WORD_RE = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)*")
+
+class PhoneticTranscriptionImplements(PhoneticTranscriptionInterface):
+    def __init__(self, lexicon_path: Optional[str] = None, cache_size: Optional[int] = None) -> None:
+        self.lexicon_path = lexicon_path or get_lexicon_path() or str(DEFAULT_LEXICON_PATH)
+        self._lexicon: Optional[PronunciationLexicon] = None
+        # Natural text is Zipf-distributed, so a bounded per-(word, accent) memo absorbs most lookups
+        self._cached_word = lru_cache(maxsize=cache_size if cache_size is not None else get_ipa_cache_size())(
+            self.transcribe_word)
+        self.last_stats: dict[str, Any] = {}
+
+    @property
+    def lexicon(self) -> Optional[PronunciationLexicon]:
+        """Lexicon opened on first use; None when no lexicon file is available."""
+        if self._lexicon is None and Path(self.lexicon_path).is_file():
+            self._lexicon = open_lexicon(self.lexicon_path)
+        return self._lexicon
+
+    def get_supported_accents(self) -> list[str]:
+        return list(ACCENTS)
+
+    def transcribe_word(self, word: str, accent: str) -> str:
+        lexicon = self.lexicon
+        phones = lexicon.lookup(word) if lexicon is not None else None
+        if phones is None:
+            phones = guess_phones(word)
+        return arpabet_to_ipa(phones, accent, word)
+
+    def transcribe_to_ipa(self, text: str, accent: str) -> str:
+        return self.transcribe_batch([text], accent)[0]
+
+    def transcribe_batch(self, texts: list[str], accent: str) -> list[str]:
+        if not self.is_accent_supported(accent):
+            raise ValueError(f"Accent '{accent}' is not supported")
+        cached_word = self._cached_word
+
+        def replace(match: re.Match[str]) -> str:
+            return cached_word(match.group(0).lower(), accent)
+
+        return [_WORD_RE.sub(replace, text) for text in texts]
+
+    def transcribe_file(self, file_path: str, accent: str) -> str:
+        # Imported here so single-string transcription does not need the PDF/DOCX libraries
+        from src.core.help.read_files import LINE_READERS
+        from src.core.help.write_files import SAVERS, save_pdf_file
+
+        if not os.path.isfile(file_path):
+            raise ValueError("Invalid file path provided.")
+        root, file_extension = os.path.splitext(file_path)
+        file_extension = file_extension.lower()
+        if file_extension not in LINE_READERS:
+            return f"Unsupported file format. Please use {', '.join(LINE_READERS)} files."
+
+        try:
+            lines = [line for line in (raw.strip() for raw in LINE_READERS[file_extension](file_path)) if line]
+        except Exception as e:
+            return f"Error transcribing file: Error reading file ({e})"
+        before = self._cached_word.cache_info()
+        started = time.perf_counter()
+        transcribed = self.transcribe_batch(lines, accent)
+        elapsed = time.perf_counter() - started
+        after = self._cached_word.cache_info()
+
+        output_path = f"{root}_ipa{file_extension}"
+        try:
+            if file_extension == '.pdf':
+                save_pdf_file(transcribed, output_path, unicode_font=True)
+            else:
+                SAVERS[file_extension](transcribed, output_path)
+        except Exception as e:
+            return f"Error transcribing file: Error writing to file ({e})"
+
+        hits, misses = after.hits - before.hits, after.misses - before.misses
+        words = hits + misses
+        self.last_stats = {
+            "words": words,
+            "cache_hits": hits,
+            "cache_misses": misses,
+            "hit_rate": hits / words if words else 0.0,
+            "words_per_second": words / elapsed if elapsed > 0 else 0.0,
+            "cache_size": after.currsize,
+            "seconds": elapsed,
+        }
+        return (f"File transcribed successfully and saved as {os.path.basename(output_path)} "
+                f"({words} words, cache hit rate {self.last_stats['hit_rate']:.1%}, "
+                f"{self.last_stats['words_per_second']:.0f} words/s)")
+
+    def get_cache_stats(self) -> dict[str, int]:
+        info = self._cached_word.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize or 0}
@@ -1,11 +1,18 @@
+from typing import Optional
 from src.core.interfaces.text_translator_interface import TextTranslatorInterface
-from src.services.googletrans_services import translate_text_delegate
+from src.core.pipeline.translation_pipeline import TranslationPipeline
 
 class TextTranslatorImplements(TextTranslatorInterface):
+    def __init__(self, pipeline: Optional[TranslationPipeline] = None) -> None:
+        if pipeline is None:
+            from src.core.factories.backend_factory import create_translation_pipeline
+            pipeline = create_translation_pipeline()
+        self.pipeline = pipeline
+
     def translate_text(self, text: str, entry_lang: str, output_lang: str) -> str:
         try:
             src_input = (text, entry_lang, output_lang)
-            text_translated = translate_text_delegate(src_input)
+            text_translated = self.pipeline.translate_text_delegate(src_input)
             return text_translated
         except Exception as e:
             return f"Error: unable to translate text. Try again later. ({str(e)})"
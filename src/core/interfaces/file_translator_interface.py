@@ -1,19 +1,40 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+import asyncio
+from collections.abc import Callable, Iterable
 import os
+import threading
+from typing import TYPE_CHECKING, Optional
 
-class FileTranslatorInterface(ABC):
-    def __init__(self) -> None:
-        # map of file suffix to handler function
-        self.suffixes_enable: dict[str, Callable[..., str]] = {}
+if TYPE_CHECKING:
+    from src.core.jobs.translation_job import FileTranslationResult
+
+# progress(stage, done, total)
+ProgressReporter = Callable[[str, int, int], None]
 
+class FileTranslatorInterface(ABC):
     @abstractmethod
     def translate_file(self, file_path: str, entry_lang: str, output_lang: str) -> str:
         """Translate a file located at file_path using specified languages."""
         raise NotImplementedError
 
+    def translate_document(self, file_path: str, entry_lang: str, output_lang: str,
+                           progress: Optional[ProgressReporter] = None,
+                           cancel_event: Optional[threading.Event] = None) -> "FileTranslationResult":
+        """Translate a file and return a structured result. Implementations should override this
+        to report progress and honour cancel_event; the default wraps translate_file."""
+        from src.core.jobs.translation_job import COMPLETED, FileTranslationResult
+        message = self.translate_file(file_path, entry_lang, output_lang)
+        return FileTranslationResult(file_path, status=COMPLETED, message=message)
+
+    async def translate_files_async(self, file_paths: Iterable[str], entry_lang: str,
+                                    output_lang: str) -> list["FileTranslationResult"]:
+        """Translate several files from an event loop. The default runs translate_document
+        for one file after another on the loop's default executor."""
+        loop = asyncio.get_running_loop()
+        return [await loop.run_in_executor(None, self.translate_document, file_path, entry_lang, output_lang)
+                for file_path in file_paths]
+
     @staticmethod
     def validate_path(path: str) -> None:
         if not os.path.isfile(path):
             raise ValueError("Invalid file path provided.")
-
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+class PhoneticTranscriptionInterface(ABC):
+    @abstractmethod
+    def transcribe_to_ipa(self, text: str, accent: str) -> str:
+        """Transcribe text to IPA phonetic notation using the given accent."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_supported_accents(self) -> list[str]:
+        """Return the codes of the accents this transcriber can produce."""
+        raise NotImplementedError
+
+    def is_accent_supported(self, accent: str) -> bool:
+        return accent in self.get_supported_accents()
+
+    def transcribe_batch(self, texts: list[str], accent: str) -> list[str]:
+        """Transcribe several texts, e.g. the lines of a document."""
+        return [self.transcribe_to_ipa(text, accent) for text in texts]
+
+    @abstractmethod
+    def transcribe_file(self, file_path: str, accent: str) -> str:
+        """Transcribe a document to IPA and save it next to the original."""
+        raise NotImplementedError
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+class TranslationBackendInterface(ABC):
+    """Engine that performs the actual translation of text segments."""
+
+    name: str = "base"
+
+    @abstractmethod
+    def translate(self, text: str, input_lang: str, output_lang: str) -> str:
+        """Translate a single text from input_lang to output_lang."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def detect_language(self, text: str) -> str:
+        """Return the language code detected for text."""
+        raise NotImplementedError
+
+    def translate_batch(self, texts: Sequence[str], input_lang: str, output_lang: str) -> list[str]:
+        """Translate several texts at once. Backends with a native batch call should override this."""
+        return [self.translate(text, input_lang, output_lang) for text in texts]
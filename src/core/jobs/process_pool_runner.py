@@ -0,0 +1,208 @@
+"""
+Multi-process runner for translating many files at once.
+
+PDF parsing, document writing and text processing are CPU bound and limited
+to one core by the GIL, so files are spread over a pool of long-lived worker
+processes. Every backend call is forwarded to a single coordinator in the
+parent process, which owns the real TranslationPipeline so caching, metrics
+and rate limiting stay global across workers.
+"""
+
+import multiprocessing
+import os
+from collections import Counter
+import sys
+import threading
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Any, Optional
+from src.core.interfaces.translation_backend_interface import TranslationBackendInterface
+from src.core.pipeline.translation_cache import TranslationCache
+from src.core.pipeline.translation_pipeline import TranslationPipeline
+
+
+class CoordinatorBackend(TranslationBackendInterface):
+    """Worker-side backend that forwards every call to the coordinator process."""
+
+    def __init__(self, requests: Any, responses: Any, worker_id: int, name: str) -> None:
+        self.requests = requests
+        self.responses = responses
+        self.worker_id = worker_id
+        self.name = name
+
+    def call(self, kind: str, payload: Any) -> Any:
+        self.requests.put((kind, self.worker_id, payload))
+        status, result = self.responses.get()
+        if status != "ok":
+            raise RuntimeError(result)
+        return result
+
+    def translate(self, text: str, input_lang: str, output_lang: str) -> str:
+        return self.translate_batch([text], input_lang, output_lang)[0]
+
+    def translate_batch(self, texts: Sequence[str], input_lang: str, output_lang: str) -> list[str]:
+        return self.call("translate", (list(texts), input_lang, output_lang))
+
+    def detect_language(self, text: str) -> str:
+        return self.call("detect", text)
+
+
+class CoordinatorPipeline(TranslationPipeline):
+    """Pipeline used inside workers; filtered batches go to the coordinator, which caches globally."""
+
+    def __init__(self, backend: CoordinatorBackend) -> None:
+        super().__init__(backend, cache=TranslationCache(0))
+        self.coordinator: CoordinatorBackend = backend
+
+    def _translate_segments(self, texts: Sequence[str], input_lang: str, output_lang: str,
+                            counts: Optional[Counter[str]] = None) -> list[str]:
+        # Filtering already happened here in the worker, so fewer segments cross the queues;
+        # cache hits happen in the coordinator and are not counted in counts
+        if not texts:
+            return []
+        return self.coordinator.translate_batch(texts, input_lang, output_lang)
+
+    def detect_language(self, text: str) -> str:
+        return self.coordinator.detect_language(text)
+
+
+# State of the current worker process, created once by _init_worker
+_worker_translator: Any = None
+
+
+def _init_worker(requests: Any, response_queues: list[Any], next_slot: Any, backend_name: str,
+                 incremental: Optional[bool]) -> None:
+    global _worker_translator
+    with next_slot.get_lock():
+        worker_id = next_slot.value
+        next_slot.value += 1
+    # Importing the implementation loads the PDF/DOCX readers and writers once per worker
+    from src.core.implements.file_translator_implements import FileTranslatorImplements
+    pipeline = CoordinatorPipeline(CoordinatorBackend(requests, response_queues[worker_id], worker_id, backend_name))
+    _worker_translator = FileTranslatorImplements(pipeline, incremental)
+
+
+def _translate_in_worker(file_path: str, entry_lang: str, output_lang: str) -> tuple[str, dict[str, Any]]:
+    result = _worker_translator.translate_document(file_path, entry_lang, output_lang)
+    return result.message, {"segments": result.segments, "reused": result.reused_segments,
+                            "translated": result.translated_segments, "skipped": result.skipped_segments}
+
+
+class ProcessPoolFileRunner:
+    """Translate files in parallel worker processes sharing one coordinator pipeline."""
+
+    def __init__(self, pipeline: Optional[TranslationPipeline] = None, max_workers: Optional[int] = None,
+                 incremental: Optional[bool] = None, coordinator_threads: int = 4) -> None:
+        if pipeline is None:
+            from src.core.factories.backend_factory import create_translation_pipeline
+            pipeline = create_translation_pipeline()
+        self.pipeline = pipeline
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.incremental = incremental
+        self.coordinator_threads = coordinator_threads
+        self._context = multiprocessing.get_context()
+        self._requests: Any = None
+        self._responses: list[Any] = []
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._coordinator: Optional[threading.Thread] = None
+        self._dispatch: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self) -> "ProcessPoolFileRunner":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+        self._requests = self._context.Queue()
+        self._responses = [self._context.Queue() for _ in range(self.max_workers)]
+        self._dispatch = ThreadPoolExecutor(max_workers=self.coordinator_threads, thread_name_prefix="coordinator")
+        self._coordinator = threading.Thread(target=self._serve, name="translation-coordinator", daemon=True)
+        self._coordinator.start()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self._context,
+            initializer=_init_worker,
+            initargs=(self._requests, self._responses, self._context.Value('i', 0),
+                      self.pipeline.backend.name, self.incremental),
+        )
+
+    def close(self) -> None:
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=True)
+        self._requests.put(None)
+        if self._coordinator is not None:
+            self._coordinator.join()
+        if self._dispatch is not None:
+            self._dispatch.shutdown(wait=True)
+        self._executor = None
+
+    def _serve(self) -> None:
+        """Coordinator loop: answer backend calls from every worker with the shared pipeline."""
+        while True:
+            message = self._requests.get()
+            if message is None:
+                return
+            assert self._dispatch is not None
+            self._dispatch.submit(self._answer, *message)
+
+    def _answer(self, kind: str, worker_id: int, payload: Any) -> None:
+        try:
+            if kind == "translate":
+                texts, input_lang, output_lang = payload
+                # Workers already filtered the segments and protected glossary terms
+                reply: tuple[str, Any] = ("ok", self.pipeline.translate_prepared(texts, input_lang, output_lang))
+            elif kind == "detect":
+                reply = ("ok", self.pipeline.detect_language(payload))
+            else:
+                reply = ("error", f"Unknown coordinator request '{kind}'")
+        except Exception as e:
+            reply = ("error", f"{type(e).__name__}: {e}")
+        self._responses[worker_id].put(reply)
+
+    def translate_files(self, file_paths: Iterable[str], entry_lang: str, output_lang: str) -> dict[str, str]:
+        """Translate every file and return a result message per path.
+
+        Files are submitted largest first so the biggest ones do not end up
+        running alone at the end of the job.
+        """
+        self.start()
+        assert self._executor is not None
+        ordered = sorted(set(file_paths), key=lambda path: os.path.getsize(path) if os.path.isfile(path) else 0,
+                         reverse=True)
+        futures: dict[Future[tuple[str, dict[str, Any]]], str] = {
+            self._executor.submit(_translate_in_worker, path, entry_lang, output_lang): path for path in ordered
+        }
+        results: dict[str, str] = {}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                results[path] = future.result()[0]
+            except Exception as e:
+                results[path] = f"Error translating file: {e}"
+        return results
+
+
+def main() -> None:
+    import argparse
+    parser = argparse.ArgumentParser(description="Translate several files in parallel worker processes")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--from", dest="entry_lang", default="detect")
+    parser.add_argument("--to", dest="output_lang", required=True)
+    parser.add_argument("--backend", default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    from src.core.factories.backend_factory import create_translation_pipeline
+    with ProcessPoolFileRunner(create_translation_pipeline(args.backend), args.workers) as runner:
+        for path, message in runner.translate_files(args.files, args.entry_lang, args.output_lang).items():
+            print(f"{path}: {message}")
+        print(runner.pipeline.metrics.snapshot(), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
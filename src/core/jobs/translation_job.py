@@ -0,0 +1,172 @@
+"""
+Job API for long-running file translations.
+
+A TranslationJob runs one file through a file translator on a background
+thread and exposes progress (as an iterator or through callbacks),
+cancellation, blocking or awaitable completion and a structured result.
+"""
+
+import asyncio
+import queue
+import threading
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from src.core.help.profiling import profile_job
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation is requested."""
+
+
+@dataclass(frozen=True)
+class JobProgress:
+    """Progress of one stage of a job (read, translate, write)."""
+    stage: str
+    done: int
+    total: int
+
+    @property
+    def fraction(self) -> float:
+        return self.done / self.total if self.total else 1.0
+
+
+@dataclass
+class FileTranslationResult:
+    """Outcome of translating a single file."""
+    file_path: str
+    output_path: Optional[str] = None
+    status: str = PENDING
+    message: str = ""
+    segments: int = 0
+    translated_segments: int = 0
+    reused_segments: int = 0
+    skipped_segments: int = 0
+    cache_hits: int = 0
+    timings: dict[str, float] = field(default_factory=dict)
+    errors: list[str] = field(default_factory=list)
+    profiles: list[str] = field(default_factory=list)
+
+    @property
+    def skipped_fraction(self) -> float:
+        """Fraction of the document's segments that needed no backend call (see SegmentFilter)."""
+        return self.skipped_segments / self.segments if self.segments else 0.0
+
+
+ProgressCallback = Callable[[JobProgress], None]
+
+_default_executor: Optional[ThreadPoolExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def _get_default_executor() -> ThreadPoolExecutor:
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="translation-job")
+        return _default_executor
+
+
+class TranslationJob:
+    """Handle on a file translation running in the background."""
+
+    def __init__(self, translator: Any, file_path: str, entry_lang: str, output_lang: str,
+                 on_progress: Optional[ProgressCallback] = None, profile: Optional[str] = None) -> None:
+        self.translator = translator
+        self.file_path = file_path
+        self.entry_lang = entry_lang
+        self.output_lang = output_lang
+        # Profiler mode (cprofile, sample, all); None follows TRANSLATOR_PROFILE, "" disables
+        self.profile = profile
+        self.status = PENDING
+        self.cancel_event = threading.Event()
+        self._callbacks: list[ProgressCallback] = [on_progress] if on_progress else []
+        self._events: queue.Queue[Optional[JobProgress]] = queue.Queue()
+        self._future: Optional[Future[FileTranslationResult]] = None
+        self.last_progress: Optional[JobProgress] = None
+
+    def submit(self, executor: Optional[ThreadPoolExecutor] = None) -> "TranslationJob":
+        """Start the job on executor (a shared background pool by default)."""
+        if self._future is None:
+            self._future = (executor or _get_default_executor()).submit(self._run)
+        return self
+
+    def _run(self) -> FileTranslationResult:
+        self.status = RUNNING
+        with profile_job(self.file_path, self.profile) as profiler:
+            result = self._translate()
+            if profiler is not None:
+                profiler.segments = result.segments
+        if profiler is not None:
+            result.profiles = profiler.paths
+        self.status = result.status
+        self._events.put(None)
+        return result
+
+    def _translate(self) -> FileTranslationResult:
+        try:
+            if self.cancel_event.is_set():
+                raise JobCancelled()
+            return self.translator.translate_document(self.file_path, self.entry_lang, self.output_lang,
+                                                      progress=self._report, cancel_event=self.cancel_event)
+        except JobCancelled:
+            return FileTranslationResult(self.file_path, status=CANCELLED, message="Translation cancelled")
+        except Exception as e:
+            return FileTranslationResult(self.file_path, status=FAILED, message=f"Error translating file: {e}",
+                                         errors=[f"{type(e).__name__}: {e}"])
+
+    def _report(self, stage: str, done: int, total: int) -> None:
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+        event = JobProgress(stage, done, total)
+        self.last_progress = event
+        self._events.put(event)
+        for callback in self._callbacks:
+            callback(event)
+
+    def add_progress_callback(self, callback: ProgressCallback) -> None:
+        """Call callback (on the job thread) for every progress event from now on."""
+        self._callbacks.append(callback)
+
+    def add_done_callback(self, callback: Callable[[FileTranslationResult], None]) -> None:
+        """Call callback with the result once the job finishes."""
+        self._require_future().add_done_callback(lambda future: callback(future.result()))
+
+    def progress(self, timeout: Optional[float] = None) -> Iterator[JobProgress]:
+        """Yield progress events until the job finishes."""
+        self._require_future()
+        while True:
+            event = self._events.get(timeout=timeout)
+            if event is None:
+                self._events.put(None)  # later iterations end immediately too
+                return
+            yield event
+
+    def cancel(self) -> bool:
+        """Request cancellation; the job stops at its next progress checkpoint."""
+        if self.done():
+            return False
+        self.cancel_event.set()
+        return True
+
+    def done(self) -> bool:
+        return self._future is not None and self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> FileTranslationResult:
+        """Block until the job finishes and return its result."""
+        return self._require_future().result(timeout)
+
+    def __await__(self) -> Generator[Any, None, FileTranslationResult]:
+        return asyncio.wrap_future(self._require_future()).__await__()
+
+    def _require_future(self) -> Future[FileTranslationResult]:
+        if self._future is None:
+            raise RuntimeError("Job has not been submitted")
+        return self._future
@@ -0,0 +1,186 @@
+"""
+Adaptive concurrency limiter for backend calls.
+
+Uses additive-increase / multiplicative-decrease (AIMD): while latency stays
+close to the best latency observed recently, the limit grows by one request
+per limit's worth of completions. When a call fails with a transient error
+(a timeout, a connection error, throttling or a 5xx response), or the tail
+latency of the recent window rises past ``tolerance`` times that baseline,
+the limit is multiplied by ``backoff``. The pipeline retries such calls
+afterwards, with exponential backoff, so a throttled request is not lost.
+Any other error (an unsupported language pair, a bad request) says nothing
+about capacity: it leaves the limit alone and is raised at once.
+"""
+
+import math
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Optional
+from src.config.settings import get_initial_concurrency, get_max_concurrency
+from src.core.pipeline.translation_metrics import TranslationMetrics
+
+
+# Exception classes of HTTP clients (requests, httpx) that mean the service could not be reached in time
+_TRANSIENT_ERROR_NAMES = frozenset({"Timeout", "TimeoutException", "ConnectionError", "NetworkError",
+                                    "RemoteProtocolError"})
+_TRANSIENT_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+_TRANSIENT_MESSAGE_RE = re.compile(
+    r"\b(?:408|425|429|50[0234])\b|too many requests|rate limit|temporarily unavailable|timed out|timeout",
+    re.IGNORECASE)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Whether a failed backend call is worth retrying and points at an overloaded service."""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    if any(cls.__name__ in _TRANSIENT_ERROR_NAMES for cls in type(error).__mro__):
+        return True
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status in _TRANSIENT_STATUS_CODES
+    return bool(_TRANSIENT_MESSAGE_RE.search(str(error)))
+
+
+class AdaptiveConcurrencyLimiter:
+    """Bounds in-flight backend requests with a limit that follows observed latency."""
+
+    def __init__(self, initial_limit: Optional[int] = None, min_limit: int = 1, max_limit: Optional[int] = None,
+                 backoff: float = 0.7, tolerance: float = 2.0, window: int = 20, baseline_window: int = 200,
+                 metrics: Optional[TranslationMetrics] = None, history_size: int = 1000) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit or get_max_concurrency()
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.metrics = metrics
+        self._limit = float(min(self.max_limit, max(min_limit, initial_limit or get_initial_concurrency())))
+        self._in_flight = 0
+        self._window = window
+        self._recent: deque[float] = deque(maxlen=window)
+        self._baseline_samples: deque[float] = deque(maxlen=baseline_window)
+        self._since_decrease = 0
+        # Incremented on every decrease; results of requests started before it are stale
+        self._epoch = 0
+        self._condition = threading.Condition()
+        # (monotonic time, limit) every time the integer limit changes
+        self.history: deque[tuple[float, int]] = deque(maxlen=history_size)
+        self._record()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> int:
+        """Wait for a free slot and return the epoch to pass back to release()."""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+            self._publish()
+            return self._epoch
+
+    def release(self, latency: Optional[float], error: bool = False, epoch: Optional[int] = None) -> None:
+        """Free a slot. A latency of None frees it without a sample, after an error unrelated to load."""
+        with self._condition:
+            saturated = self._in_flight >= int(self._limit)
+            self._in_flight -= 1
+            previous = int(self._limit)
+            if epoch is not None and epoch != self._epoch:
+                pass  # started under an older limit, says nothing about the current one
+            elif error:
+                self._decrease()
+            elif latency is not None:
+                self._on_success(latency, saturated)
+            if int(self._limit) != previous:
+                self._record()
+            self._publish()
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one concurrency slot for the duration of a backend call."""
+        epoch = self.acquire()
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            if is_transient_error(e):
+                self.release(time.perf_counter() - started, error=True, epoch=epoch)
+            else:
+                self.release(None, epoch=epoch)
+            raise
+        self.release(time.perf_counter() - started, epoch=epoch)
+
+    def _on_success(self, latency: float, saturated: bool) -> None:
+        self._recent.append(latency)
+        self._baseline_samples.append(latency)
+        self._since_decrease += 1
+        baseline = min(self._baseline_samples)
+        if len(self._recent) >= self._window // 2 and self._since_decrease >= self._limit:
+            ordered = sorted(self._recent)
+            tail = ordered[min(len(ordered) - 1, math.ceil(len(ordered) * 0.9) - 1)]
+            if tail > baseline * self.tolerance:
+                self._decrease()
+                return
+        if saturated:
+            # Only grow while the current limit is actually being used
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+    def _decrease(self) -> None:
+        self._epoch += 1
+        self._limit = max(float(self.min_limit), self._limit * self.backoff)
+        self._since_decrease = 0
+        self._recent.clear()
+
+    def _record(self) -> None:
+        self.history.append((time.monotonic(), int(self._limit)))
+
+    def _publish(self) -> None:
+        if self.metrics is not None:
+            self.metrics.set_gauge("concurrency_limit", int(self._limit))
+            self.metrics.set_gauge("in_flight", self._in_flight)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._condition:
+            return {"limit": int(self._limit), "in_flight": self._in_flight, "history": list(self.history)}
+
+
+def main() -> None:
+    """Drive the limiter against a simulated backend whose capacity changes over time."""
+    from concurrent.futures import ThreadPoolExecutor
+    from src.core.pipeline.translation_pipeline import TranslationPipeline
+    from src.services.echo_services import SimulatedCapacityBackend
+
+    backend = SimulatedCapacityBackend(schedule=[(0.0, 8), (3.0, 2), (6.0, 12)], base_latency=0.02)
+    pipeline = TranslationPipeline(backend, batch_size=1)
+    pipeline.cache.max_entries = 0
+    counter = iter(range(10 ** 9))
+    deadline = time.monotonic() + 9.0
+
+    def client() -> None:
+        while time.monotonic() < deadline:
+            try:
+                pipeline.translate(f"segment {next(counter)}", "en", "es")
+            except RuntimeError:
+                pass
+
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        for _ in range(32):
+            pool.submit(client)
+        while time.monotonic() < deadline:
+            time.sleep(1.0)
+            counters = pipeline.metrics.snapshot()["counters"]
+            print(f"t={backend.elapsed():4.1f}s capacity={backend.capacity():2d} "
+                  f"limit={pipeline.limiter.limit:2d} ok={counters.get('backend_calls', 0):5d} "
+                  f"errors={counters.get('backend_errors', 0):4d}")
+
+
+if __name__ == "__main__":
+    main()
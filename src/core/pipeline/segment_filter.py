@@ -0,0 +1,97 @@
+"""
+Pre-translation normalization and skip rules.
+
+Runs in front of the backend for every batch. A normalized key, with
+horizontal whitespace collapsed, lets segments that differ only in spacing
+share one cache entry; the backend still receives the original text. Segments
+that need no translation (page numbers, numerals and other lines without
+letters, URLs, e-mail addresses, source code, and text already written in
+the target language) pass through unchanged without reaching the backend.
+"""
+
+import re
+from typing import Optional
+from src.config.settings import get_segment_filter
+from src.services.local_language_detector import detect_language_local
+
+_INVISIBLE_RE = re.compile("[\u200b\u200c\u200d\u2060\ufeff\u00ad]")
+_HORIZONTAL_WHITESPACE_RE = re.compile(r"[^\S\r\n]+")
+_LEADING_RE = re.compile(r"^\s*")
+_TRAILING_RE = re.compile(r"\s*$")
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
+_PAGE_LABEL = r"(?:page|p[áa]gina|pag|p|seite|стр|страница)"
+_ROMAN = r"M{0,4}(?:CM|CD|D?C{0,3})(?:XC|XL|L?X{0,3})(?:IX|IV|V?I{0,3})"
+# Without a page label only short numerals made of I, V and X count, so that words
+# and acronyms that happen to be valid numerals (MIX, DC, DIV, CD) are translated
+_SHORT_ROMAN = r"(?=[XVI]{2,5}\.?$)X{0,3}(?:IX|IV|V?I{0,3})"
+
+# Skip rules, checked in order against the normalized segment
+SKIP_RULES: tuple[tuple[str, re.Pattern[str]], ...] = (
+    ("page_number", re.compile(
+        rf"^(?:{_PAGE_LABEL}\.?\s*)?\d+(?:\s*(?:/|of|de|von|из)\s*\d+)?$"
+        r"|^-\s*\d+\s*-$"
+        rf"|^{_PAGE_LABEL}(?:\.\s*|\s+)(?=[MDCLXVI]+$)(?-i:{_ROMAN}|{_ROMAN.lower()})$"
+        rf"|^(?-i:{_SHORT_ROMAN}|{_SHORT_ROMAN.lower()})\.?$",
+        re.IGNORECASE)),
+    ("url", re.compile(r"^(?:(?:https?|ftp)://|www\.)\S+$", re.IGNORECASE)),
+    ("email", re.compile(r"^(?:mailto:)?[\w.+-]+@[\w-]+(?:\.[\w-]+)+$", re.IGNORECASE)),
+    ("code", re.compile(
+        r"^(?:#include\s*[<\"]|#!/"
+        r"|import\s+(?:static\s+)?\w+(?:\.\w+)+(?:\.\*)?(?:\s+as\s+\w+)?;?$|import\s+\w+(?:\s+as\s+\w+)?;$"
+        r"|from\s+(?:\.+[\w.]*|\w+(?:\.\w+)+)\s+import\s+(?:\*|\(|\w+(?:\s+as\s+\w+)?(?:\s*,\s*\w+(?:\s+as\s+\w+)?)*)$"
+        r"|(?:def|class|function|fn|func)\s+\w+\s*[(:{<]|(?:const|let|var)\s+\w+\s*=|return\b.*;$"
+        r"|(?:public|private|protected|static)\s+[\w<>\[\]]+\s+\w+\s*\("
+        r"|(?:if|for|while|switch|else|try|catch)\b.*\{$|.*\)\s*\{$|\}(?:\s*(?:else|catch|finally)\b.*)?;?$"
+        r"|[\w$]+(?:\.[\w$]+)*\([^()]*\);$|[\w$]+(?:\.[\w$]+)+\([^()]*\)$"
+        r"|>>> (?:[\w.]+\s*[(\[=+\-*/%<>!]|\d|import\s+\w|from\s+[\w.]+\s+import\s|[\[{(\"']))")),
+)
+
+
+class SegmentFilter:
+    """Normalizes segments and decides which of them can skip the backend."""
+
+    def __init__(self, target_confidence: float = 0.99, min_letters: int = 20) -> None:
+        # Passing through text in the wrong language is worse than one wasted call,
+        # so the target-language rule is stricter than the tiered detector
+        self.target_confidence = target_confidence
+        self.min_letters = min_letters
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Key used for skipping and caching: invisible characters dropped, horizontal
+        whitespace collapsed within each line, line breaks kept."""
+        lines = _INVISIBLE_RE.sub("", text).splitlines()
+        return "\n".join(_HORIZONTAL_WHITESPACE_RE.sub(" ", line).strip() for line in lines).strip()
+
+    @staticmethod
+    def restore(original: str, translation: str) -> str:
+        """Give a translation the leading and trailing whitespace of its original, which backends tend to drop."""
+        leading = _LEADING_RE.match(original)
+        trailing = _TRAILING_RE.search(original)
+        prefix = leading.group() if leading else ""
+        if prefix == original:
+            return original
+        suffix = trailing.group() if trailing else ""
+        return f"{prefix}{translation.strip()}{suffix}"
+
+    def skip_reason(self, segment: str, input_lang: str, output_lang: str) -> Optional[str]:
+        """Name of the rule that makes a normalized segment skip translation, or None."""
+        if not segment:
+            return "empty"
+        letters = len(_LETTER_RE.findall(segment))
+        if not letters:
+            return "no_letters"
+        for reason, pattern in SKIP_RULES:
+            if pattern.search(segment):
+                return reason
+        if letters >= self.min_letters and input_lang != output_lang:
+            lang, confidence = detect_language_local(segment)
+            if lang == output_lang and confidence >= self.target_confidence:
+                return "target_language"
+        return None
+
+
+def create_segment_filter() -> Optional[SegmentFilter]:
+    """Filter configured by the environment, None when TRANSLATOR_SEGMENT_FILTER is off."""
+    return SegmentFilter() if get_segment_filter() else None
@@ -0,0 +1,46 @@
+from threading import Lock
+from typing import Any
+
+class TranslationMetrics:
+    """Counters and timings shared by every stage of the translation pipeline."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._counters: dict[str, int] = {}
+        # name -> [count, total seconds, max seconds]
+        self._timings: dict[str, list[float]] = {}
+        self._gauges: dict[str, float] = {}
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            timing = self._timings.setdefault(name, [0, 0.0, 0.0])
+            timing[0] += 1
+            timing[1] += seconds
+            timing[2] = max(timing[2], seconds)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def get(self, name: str) -> int:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of all counters and timing summaries."""
+        with self._lock:
+            timings = {
+                name: {"count": int(count), "total": total, "avg": total / count if count else 0.0, "max": peak}
+                for name, (count, total, peak) in self._timings.items()
+            }
+            return {"counters": dict(self._counters), "timings": timings, "gauges": dict(self._gauges)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+            self._gauges.clear()
@@ -0,0 +1,217 @@
+import random
+import time
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from threading import Lock, get_ident
+from typing import Any, Optional, Tuple, cast
+from src.config.settings import get_backend_retries, get_batch_size, get_cache_size
+from src.core.help.profiling import is_sampling, working_for
+from src.core.interfaces.translation_backend_interface import TranslationBackendInterface
+from src.core.pipeline.adaptive_concurrency import AdaptiveConcurrencyLimiter, is_transient_error
+from src.core.pipeline.glossary import get_glossary, has_glossary_for
+from src.core.pipeline.segment_filter import SegmentFilter, create_segment_filter
+from src.core.pipeline.translation_cache import TranslationCache
+from src.core.pipeline.translation_metrics import TranslationMetrics
+from src.services.local_language_detector import detect_language_tiered
+
+# Delay before the first retry of a failed backend call; doubled on every further attempt
+RETRY_BASE_DELAY = 0.2
+
+class TranslationPipeline:
+    """Batching, caching and metrics layer shared by every translation backend."""
+
+    def __init__(self, backend: TranslationBackendInterface, cache: Optional[TranslationCache] = None,
+                 metrics: Optional[TranslationMetrics] = None, batch_size: Optional[int] = None,
+                 limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+                 segment_filter: Optional[SegmentFilter] = None, retries: Optional[int] = None) -> None:
+        self.backend = backend
+        self.cache = cache if cache is not None else TranslationCache(get_cache_size())
+        self.metrics = metrics if metrics is not None else TranslationMetrics()
+        self.batch_size = batch_size or get_batch_size()
+        self.limiter = limiter if limiter is not None else AdaptiveConcurrencyLimiter(metrics=self.metrics)
+        self.segment_filter = segment_filter if segment_filter is not None else create_segment_filter()
+        self.retries = get_backend_retries() if retries is None else retries
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = Lock()
+
+    def translate_text_delegate(self, src_input: Tuple[str, str, str]) -> str:
+        text, input_lang, output_lang = src_input
+        return self.translate(text, input_lang, output_lang)
+
+    def translate(self, text: str, input_lang: str, output_lang: str) -> str:
+        return self.translate_batch([text], input_lang, output_lang)[0]
+
+    def detect_language(self, text: str) -> str:
+        """Detect with the local n-gram detector, asking the backend only when it is unsure."""
+        key = (text, "detect", "")
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        self.metrics.increment("detections")
+        started = time.perf_counter()
+        detected, used_backend = detect_language_tiered(text, self.backend.detect_language)
+        self.metrics.increment("detections_backend" if used_backend else "detections_local")
+        self.metrics.observe("detect_latency", time.perf_counter() - started)
+        self.cache.put(key, detected)
+        return detected
+
+    def translate_batch(self, texts: Sequence[str], input_lang: str, output_lang: str,
+                        counts: Optional[Counter[str]] = None) -> list[str]:
+        """Translate texts keeping their order; segments caught by the segment filter are passed through.
+
+        counts, when given, receives the "skipped" and "cache_hits" of this call alone, which
+        the shared metrics cannot tell apart from those of concurrent callers.
+        """
+        self.metrics.increment("segments_requested", len(texts))
+        if self.segment_filter is None:
+            return self._translate_with_glossary(texts, input_lang, output_lang, counts)
+        results = list(texts)
+        indices: list[int] = []
+        segments: list[str] = []
+        for index, text in enumerate(texts):
+            # The normalized form only decides skipping and caching; the backend gets the original text
+            reason = self.segment_filter.skip_reason(self.segment_filter.normalize(text), input_lang, output_lang)
+            if reason is None:
+                indices.append(index)
+                segments.append(text)
+            else:
+                self.metrics.increment("segments_skipped")
+                self.metrics.increment(f"skipped_{reason}")
+                if counts is not None:
+                    counts["skipped"] += 1
+        if segments:
+            translations = self._translate_with_glossary(segments, input_lang, output_lang, counts)
+            for index, translation in zip(indices, translations):
+                results[index] = self.segment_filter.restore(texts[index], translation)
+        return results
+
+    def translate_prepared(self, texts: Sequence[str], input_lang: str, output_lang: str) -> list[str]:
+        """Translate segments that already went through the segment filter and the glossary
+        (only the cache, the concurrency limiter and the backend are applied)."""
+        return self._translate_segments(texts, input_lang, output_lang)
+
+    def _translate_with_glossary(self, texts: Sequence[str], input_lang: str, output_lang: str,
+                                 counts: Optional[Counter[str]] = None) -> list[str]:
+        """Translate texts, keeping the approved terms of the language pair's glossary if it has one."""
+        if not has_glossary_for(output_lang):
+            return self._translate_segments(texts, input_lang, output_lang, counts)
+        # The glossary depends on the source language, so detected segments are grouped by it
+        by_language: dict[str, list[int]] = {}
+        for index, text in enumerate(texts):
+            source_lang = self.detect_language(text) if input_lang == "detect" else input_lang
+            by_language.setdefault(source_lang, []).append(index)
+        results: list[str] = [""] * len(texts)
+        for source_lang, indices in by_language.items():
+            glossary = get_glossary(source_lang, output_lang)
+            if glossary is None:
+                translated = self._translate_segments([texts[index] for index in indices], source_lang, output_lang,
+                                                      counts)
+            else:
+                protected = [glossary.protect(texts[index]) for index in indices]
+                translated = self._translate_segments([text for text, _ in protected], source_lang, output_lang,
+                                                      counts)
+                translated = [glossary.restore(translation, targets)
+                              for translation, (_, targets) in zip(translated, protected)]
+                self.metrics.increment("glossary_terms", sum(len(targets) for _, targets in protected))
+            for index, translation in zip(indices, translated):
+                results[index] = translation
+        return results
+
+    def _translate_segments(self, texts: Sequence[str], input_lang: str, output_lang: str,
+                            counts: Optional[Counter[str]] = None) -> list[str]:
+        """Translate texts keeping their order, sending only uncached unique segments to the backend.
+
+        With a segment filter, texts that only differ in horizontal whitespace share a
+        cache key and a single backend call.
+        """
+        normalize = self.segment_filter.normalize if self.segment_filter is not None else None
+        results: list[Optional[str]] = [None] * len(texts)
+        pending: dict[tuple[str, str], list[int]] = {}
+        for index, text in enumerate(texts):
+            source_lang = self.detect_language(text) if input_lang == "detect" else input_lang
+            if source_lang == output_lang:
+                results[index] = text
+                continue
+            key = normalize(text) if normalize is not None else text
+            cached = self.cache.get((key, source_lang, output_lang))
+            if cached is None:
+                pending.setdefault((key, source_lang), []).append(index)
+            else:
+                self.metrics.increment("cache_hits")
+                if counts is not None:
+                    counts["cache_hits"] += 1
+                results[index] = cached
+
+        by_language: dict[str, list[str]] = {}
+        for key, source_lang in pending:
+            by_language.setdefault(source_lang, []).append(key)
+
+        chunks: list[tuple[str, list[str]]] = [
+            (source_lang, keys[start:start + self.batch_size])
+            for source_lang, keys in by_language.items()
+            for start in range(0, len(keys), self.batch_size)
+        ]
+
+        # Backend threads are attributed to this one only while a stack sampler can use it
+        owner = get_ident() if is_sampling() else None
+
+        def call(chunk: tuple[str, list[str]]) -> list[str]:
+            # The first original text of each key is what the backend sees
+            source_lang, keys = chunk
+            with working_for(owner) if owner is not None else nullcontext():
+                return self._call_backend([texts[pending[(key, source_lang)][0]] for key in keys],
+                                          source_lang, output_lang)
+
+        if len(chunks) == 1:
+            outputs = [call(chunks[0])]
+        else:
+            # Chunks run concurrently; the adaptive limiter decides how many are in flight
+            outputs = list(self._get_executor().map(call, chunks))
+        for (source_lang, keys), translated in zip(chunks, outputs):
+            for key, translation in zip(keys, translated):
+                self.cache.put((key, source_lang, output_lang), translation)
+                for index in pending[(key, source_lang)]:
+                    results[index] = translation
+        return cast(list[str], results)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Metrics of the pipeline together with the concurrency limit and its history."""
+        snapshot = self.metrics.snapshot()
+        snapshot["concurrency"] = self.limiter.snapshot()
+        return snapshot
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.limiter.max_limit,
+                                                    thread_name_prefix="translation-backend")
+            return self._executor
+
+    def _call_backend(self, texts: list[str], input_lang: str, output_lang: str) -> list[str]:
+        attempt = 0
+        while True:
+            try:
+                with self.limiter.slot():
+                    started = time.perf_counter()
+                    try:
+                        translated = self.backend.translate_batch(texts, input_lang, output_lang)
+                    except Exception:
+                        self.metrics.increment("backend_errors")
+                        raise
+                    finally:
+                        self.metrics.observe("backend_latency", time.perf_counter() - started)
+                break
+            except Exception as e:
+                if attempt >= self.retries or not is_transient_error(e):
+                    raise
+                # The limiter has already cut the limit; back off (with jitter) before trying again
+                self.metrics.increment("backend_retries")
+                time.sleep(RETRY_BASE_DELAY * 2 ** attempt * random.uniform(0.5, 1.0))
+                attempt += 1
+        if len(translated) != len(texts):
+            raise RuntimeError(f"Backend '{self.backend.name}' returned {len(translated)} segments for {len(texts)}")
+        self.metrics.increment("backend_calls")
+        self.metrics.increment("backend_segments", len(texts))
+        return translated
@@ -1,8 +1,10 @@
 from src.config.i18n import get_text, get_available_languages
+from collections.abc import Iterable
 from typing import Any, Optional
 from src.core.interfaces.text_translator_interface import TextTranslatorInterface
 from src.core.interfaces.file_translator_interface import FileTranslatorInterface
 from src.core.interfaces.phonetic_transcription_interface import PhoneticTranscriptionInterface
+from src.core.jobs.translation_job import FileTranslationResult, ProgressCallback, TranslationJob
 
 class TranslatorApp:
     def __init__(self, lang: str, text_translator: TextTranslatorInterface, file_translator: FileTranslatorInterface, phonetic_transcriber: Optional[PhoneticTranscriptionInterface] = None) -> None:
@@ -22,12 +24,33 @@ class TranslatorApp:
 
     def translate_file(self, file_path: str) -> str:
         return self._file_interface.translate_file(file_path, self._entry_lang, self._output_lang)
+
+    def submit_file(self, file_path: str, on_progress: Optional[ProgressCallback] = None,
+                    profile: Optional[str] = None) -> TranslationJob:
+        """Start translating a file in the background and return its job handle.
+
+        profile selects a profiler mode for this job (see help.profiling); by default
+        TRANSLATOR_PROFILE decides.
+        """
+        job = TranslationJob(self._file_interface, file_path, self._entry_lang, self._output_lang, on_progress,
+                             profile)
+        return job.submit()
+
+    async def translate_files_async(self, file_paths: Iterable[str]) -> list[FileTranslationResult]:
+        """Translate several files, overlapping file I/O with translation where supported."""
+        return await self._file_interface.translate_files_async(file_paths, self._entry_lang, self._output_lang)
     
     def transcribe_to_ipa(self, text: str) -> str:
         """Transcribe text to IPA phonetic notation."""
         if not self._phonetic_interface:
             raise RuntimeError("Phonetic transcription service not available")
         return self._phonetic_interface.transcribe_to_ipa(text, self._accent)
+
+    def transcribe_file(self, file_path: str) -> str:
+        """Transcribe a whole document to IPA phonetic notation."""
+        if not self._phonetic_interface:
+            raise RuntimeError("Phonetic transcription service not available")
+        return self._phonetic_interface.transcribe_file(file_path, self._accent)
     
     def get_supported_accents(self) -> list[str]:
         """Get list of supported phonetic accents."""
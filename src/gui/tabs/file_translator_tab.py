@@ -40,6 +40,9 @@ class FileTranslatorTab(TabInterface):
         self.btn_file: ctk.CTkButton = None
         self.btn_translate_file: ctk.CTkButton = None
         
+        # Trabajo de traducción en curso
+        self.job: Any = None
+        
     def render(self) -> None:
         """Renderiza el contenido de la pestaña de traducción de archivos."""
         self.content_frame = self.create_content_frame()
@@ -116,6 +119,10 @@ class FileTranslatorTab(TabInterface):
                 ("Text files", "*.txt"),
                 ("PDF files", "*.pdf"),
                 ("Word files", "*.docx"),
+                ("Web files", "*.html *.htm *.xhtml *.xml"),
+                ("Markdown files", "*.md *.markdown"),
+                ("Subtitle files", "*.srt *.vtt"),
+                ("CSV files", "*.csv *.tsv"),
                 ("All files", "*.*")
             ]
         )
@@ -129,7 +136,7 @@ class FileTranslatorTab(TabInterface):
             )
             
     def translate_file(self) -> None:
-        """Traduce el archivo seleccionado."""
+        """Lanza la traducción del archivo seleccionado en segundo plano."""
         if not self.file_path:
             messagebox.showwarning(
                 "No file selected", 
@@ -140,13 +147,38 @@ class FileTranslatorTab(TabInterface):
         self._disable_translate_btn()
         
         try:
-            result: str = self.app.translate_file(self.file_path)
-            messagebox.showinfo(self.t["translation"], result)
+            self.job = self.app.submit_file(self.file_path)
         except Exception as e:
-            error_msg = f"Error translating file: {e}"
-            messagebox.showerror("Error", error_msg)
-        finally:
+            messagebox.showerror("Error", f"Error translating file: {e}")
             self._enable_translate_btn()
+            return
+        self.parent_frame.after(100, self._poll_job)
+        
+    def cancel_translation(self) -> None:
+        """Cancela el trabajo de traducción en curso."""
+        if self.job is not None:
+            self.job.cancel()
+            self.btn_translate_file.configure(state="disabled", text=self.t["cancelling"])
+            
+    def _poll_job(self) -> None:
+        """Actualiza el progreso en el hilo de la interfaz hasta que el trabajo termina."""
+        if self.job is None:
+            return
+        if not self.job.done():
+            progress = self.job.last_progress
+            if progress is not None and progress.stage == "translate":
+                percent = f"{progress.fraction:.0%}"
+                self.btn_translate_file.configure(text=self.t["cancel_progress"].format(percent=percent))
+            self.parent_frame.after(100, self._poll_job)
+            return
+        
+        result = self.job.result()
+        self.job = None
+        self._enable_translate_btn()
+        if result.status in ("completed", "cancelled"):
+            messagebox.showinfo(self.t["translation"], result.message)
+        else:
+            messagebox.showerror("Error", result.message)
             
     def set_entry_language_file(self, lang: str) -> None:
         """
@@ -175,11 +207,13 @@ class FileTranslatorTab(TabInterface):
             self.btn_file.configure(text=filename)
             
     def _disable_translate_btn(self) -> None:
-        """Deshabilita el botón de traducir durante el proceso."""
-        self.btn_translate_file.configure(state="disabled", text="Translating...")
+        """Convierte el botón de traducir en botón de cancelar durante el proceso."""
+        self.btn_translate_file.configure(text=self.t["cancel"], command=self.cancel_translation)
+        self.btn_file.configure(state="disabled")
         self.parent_frame.master.update_idletasks()
         
     def _enable_translate_btn(self) -> None:
         """Rehabilita el botón de traducir."""
-        self.btn_translate_file.configure(state="normal", text=self.t["translate_file"])
+        self.btn_translate_file.configure(state="normal", text=self.t["translate_file"], command=self.translate_file)
+        self.btn_file.configure(state="normal")
         self.parent_frame.master.update_idletasks()
\ No newline at end of file
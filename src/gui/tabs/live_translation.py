@@ -0,0 +1,107 @@
+"""
+Traducción en vivo mientras el usuario escribe.
+
+Agrupa las pulsaciones con un debounce, traduce el texto párrafo a párrafo
+(los que no cambiaron salen de la caché del pipeline), descarta las
+peticiones obsoletas y entrega los resultados en el hilo de la interfaz.
+"""
+
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+
+class LiveTranslationController:
+    """Coordina las traducciones en vivo de un textbox."""
+
+    def __init__(self, widget: Any, translate: Callable[[str], str], apply: Callable[[str], None],
+                 delay_ms: int = 400, poll_ms: int = 50) -> None:
+        """
+        Inicializa el controlador.
+
+        Args:
+            widget: Widget de Tk usado para programar callbacks (after/after_cancel)
+            translate: Función que traduce un párrafo
+            apply: Función que muestra el texto traducido, llamada en el hilo de la interfaz
+            delay_ms: Tiempo sin pulsaciones antes de traducir
+            poll_ms: Intervalo de consulta de resultados del hilo de trabajo
+        """
+        self.widget = widget
+        self.translate = translate
+        self.apply = apply
+        self.delay_ms = delay_ms
+        self.poll_ms = poll_ms
+        # A single worker bounds the request rate to one in-flight translation
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="live-translation")
+        self._results: queue.Queue[tuple[int, Optional[str]]] = queue.Queue()
+        self._generation = 0
+        self._pending_after: Optional[str] = None
+        self._in_flight = 0
+        self._get_text: Callable[[], str] = lambda: ""
+        self._closed = False
+
+    def on_text_changed(self, get_text: Callable[[], str]) -> None:
+        """Reinicia el debounce; llamado en cada pulsación."""
+        if self._closed:
+            return
+        self._get_text = get_text
+        self._generation += 1  # any translation still running is now obsolete
+        if self._pending_after is not None:
+            self.widget.after_cancel(self._pending_after)
+        self._pending_after = self.widget.after(self.delay_ms, self._submit)
+
+    def cancel(self) -> None:
+        """Descarta el debounce pendiente y las traducciones en curso."""
+        self._generation += 1
+        if self._pending_after is not None:
+            self.widget.after_cancel(self._pending_after)
+            self._pending_after = None
+
+    def shutdown(self) -> None:
+        """Cancela lo pendiente y detiene el hilo de trabajo; llamado al destruir la pestaña."""
+        self.cancel()
+        self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self) -> None:
+        self._pending_after = None
+        generation = self._generation
+        paragraphs = self._get_text().split("\n")
+        if not any(paragraph.strip() for paragraph in paragraphs):
+            self.apply("\n".join(paragraphs))
+            return
+        self._executor.submit(self._translate_paragraphs, generation, paragraphs)
+        self._in_flight += 1
+        if self._in_flight == 1:
+            self.widget.after(self.poll_ms, self._poll)
+
+    def _translate_paragraphs(self, generation: int, paragraphs: list[str]) -> None:
+        """Se ejecuta en el hilo de trabajo; abandona en cuanto la petición queda obsoleta."""
+        try:
+            translated: list[str] = []
+            for paragraph in paragraphs:
+                if generation != self._generation:
+                    self._results.put((generation, None))
+                    return
+                translated.append(self.translate(paragraph) if paragraph.strip() else paragraph)
+            self._results.put((generation, "\n".join(translated)))
+        except Exception as e:
+            self._results.put((generation, f"Error: {str(e)}"))
+
+    def _poll(self) -> None:
+        """Aplica en el hilo de la interfaz el último resultado vigente."""
+        if self._closed:
+            return
+        latest: Optional[str] = None
+        while True:
+            try:
+                generation, text = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._in_flight -= 1
+            if generation == self._generation and text is not None:
+                latest = text
+        if latest is not None:
+            self.apply(latest)
+        if self._in_flight > 0:
+            self.widget.after(self.poll_ms, self._poll)
@@ -4,9 +4,10 @@ Pestaña de traducción de texto.
 Maneja la funcionalidad de traducir texto directo introducido por el usuario.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 import customtkinter as ctk
 from .tab_interface import TabInterface
+from .live_translation import LiveTranslationController
 
 
 class TextTranslatorTab(TabInterface):
@@ -38,6 +39,11 @@ class TextTranslatorTab(TabInterface):
         self.entry: ctk.CTkTextbox = None
         self.result_textbox: ctk.CTkTextbox = None
         self.btn_translate: ctk.CTkButton = None
+        self.live_switch: ctk.CTkSwitch = None
+        
+        # Traducción en vivo (opcional)
+        self.live_var: ctk.BooleanVar = None
+        self.live_controller: Optional[LiveTranslationController] = None
         
     def render(self) -> None:
         """Renderiza el contenido de la pestaña de traducción de texto."""
@@ -47,6 +53,8 @@ class TextTranslatorTab(TabInterface):
         self._create_input_section()
         self._create_translate_button()
         self._create_result_section()
+        # Detiene el hilo de la traducción en vivo al cerrar la pestaña o la ventana
+        self.content_frame.bind("<Destroy>", self._on_destroy, add="+")
         
     def _create_language_selection(self) -> None:
         """Crea la sección de selección de idiomas."""
@@ -100,7 +108,16 @@ class TextTranslatorTab(TabInterface):
             self.t["translate"],
             self.translate_text
         )
-        self.btn_translate.pack(pady=15)
+        self.btn_translate.pack(pady=(15, 5))
+        
+        self.live_var = ctk.BooleanVar(value=False)
+        self.live_switch = ctk.CTkSwitch(
+            self.content_frame,
+            text=self.t["live_translation"],
+            variable=self.live_var,
+            command=self.toggle_live_mode
+        )
+        self.live_switch.pack(pady=(0, 10))
         
     def _create_result_section(self) -> None:
         """Crea la sección de resultados."""
@@ -135,6 +152,42 @@ class TextTranslatorTab(TabInterface):
         finally:
             self._enable_translate_btn()
             
+    def toggle_live_mode(self) -> None:
+        """Activa o desactiva la traducción en vivo."""
+        if self.live_var.get():
+            if self.live_controller is None:
+                self.live_controller = LiveTranslationController(
+                    self.content_frame,
+                    self.app.translate_text,
+                    self._show_result
+                )
+            self.entry.bind("<KeyRelease>", self._on_entry_changed)
+            self.entry.bind("<<Paste>>", self._on_entry_changed, add="+")
+            self.btn_translate.configure(state="disabled")
+            self._on_entry_changed()
+        else:
+            self.entry.unbind("<KeyRelease>")
+            self.entry.unbind("<<Paste>>")
+            if self.live_controller is not None:
+                self.live_controller.cancel()
+            self.btn_translate.configure(state="normal")
+            
+    def _on_entry_changed(self, event: Any = None) -> None:
+        """Reprograma la traducción en vivo tras una pulsación."""
+        if self.live_controller is not None and self.live_var.get():
+            self.live_controller.on_text_changed(lambda: self.entry.get("1.0", "end-1c"))
+            
+    def _on_destroy(self, event: Any = None) -> None:
+        """Libera el controlador de traducción en vivo."""
+        if self.live_controller is not None:
+            self.live_controller.shutdown()
+            self.live_controller = None
+            
+    def _show_result(self, result: str) -> None:
+        """Muestra el resultado en el textbox de resultados."""
+        self.result_textbox.delete("1.0", "end")
+        self.result_textbox.insert("1.0", result)
+        
     def set_entry_language(self, lang: str) -> None:
         """
         Establece el idioma de entrada.
@@ -143,6 +196,7 @@ class TextTranslatorTab(TabInterface):
             lang: Código del idioma en mayúsculas
         """
         self.app.entry_language = lang.lower()
+        self._on_entry_changed()
         
     def set_output_language(self, lang: str) -> None:
         """
@@ -152,6 +206,7 @@ class TextTranslatorTab(TabInterface):
             lang: Código del idioma en mayúsculas
         """
         self.app.output_language = lang.lower()
+        self._on_entry_changed()
         
     def _disable_translate_btn(self) -> None:
         """Deshabilita el botón de traducir durante el proceso."""
@@ -160,5 +215,6 @@ class TextTranslatorTab(TabInterface):
         
     def _enable_translate_btn(self) -> None:
         """Rehabilita el botón de traducir."""
-        self.btn_translate.configure(state="normal", text=self.t["translate"])
+        state = "disabled" if self.live_var is not None and self.live_var.get() else "normal"
+        self.btn_translate.configure(state=state, text=self.t["translate"])
         self.parent_frame.master.update_idletasks()
\ No newline at end of file
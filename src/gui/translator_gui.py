@@ -1,14 +1,15 @@
 import customtkinter as ctk
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from src.core.factories.translator_factory import create_translator_app
 from src.gui.tabs import TextTranslatorTab, FileTranslatorTab
 
 class TranslatorGUI:
     """Interfaz gráfica principal del traductor."""
     
-    def __init__(self, lang: str = "en") -> None:
+    def __init__(self, lang: str = "en", backend: Optional[str] = None,
+                 incremental: Optional[bool] = None) -> None:
         """Inicializa la interfaz gráfica del traductor."""
-        self.app = create_translator_app(lang)
+        self.app = create_translator_app(lang, backend, incremental)
         self.t: Dict[str, Any] = self.app.t
         self.entry_languages = [lang.upper() for lang in self.app.languages] + ["DETECT"]
         self.output_languages = [lang.upper() for lang in self.app.languages]
@@ -0,0 +1,71 @@
+import time
+from collections.abc import Sequence
+from threading import Lock
+from typing import Optional
+from src.core.interfaces.translation_backend_interface import TranslationBackendInterface
+
+class EchoBackend(TranslationBackendInterface):
+    """Null backend that returns every segment unchanged, used for load testing the pipeline."""
+
+    name = "echo"
+
+    def __init__(self, latency: float = 0.0, default_lang: str = "en") -> None:
+        self.latency = latency
+        self.default_lang = default_lang
+
+    def translate(self, text: str, input_lang: str, output_lang: str) -> str:
+        return self.translate_batch([text], input_lang, output_lang)[0]
+
+    def detect_language(self, text: str) -> str:
+        return self.default_lang
+
+    def translate_batch(self, texts: Sequence[str], input_lang: str, output_lang: str) -> list[str]:
+        if self.latency:
+            time.sleep(self.latency)
+        return list(texts)
+
+
+class SimulatedCapacityBackend(EchoBackend):
+    """Echo backend that emulates a remote service whose capacity changes over time.
+
+    Up to capacity() concurrent requests are served at base_latency; beyond that
+    latency grows with the overload, and past twice the capacity requests are
+    rejected as throttled.
+    """
+
+    name = "simulated"
+
+    def __init__(self, schedule: Optional[list[tuple[float, int]]] = None, base_latency: float = 0.02) -> None:
+        super().__init__()
+        # (seconds since start, capacity) steps
+        self.schedule = schedule or [(0.0, 8)]
+        self.base_latency = base_latency
+        self._started = time.monotonic()
+        self._active = 0
+        self._lock = Lock()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    def capacity(self) -> int:
+        elapsed = self.elapsed()
+        current = self.schedule[0][1]
+        for start, capacity in self.schedule:
+            if elapsed >= start:
+                current = capacity
+        return current
+
+    def translate_batch(self, texts: Sequence[str], input_lang: str, output_lang: str) -> list[str]:
+        with self._lock:
+            self._active += 1
+            active = self._active
+        try:
+            capacity = self.capacity()
+            if active > 2 * capacity:
+                time.sleep(self.base_latency / 4)
+                raise RuntimeError("Too many requests")
+            time.sleep(self.base_latency * max(1.0, active / capacity) ** 2)
+            return list(texts)
+        finally:
+            with self._lock:
+                self._active -= 1
@@ -1,5 +1,8 @@
+from collections.abc import Sequence
 from googletrans import Translator
 from typing import Any, Tuple, cast
+from src.core.interfaces.translation_backend_interface import TranslationBackendInterface
+from src.services.local_language_detector import detect_language_tiered
 
 translator = Translator()
 
@@ -12,7 +15,8 @@ def translate_text(text: str, input_lang: str, output_lang: str) -> str:
     return cast(str, translated.text)
 
 def translate_text_with_detection(text: str, output_lang: str) -> str:
-    detected_lang = detect_language(text)
+    # The remote detect() is only called when the local detector is not confident
+    detected_lang, _ = detect_language_tiered(text, detect_language)
     return translate_text(text, detected_lang, output_lang)
 
 def translate_text_delegate(src_input: Tuple[str, str, str]) -> str:
@@ -21,6 +25,23 @@ def translate_text_delegate(src_input: Tuple[str, str, str]) -> str:
         return translate_text_with_detection(text, output_lang)
     return translate_text(text, input_lang, output_lang)
 
+class GoogletransBackend(TranslationBackendInterface):
+    """Backend that delegates to the Google Translate web API through googletrans."""
+
+    name = "googletrans"
+
+    def translate(self, text: str, input_lang: str, output_lang: str) -> str:
+        return translate_text(text, input_lang, output_lang)
+
+    def detect_language(self, text: str) -> str:
+        return detect_language(text)
+
+    def translate_batch(self, texts: Sequence[str], input_lang: str, output_lang: str) -> list[str]:
+        if not texts:
+            return []
+        translated: Any = translator.translate(list(texts), src=input_lang, dest=output_lang)
+        return [cast(str, item.text) for item in translated]
+
 def main() -> None:
     text, input_lang, output_lang = ("Hello, how are you?", "en", "es")
     translated_text = translate_text_delegate((text, input_lang, output_lang))
@@ -0,0 +1,133 @@
+"""
+Offline translation backend based on local phrase tables.
+
+Phrase tables are JSON objects mapping lowercase source phrases to their
+translation, stored as ``<input_lang>-<output_lang>.json``. Lookup is a greedy
+longest-match over word n-grams, so multi-word entries win over single words.
+"""
+
+import json
+import os
+import re
+from collections.abc import Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+from src.config.settings import get_phrase_table_dir
+from src.core.interfaces.translation_backend_interface import TranslationBackendInterface
+
+DEFAULT_PHRASE_TABLE_DIR = Path(__file__).parent.parent.parent / "translations" / "phrase_tables"
+
+_TOKEN_RE = re.compile(r"\w+(?:'\w+)*|\s+|[^\w\s]", re.UNICODE)
+
+
+def _match_case(source: str, translation: str) -> str:
+    if source.isupper() and len(source) > 1:
+        return translation.upper()
+    if source[:1].isupper():
+        return translation[:1].upper() + translation[1:]
+    return translation
+
+
+class PhraseTable:
+    """In-memory phrase table with longest-match lookup."""
+
+    def __init__(self, entries: dict[str, str]) -> None:
+        self.entries: dict[str, str] = {key.lower(): value for key, value in entries.items()}
+        self.max_words: int = max((len(key.split()) for key in self.entries), default=1)
+        self.vocabulary: frozenset[str] = frozenset(
+            word for key in self.entries for word in key.split()
+        )
+
+    def translate(self, text: str) -> str:
+        tokens: list[str] = _TOKEN_RE.findall(text)
+        # Token classes and lowercase forms are computed once for the whole segment
+        lowered: list[str] = [token.lower() for token in tokens]
+        is_word: list[bool] = [token[0].isalnum() or token[0] == "_" for token in tokens]
+        is_space: list[bool] = [token.isspace() for token in tokens]
+        output: list[str] = []
+        index, total = 0, len(tokens)
+        while index < total:
+            if not is_word[index]:
+                output.append(tokens[index])
+                index += 1
+                continue
+            end, translation = self._longest_match(lowered, is_word, is_space, index, total)
+            if translation is None:
+                output.append(tokens[index])
+                index += 1
+            else:
+                output.append(_match_case(tokens[index], translation))
+                index = end
+        return "".join(output)
+
+    def _longest_match(self, lowered: list[str], is_word: list[bool], is_space: list[bool],
+                       start: int, total: int) -> tuple[int, Optional[str]]:
+        # Collect the run of words separated only by whitespace, up to max_words
+        positions = [start]
+        cursor = start
+        while len(positions) < self.max_words and cursor + 2 < total \
+                and is_space[cursor + 1] and is_word[cursor + 2]:
+            cursor += 2
+            positions.append(cursor)
+        for size in range(len(positions), 0, -1):
+            key = " ".join(lowered[position] for position in positions[:size])
+            translation = self.entries.get(key)
+            if translation is not None:
+                return positions[size - 1] + 1, translation
+        return start + 1, None
+
+    def coverage(self, text: str) -> float:
+        """Fraction of the words in text known to this table as source words."""
+        words = [token.lower() for token in _TOKEN_RE.findall(text) if token[0].isalnum()]
+        if not words:
+            return 0.0
+        return sum(word in self.vocabulary for word in words) / len(words)
+
+
+@lru_cache(maxsize=32)
+def load_phrase_table(path: str) -> PhraseTable:
+    with open(path, 'r', encoding='utf-8') as f:
+        return PhraseTable(json.load(f))
+
+
+class LocalDictionaryBackend(TranslationBackendInterface):
+    """Fully offline backend that applies local phrase tables."""
+
+    name = "local"
+
+    def __init__(self, table_dir: Optional[str] = None, default_lang: str = "en") -> None:
+        self.table_dir = Path(table_dir or get_phrase_table_dir() or DEFAULT_PHRASE_TABLE_DIR)
+        self.default_lang = default_lang
+
+    def available_pairs(self) -> list[tuple[str, str]]:
+        if not self.table_dir.is_dir():
+            return []
+        pairs: list[tuple[str, str]] = []
+        for name in sorted(os.listdir(self.table_dir)):
+            stem, extension = os.path.splitext(name)
+            if extension == ".json" and stem.count("-") == 1:
+                input_lang, output_lang = stem.split("-")
+                pairs.append((input_lang, output_lang))
+        return pairs
+
+    def get_table(self, input_lang: str, output_lang: str) -> PhraseTable:
+        path = self.table_dir / f"{input_lang}-{output_lang}.json"
+        if not path.is_file():
+            raise ValueError(f"No local phrase table for {input_lang} -> {output_lang}")
+        return load_phrase_table(str(path))
+
+    def translate(self, text: str, input_lang: str, output_lang: str) -> str:
+        return self.get_table(input_lang, output_lang).translate(text)
+
+    def translate_batch(self, texts: Sequence[str], input_lang: str, output_lang: str) -> list[str]:
+        table = self.get_table(input_lang, output_lang)
+        return [table.translate(text) for text in texts]
+
+    def detect_language(self, text: str) -> str:
+        best_lang, best_score = self.default_lang, 0.0
+        for input_lang, output_lang in self.available_pairs():
+            score = self.get_table(input_lang, output_lang).coverage(text)
+            if score > best_score:
+                best_lang, best_score = input_lang, score
+        return best_lang
@@ -0,0 +1,139 @@
+"""
+Local language pre-detector based on character n-gram profiles.
+
+Profiles for the supported languages are built once per process from the
+bundled sample corpus (translations/language_samples.json). Each known
+n-gram maps to a vector of per-language log-probabilities, so scoring a text
+is a column-wise sum of those vectors. Only low-confidence answers need the
+remote detect() call, see detect_language_tiered.
+"""
+
+import json
+import math
+import re
+import time
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from typing import Optional
+from src.config.settings import get_detect_confidence
+
+SAMPLES_PATH = Path(__file__).parent.parent.parent / "translations" / "language_samples.json"
+
+_NON_LETTERS_RE = re.compile(r"[\W\d_]+", re.UNICODE)
+
+# Profile size per language and n-gram orders used for scoring
+PROFILE_SIZE = 600
+NGRAM_ORDERS = (1, 2, 3)
+# Scales the mean log-likelihood difference into a posterior-like confidence
+SHARPNESS = 4.0
+
+
+def _ngrams(text: str) -> list[str]:
+    normalized = " " + _NON_LETTERS_RE.sub(" ", text.lower()).strip() + " "
+    grams: list[str] = []
+    for order in NGRAM_ORDERS:
+        grams.extend(normalized[index:index + order] for index in range(len(normalized) - order + 1))
+    return [gram for gram in grams if gram.strip()]
+
+
+class LocalLanguageDetector:
+    """Scores texts against precomputed n-gram profiles and reports a confidence."""
+
+    def __init__(self, training: dict[str, str]) -> None:
+        self.languages: list[str] = sorted(training)
+        profiles: dict[str, dict[str, float]] = {}
+        floors: dict[str, float] = {}
+        for lang in self.languages:
+            counts = Counter(_ngrams(training[lang]))
+            total = sum(counts.values()) + len(counts)
+            profiles[lang] = {gram: math.log((count + 1) / total) for gram, count in counts.most_common(PROFILE_SIZE)}
+            floors[lang] = math.log(0.5 / total)
+        # n-gram -> log-probability in every language, in self.languages order
+        self.vectors: dict[str, tuple[float, ...]] = {
+            gram: tuple(profiles[lang].get(gram, floors[lang]) for lang in self.languages)
+            for gram in set().union(*profiles.values())
+        }
+
+    @classmethod
+    def from_samples(cls, path: Path = SAMPLES_PATH) -> "LocalLanguageDetector":
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f)["train"])
+
+    def scores(self, text: str) -> tuple[list[float], int]:
+        """Summed log-probabilities per language and the number of known n-grams."""
+        vectors = [vector for vector in map(self.vectors.get, _ngrams(text)) if vector is not None]
+        if not vectors:
+            return [0.0] * len(self.languages), 0
+        return [sum(column) for column in zip(*vectors)], len(vectors)
+
+    def detect(self, text: str) -> tuple[Optional[str], float]:
+        """Return the most likely language and a confidence between 0 and 1."""
+        totals, known = self.scores(text)
+        if not known:
+            return None, 0.0
+        # Posterior over languages from the mean per-n-gram score, which keeps short texts uncertain
+        best = max(totals)
+        weights = [math.exp(SHARPNESS * (total - best) / math.sqrt(known)) for total in totals]
+        index = totals.index(best)
+        return self.languages[index], weights[index] / sum(weights)
+
+
+_detector: Optional[LocalLanguageDetector] = None
+
+
+def get_local_detector() -> LocalLanguageDetector:
+    global _detector
+    if _detector is None:
+        _detector = LocalLanguageDetector.from_samples()
+    return _detector
+
+
+def detect_language_local(text: str) -> tuple[Optional[str], float]:
+    return get_local_detector().detect(text)
+
+
+def detect_language_tiered(text: str, remote_detect: Callable[[str], str],
+                           threshold: Optional[float] = None) -> tuple[str, bool]:
+    """Detect locally and fall through to remote_detect only for low-confidence texts.
+
+    Returns the language and whether the remote detector was used.
+    """
+    threshold = get_detect_confidence() if threshold is None else threshold
+    lang, confidence = detect_language_local(text)
+    if lang is not None and confidence >= threshold:
+        return lang, False
+    return remote_detect(text), True
+
+
+def main() -> None:
+    """Benchmark accuracy against latency on the bundled test sentences."""
+    started = time.perf_counter()
+    detector = get_local_detector()
+    print(f"Profiles built in {(time.perf_counter() - started) * 1000:.1f} ms "
+          f"({len(detector.vectors)} n-grams, {len(detector.languages)} languages)")
+    with open(SAMPLES_PATH, 'r', encoding='utf-8') as f:
+        samples: dict[str, list[str]] = json.load(f)["test"]
+    cases = [(lang, text) for lang, texts in samples.items() for text in texts]
+
+    results: list[tuple[str, Optional[str], float]] = []
+    started = time.perf_counter()
+    for expected, text in cases:
+        detected, confidence = detector.detect(text)
+        results.append((expected, detected, confidence))
+    elapsed = time.perf_counter() - started
+    print(f"{len(cases)} texts, {elapsed / len(cases) * 1e6:.1f} us per detection")
+    print(f"{'threshold':>9} {'local':>7} {'local acc':>9} {'remote':>7}")
+    for threshold in (0.0, 0.5, 0.7, 0.8, 0.9, 0.95, 0.99):
+        answered = [(expected, detected) for expected, detected, confidence in results if confidence >= threshold]
+        correct = sum(expected == detected for expected, detected in answered)
+        accuracy = correct / len(answered) if answered else 1.0
+        print(f"{threshold:>9.2f} {len(answered) / len(cases):>7.0%} {accuracy:>9.1%} "
+              f"{1 - len(answered) / len(cases):>7.0%}")
+    for expected, detected, confidence in results:
+        if expected != detected:
+            print(f"  miss: expected {expected}, got {detected} ({confidence:.2f})")
+
+
+if __name__ == "__main__":
+    main()
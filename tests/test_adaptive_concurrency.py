@@ -0,0 +1,108 @@
+import pytest
+
+from src.core.pipeline import translation_pipeline
+from src.core.pipeline.adaptive_concurrency import AdaptiveConcurrencyLimiter, is_transient_error
+from src.core.pipeline.translation_cache import TranslationCache
+from src.core.pipeline.translation_pipeline import TranslationPipeline
+from src.services.echo_services import EchoBackend, SimulatedCapacityBackend
+
+
+class HttpError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FailingBackend(EchoBackend):
+    """Echo backend whose first calls raise the given errors."""
+
+    def __init__(self, *errors):
+        super().__init__()
+        self.errors = list(errors)
+        self.calls = 0
+
+    def translate_batch(self, texts, input_lang, output_lang):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return super().translate_batch(texts, input_lang, output_lang)
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(translation_pipeline, "RETRY_BASE_DELAY", 0.001)
+
+
+def make_pipeline(backend, initial_limit, max_limit=16, retries=3, tolerance=2.0):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=initial_limit, max_limit=max_limit, tolerance=tolerance)
+    return TranslationPipeline(backend, cache=TranslationCache(0), batch_size=1, limiter=limiter,
+                               segment_filter=None, retries=retries)
+
+
+@pytest.mark.parametrize("error", [
+    TimeoutError("read timed out"), ConnectionResetError(), RuntimeError("Too many requests"),
+    HttpError(429), HttpError(503), RuntimeError("Service temporarily unavailable"),
+])
+def test_transient_errors(error):
+    assert is_transient_error(error)
+
+
+@pytest.mark.parametrize("error", [
+    ValueError("No local phrase table for en -> xx"), HttpError(400), HttpError(404),
+    KeyError("text"), FileNotFoundError("table.tsv"),
+])
+def test_other_errors_are_not_transient(error):
+    assert not is_transient_error(error)
+
+
+def test_limit_grows_additively_while_the_service_keeps_up():
+    # A loose tolerance keeps scheduler jitter on a busy machine from reading as congestion
+    backend = SimulatedCapacityBackend(schedule=[(0.0, 64)], base_latency=0.02)
+    pipeline = make_pipeline(backend, initial_limit=2, tolerance=10.0)
+    texts = [f"segment {index}" for index in range(150)]
+    assert pipeline.translate_batch(texts, "en", "es") == texts
+    limits = [limit for _, limit in pipeline.limiter.history]
+    assert limits[0] == 2 and pipeline.limiter.limit > 4
+    # Additive increase: the limit never jumps by more than one step
+    assert all(later - earlier == 1 for earlier, later in zip(limits, limits[1:]))
+    assert pipeline.metrics.get("backend_errors") == 0
+
+
+def test_limit_decreases_multiplicatively_when_throttled_and_the_calls_are_retried():
+    backend = SimulatedCapacityBackend(schedule=[(0.0, 1)], base_latency=0.02)
+    pipeline = make_pipeline(backend, initial_limit=12, retries=10)
+    texts = [f"segment {index}" for index in range(24)]
+    assert pipeline.translate_batch(texts, "en", "es") == texts
+    limits = [limit for _, limit in pipeline.limiter.history]
+    assert limits[0] == 12 and limits[1] == int(12 * pipeline.limiter.backoff)
+    assert pipeline.limiter.limit <= 2
+    assert pipeline.metrics.get("backend_errors") > 0
+    assert pipeline.metrics.get("backend_retries") == pipeline.metrics.get("backend_errors")
+    assert pipeline.metrics.get("backend_calls") == len(texts)
+
+
+def test_transient_error_is_retried():
+    backend = FailingBackend(RuntimeError("Too many requests"), TimeoutError())
+    pipeline = make_pipeline(backend, initial_limit=10)
+    assert pipeline.translate("Hello", "en", "es") == "Hello"
+    assert backend.calls == 3
+    assert pipeline.metrics.get("backend_retries") == 2
+    assert pipeline.limiter.limit < 10
+
+
+def test_transient_error_is_raised_once_retries_run_out():
+    backend = FailingBackend(*[HttpError(503)] * 5)
+    pipeline = make_pipeline(backend, initial_limit=4, retries=2)
+    with pytest.raises(HttpError):
+        pipeline.translate("Hello", "en", "es")
+    assert backend.calls == 3
+
+
+def test_other_errors_are_raised_at_once_and_keep_the_limit():
+    backend = FailingBackend(ValueError("No local phrase table for en -> xx"))
+    pipeline = make_pipeline(backend, initial_limit=10)
+    with pytest.raises(ValueError):
+        pipeline.translate("Hello", "en", "xx")
+    assert backend.calls == 1
+    assert pipeline.metrics.get("backend_retries") == 0
+    assert pipeline.limiter.limit == 10 and pipeline.limiter.in_flight == 0
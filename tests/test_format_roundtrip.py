@@ -0,0 +1,55 @@
+import pytest
+
+from src.core.formats.format_registry import get_format, get_supported_suffixes
+
+SAMPLES = {
+    ".html": "<!DOCTYPE html>\n<html>\n<head><title>Report</title></head>\n<body>\n"
+             "<h1>Annual report</h1>\n<p>Sales grew <b>quickly</b> this year.</p>\n"
+             "<pre>keep   this</pre>\n<script>var a = 1;</script>\n</body>\n</html>\n",
+    ".xml": '<?xml version="1.0" encoding="UTF-8"?>\n<catalog>\n  <!-- products -->\n'
+            '  <item id="1">Red apple</item>\n  <item translate="no">ACME</item>\n'
+            '  <note><![CDATA[raw <text>]]></note>\n</catalog>\n',
+    ".svg": '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">\n'
+            '  <text x="1" y="5">Hello world</text>\n</svg>\n',
+    ".md": "---\ntitle: Guide\n---\n# Getting started\n\nInstall the **tool** with `pip install tool`.\n\n"
+           "- First item\n- See [the docs](https://example.com)\n\n```\ncode stays\n```\n\n"
+           "| Name | Value |\n|------|-------|\n| Speed | Fast |\n",
+    ".srt": "1\n00:00:01,000 --> 00:00:03,000\nHello there.\nHow are you?\n\n"
+            "2\n00:00:04,000 --> 00:00:06,000\nFine, thanks.\n",
+    ".vtt": "WEBVTT\n\nNOTE a comment\n\n00:00.000 --> 00:02.000\nHello there.\n\n"
+            "intro\n00:02.500 --> 00:04.000 align:start\nGoodbye.\n",
+    ".csv": 'name,description,price\nApple,"Red, sweet fruit",1.20\nPear,Green fruit,0.90\n',
+    ".tsv": "name\tdescription\tprice\nApple\tRed fruit\t1.20\nPear\tGreen fruit\t0.90\n",
+}
+SAMPLES[".htm"] = SAMPLES[".xhtml"] = SAMPLES[".html"]
+SAMPLES[".markdown"] = SAMPLES[".md"]
+# Rebuilt from the translated lines rather than copied, and need the PDF/DOCX libraries
+DOCUMENT_SUFFIXES = {".pdf", ".docx", ".txt"}
+
+
+def round_trip(tmp_path, suffix, data):
+    source = tmp_path / f"source{suffix}"
+    output = tmp_path / f"output{suffix}"
+    source.write_bytes(data)
+    file_format = get_format(str(source))
+    segments = list(file_format.iter_segments(str(source)))
+    assert segments, "the sample should contain translatable text"
+    assert file_format.write(str(source), segments, str(output)) is None
+    return output.read_bytes()
+
+
+def test_every_streamed_format_has_a_sample():
+    assert set(get_supported_suffixes()) - DOCUMENT_SUFFIXES == set(SAMPLES)
+
+
+@pytest.mark.parametrize("suffix", sorted(SAMPLES))
+@pytest.mark.parametrize("newline", ["\n", "\r\n"], ids=["lf", "crlf"])
+def test_identity_translation_keeps_the_file_byte_for_byte(tmp_path, suffix, newline):
+    data = SAMPLES[suffix].replace("\n", newline).encode("utf-8")
+    assert round_trip(tmp_path, suffix, data) == data
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".srt", ".md"])
+def test_identity_translation_keeps_the_byte_order_mark(tmp_path, suffix):
+    data = b"\xef\xbb\xbf" + SAMPLES[suffix].encode("utf-8")
+    assert round_trip(tmp_path, suffix, data) == data
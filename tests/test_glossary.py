@@ -0,0 +1,56 @@
+import json
+
+from src.core.pipeline.glossary import AhoCorasick, Glossary, get_glossary, glossary_pairs, has_glossary_for
+
+
+def test_longest_term_wins_over_overlapping_shorter_ones():
+    matcher = AhoCorasick(["new", "new york", "york city", "new york city"])
+    text = "Welcome to New York City!"
+    assert [(text[start:end], index) for start, end, index in matcher.find(text)] == [("New York City", 3)]
+
+
+def test_leftmost_match_wins_and_matches_do_not_overlap():
+    matcher = AhoCorasick(["machine learning", "learning rate"])
+    text = "machine learning rate"
+    assert [text[start:end] for start, end, _ in matcher.find(text)] == ["machine learning"]
+
+
+def test_matching_ignores_case():
+    matcher = AhoCorasick(["Pull Request"])
+    text = "open a PULL request and a pull Request"
+    assert [text[start:end] for start, end, _ in matcher.find(text)] == ["PULL request", "pull Request"]
+
+
+def test_only_whole_words_match():
+    matcher = AhoCorasick(["cat", "art"])
+    assert matcher.find("category concatenate party cart") == []
+    assert [match[:2] for match in matcher.find("cat, art_ (art)")] == [(0, 3), (11, 14)]
+
+
+def test_placeholders_round_trip_to_target_terms():
+    glossary = Glossary({"pull request": "solicitud de extracción", "branch": "rama", "  ": "ignored"})
+    protected, targets = glossary.protect("Merge the branch after the pull request. Every branch!")
+    assert protected == "Merge the [[0]] after the [[1]]. Every [[2]]!"
+    assert targets == ["rama", "solicitud de extracción", "rama"]
+    # Backends may reorder placeholders and add spaces inside the brackets
+    translation = "Fusiona la [ [0] ] tras la [[1]]. ¡Cada [[2]]! [[7]]"
+    assert Glossary.restore(translation, targets) == (
+        "Fusiona la rama tras la solicitud de extracción. ¡Cada rama! [[7]]")
+
+
+def test_text_without_terms_is_left_alone():
+    glossary = Glossary({"branch": "rama"})
+    assert glossary.protect("Nothing to see here") == ("Nothing to see here", [])
+    assert Glossary.restore("Nada [[0]]", []) == "Nada [[0]]"
+
+
+def test_glossaries_are_found_by_language_pair(tmp_path):
+    with open(tmp_path / "en-es.json", "w", encoding="utf-8") as f:
+        json.dump({"branch": "rama"}, f)
+    (tmp_path / "notes.txt").write_text("not a glossary", encoding="utf-8")
+    directory = str(tmp_path)
+    assert glossary_pairs(directory) == frozenset({("en", "es")})
+    assert has_glossary_for("es", directory) and not has_glossary_for("fr", directory)
+    glossary = get_glossary("en", "es", directory)
+    assert glossary is not None and glossary.targets == ["rama"]
+    assert get_glossary("en", "fr", directory) is None
@@ -0,0 +1,93 @@
+import os
+
+import pytest
+
+from src.core.help import pronunciation_lexicon
+from src.core.help.pronunciation_lexicon import PronunciationLexicon, compile_lexicon, open_lexicon, parse_cmudict
+from src.core.implements.phonetic_transcription_implements import PhoneticTranscriptionImplements
+
+CMUDICT = ";;; comment\nCAR  K AA1 R\nHELLO  HH AH0 L OW1\nHELLO(2)  HH EH0 L OW1\nDON'T  D OW1 N T\n"
+
+
+@pytest.fixture
+def lexicon_path(tmp_path):
+    path = tmp_path / "test.dict"
+    path.write_text(CMUDICT, encoding="utf-8")
+    return str(path)
+
+
+def test_parse_keeps_the_first_variant(lexicon_path):
+    assert parse_cmudict(lexicon_path) == {"CAR": "K AA1 R", "HELLO": "HH AH0 L OW1", "DON'T": "D OW1 N T"}
+
+
+def test_lookup_is_case_insensitive(lexicon_path):
+    lexicon = open_lexicon(lexicon_path)
+    assert len(lexicon) == 3
+    assert lexicon.lookup("hello") == ["HH", "AH0", "L", "OW1"]
+    assert lexicon.lookup("Don't") == ["D", "OW1", "N", "T"]
+    assert "car" in lexicon and "cart" not in lexicon
+    lexicon.close()
+
+
+def test_stale_binary_is_recompiled(lexicon_path):
+    open_lexicon(lexicon_path).close()
+    with open(lexicon_path, "a", encoding="utf-8") as f:
+        f.write("CAT  K AE1 T\n")
+    binary = os.stat(lexicon_path + ".bin")
+    os.utime(lexicon_path + ".bin", ns=(binary.st_atime_ns, os.stat(lexicon_path).st_mtime_ns - 10 ** 9))
+    lexicon = open_lexicon(lexicon_path)
+    assert lexicon.lookup("cat") == ["K", "AE1", "T"]
+    lexicon.close()
+
+
+def test_invalid_binary_is_rejected(tmp_path):
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"NOTALEX!" + bytes(8))
+    with pytest.raises(ValueError):
+        PronunciationLexicon(str(path))
+    compile_lexicon({}, str(path))
+    assert len(PronunciationLexicon(str(path))) == 0
+
+
+def read_only(monkeypatch, *locations):
+    """Make compile_lexicon fail with PermissionError under locations, like on a read-only install."""
+    compile_to = pronunciation_lexicon.compile_lexicon
+
+    def compile_unless_read_only(entries, binary_path):
+        if any(binary_path.startswith(str(location)) for location in locations):
+            raise PermissionError(13, "Read-only file system", binary_path)
+        compile_to(entries, binary_path)
+
+    monkeypatch.setattr(pronunciation_lexicon, "compile_lexicon", compile_unless_read_only)
+
+
+def test_read_only_install_compiles_into_the_user_cache(lexicon_path, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("TRANSLATOR_CACHE_DIR", str(cache_dir))
+    read_only(monkeypatch, lexicon_path + ".bin")
+    lexicon = open_lexicon(lexicon_path)
+    assert lexicon.path.startswith(str(cache_dir)) and not os.path.exists(lexicon_path + ".bin")
+    assert lexicon.lookup("car") == ["K", "AA1", "R"]
+    lexicon.close()
+    # The cached copy is reused while it is current
+    assert open_lexicon(lexicon_path).path == lexicon.path
+
+
+def test_lexicon_is_compiled_in_memory_when_nothing_is_writable(lexicon_path, tmp_path, monkeypatch):
+    monkeypatch.setenv("TRANSLATOR_CACHE_DIR", str(tmp_path / "cache"))
+    read_only(monkeypatch, tmp_path)
+    lexicon = open_lexicon(lexicon_path)
+    assert lexicon.path == "" and len(lexicon) == 3
+    assert lexicon.lookup("hello") == ["HH", "AH0", "L", "OW1"]
+    assert not [name for _, _, names in os.walk(tmp_path) for name in names if name.endswith(".bin")]
+    lexicon.close()
+
+
+def test_transcription_follows_the_accent(lexicon_path):
+    transcriber = PhoneticTranscriptionImplements(lexicon_path=lexicon_path)
+    assert transcriber.transcribe_to_ipa("Hello car!", "rp") == "həˈləʊ kɑː!"
+    assert transcriber.transcribe_to_ipa("Hello car!", "ga") == "həˈloʊ kɑɹ!"
+    # Words missing from the lexicon fall back to spelling rules
+    assert transcriber.transcribe_word("zorp", "ga")
+    with pytest.raises(ValueError):
+        transcriber.transcribe_to_ipa("Hello", "xx")
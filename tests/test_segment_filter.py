@@ -0,0 +1,112 @@
+import pytest
+
+from src.core.pipeline.segment_filter import SegmentFilter
+
+
+@pytest.fixture
+def segment_filter():
+    return SegmentFilter()
+
+
+def reason(segment_filter, text, input_lang="en", output_lang="es"):
+    return segment_filter.skip_reason(SegmentFilter.normalize(text), input_lang, output_lang)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("", "empty"),
+    ("   ​ ", "empty"),
+    ("12 345,67", "no_letters"),
+    ("2024-05-01", "no_letters"),
+    ("* * *", "no_letters"),
+    ("- 14 -", "no_letters"),
+])
+def test_segments_without_letters(segment_filter, text, expected):
+    assert reason(segment_filter, text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "Page 12", "p. 7", "Seite 3 von 10", "Página 4 de 9", "стр. 5",
+    "Page XIV", "p. iv", "pag. xii", "Page MMXXIV",
+    "IV", "xii", "XVIII.", "vii",
+])
+def test_page_numbers_are_skipped(segment_filter, text):
+    assert reason(segment_filter, text) == "page_number"
+
+
+@pytest.mark.parametrize("text", [
+    "MIX", "DC", "DIV", "MID", "CD", "LCD", "CIVIL", "Xi", "I", "Page views", "pix", "PCI",
+    "Page twelve is missing", "See page 12 for details",
+])
+def test_words_and_acronyms_are_not_page_numbers(segment_filter, text):
+    assert reason(segment_filter, text) is None
+
+
+@pytest.mark.parametrize("text", ["https://example.com/docs?page=2", "www.example.org", "ftp://files.example.net/a"])
+def test_urls_are_skipped(segment_filter, text):
+    assert reason(segment_filter, text) == "url"
+
+
+@pytest.mark.parametrize("text", ["Visit example.com for more", "The www is large", "https is a protocol"])
+def test_prose_mentioning_urls_is_translated(segment_filter, text):
+    assert reason(segment_filter, text) is None
+
+
+@pytest.mark.parametrize("text", ["jane.doe+news@example.co.uk", "mailto:info@example.com"])
+def test_email_addresses_are_skipped(segment_filter, text):
+    assert reason(segment_filter, text) == "email"
+
+
+@pytest.mark.parametrize("text", ["Write to info@example.com today", "Meet me @ noon"])
+def test_prose_mentioning_email_is_translated(segment_filter, text):
+    assert reason(segment_filter, text) is None
+
+
+@pytest.mark.parametrize("text", [
+    "#include <stdio.h>",
+    "#!/usr/bin/env python",
+    "import numpy.linalg as la",
+    "import java.util.*;",
+    "import os;",
+    "from os.path import join, exists",
+    "from . import views",
+    "def translate(text):",
+    "class Pipeline:",
+    "function render() {",
+    "const total = items.length",
+    "return value;",
+    "public static void main(String[] args) {",
+    "if (count > 0) {",
+    "} else {",
+    "console.log(message);",
+    "os.path.join(root, name)",
+    ">>> print('hello')",
+    ">>> x = 1",
+    ">>> len(items) + 1",
+])
+def test_code_is_skipped(segment_filter, text):
+    assert reason(segment_filter, text) == "code"
+
+
+@pytest.mark.parametrize("text", [
+    "import duties",
+    "import duties rose sharply",
+    "import duties.",
+    "from there import more",
+    "from China import tariffs fell",
+    "$ 100 per month is the price",
+    "It costs $ 5",
+    ">>> Hello there, how are you?",
+    ">>> I think so",
+    "Classes start on Monday.",
+    "Return to the main menu.",
+    "Let me know if it works.",
+])
+def test_prose_that_looks_like_code_is_translated(segment_filter, text):
+    assert reason(segment_filter, text) is None
+
+
+def test_text_already_in_target_language_is_skipped(segment_filter):
+    text = "La casa de mi familia está muy cerca de la playa y tiene un jardín con muchas flores."
+    assert reason(segment_filter, text, "en", "es") == "target_language"
+    assert reason(segment_filter, "Hola, ¿qué tal?", "en", "es") is None  # too short to be sure
+    assert reason(segment_filter, text, "es", "es") is None
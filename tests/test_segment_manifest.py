@@ -0,0 +1,67 @@
+import json
+
+from src.core.help.segment_manifest import SegmentManifest, manifest_path_for, segment_hash
+from src.core.implements.file_translator_implements import FileTranslatorImplements
+from src.core.pipeline.translation_cache import TranslationCache
+from src.core.pipeline.translation_pipeline import TranslationPipeline
+from src.services.echo_services import EchoBackend
+
+
+class RecordingBackend(EchoBackend):
+    """Echo backend that upper-cases segments and records what it was sent."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent: list[str] = []
+
+    def translate_batch(self, texts, input_lang, output_lang):
+        self.sent.extend(texts)
+        return [text.upper() for text in texts]
+
+
+def translate(file_path):
+    backend = RecordingBackend()
+    # No pipeline cache, so every segment missing from the manifest reaches the backend
+    translator = FileTranslatorImplements(TranslationPipeline(backend, cache=TranslationCache(0)), incremental=True)
+    result = translator.translate_document(str(file_path), "en", "es")
+    assert result.status == "completed", result.message
+    return backend.sent, result
+
+
+def test_only_edited_segments_are_retranslated(tmp_path):
+    source = tmp_path / "notes.md"
+    source.write_text("The first paragraph stays.\n\nThe second paragraph changes.\n\nThe third one stays too.\n",
+                      encoding="utf-8")
+    sent, result = translate(source)
+    assert len(sent) == 3 and result.reused_segments == 0
+
+    source.write_text("The first paragraph stays.\n\nThe second paragraph was edited.\n\nThe third one stays too.\n",
+                      encoding="utf-8")
+    sent, result = translate(source)
+    assert sent == ["The second paragraph was edited."]
+    assert result.reused_segments == 2
+    assert (tmp_path / "notes_translated.md").read_text(encoding="utf-8") == (
+        "THE FIRST PARAGRAPH STAYS.\n\nTHE SECOND PARAGRAPH WAS EDITED.\n\nTHE THIRD ONE STAYS TOO.\n")
+
+    # Segments removed by the edit are dropped from the manifest
+    with open(manifest_path_for(str(tmp_path / "notes_translated.md")), encoding="utf-8") as f:
+        segments = json.load(f)["segments"]
+    assert segment_hash("The second paragraph changes.") not in segments
+    assert segments[segment_hash("The second paragraph was edited.")] == "THE SECOND PARAGRAPH WAS EDITED."
+
+
+def test_manifest_for_other_settings_is_ignored(tmp_path):
+    path = str(tmp_path / "out.md.segments.json")
+    manifest = SegmentManifest(path, "en", "es", "echo")
+    manifest.replace(["Hello"], ["Hola"])
+    manifest.save()
+
+    assert SegmentManifest.load(path, "en", "es", "echo").diff(["Hello", "Bye"]) == (["Hola", None], [1])
+    for settings in (("en", "fr", "echo"), ("de", "es", "echo"), ("en", "es", "local")):
+        assert SegmentManifest.load(path, *settings).segments == {}
+
+
+def test_corrupt_manifest_is_ignored(tmp_path):
+    path = tmp_path / "out.md.segments.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert SegmentManifest.load(str(path), "en", "es", "echo").segments == {}
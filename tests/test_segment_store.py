@@ -0,0 +1,36 @@
+from src.core.help.segment_store import SegmentStore
+
+SEGMENTS = [f"segment {index} ñandú €" for index in range(200)] + ["", "last"]
+
+
+def test_reads_match_across_the_spill_threshold():
+    store = SegmentStore(spill_threshold=512)
+    for index, segment in enumerate(SEGMENTS):
+        store.append(segment)
+        # Reading between appends must see the segments written after the file was mapped
+        assert store[index] == segment
+        assert store[0] == SEGMENTS[0]
+    assert store.spilled
+    assert len(store) == len(SEGMENTS)
+    assert list(store) == SEGMENTS
+    assert store.slice(95, 105) == SEGMENTS[95:105]
+    assert store.slice(len(SEGMENTS) - 2, len(SEGMENTS) + 10) == ["", "last"]
+    assert store[-1] == "last"
+    assert b"".join(store.iter_views()) == "".join(SEGMENTS).encode("utf-8")
+    assert store.nbytes == len("".join(SEGMENTS).encode("utf-8"))
+    store.close()
+
+
+def test_in_memory_and_spilled_stores_agree():
+    in_memory = SegmentStore(SEGMENTS, spill_threshold=0)
+    spilled = SegmentStore(SEGMENTS, spill_threshold=1)
+    assert not in_memory.spilled and spilled.spilled
+    assert list(in_memory) == list(spilled) == SEGMENTS
+    in_memory.close()
+    spilled.close()
+
+
+def test_close_empties_the_store():
+    with SegmentStore(SEGMENTS, spill_threshold=1) as store:
+        assert len(store) == len(SEGMENTS)
+    assert len(store) == 0 and not store.spilled
@@ -0,0 +1,66 @@
+import asyncio
+
+from src.core.implements.file_translator_implements import FileTranslatorImplements
+from src.core.jobs.translation_job import CANCELLED, COMPLETED, TranslationJob
+from src.core.pipeline.translation_cache import TranslationCache
+from src.core.pipeline.translation_pipeline import TranslationPipeline
+from src.services.echo_services import EchoBackend
+
+
+def make_translator(latency=0.0, batch_size=10):
+    pipeline = TranslationPipeline(EchoBackend(latency=latency), cache=TranslationCache(0), batch_size=batch_size)
+    return FileTranslatorImplements(pipeline, incremental=False)
+
+
+def write_lines(path, lines):
+    path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+    return str(path)
+
+
+def test_concurrent_jobs_report_their_own_statistics(tmp_path):
+    translator = make_translator(latency=0.001)
+    prose = write_lines(tmp_path / "prose.md", [f"This is sentence number {index} about the house."
+                                                for index in range(300)])
+    numbers = write_lines(tmp_path / "numbers.md", [str(index * 7) for index in range(300)])
+    jobs = [TranslationJob(translator, path, "en", "es").submit() for path in (prose, numbers)]
+    prose_result, numbers_result = (job.result(timeout=60) for job in jobs)
+    assert prose_result.status == numbers_result.status == COMPLETED
+    assert prose_result.skipped_segments == 0 and prose_result.segments == 300
+    assert numbers_result.skipped_segments == 300
+
+
+def test_job_can_be_awaited(tmp_path):
+    source = write_lines(tmp_path / "doc.md", ["Hello there, how are you today?"])
+
+    async def run():
+        return await TranslationJob(make_translator(), source, "en", "es").submit()
+
+    result = asyncio.run(run())
+    assert result.status == COMPLETED
+    assert (tmp_path / "doc_translated.md").read_text(encoding="utf-8") == "Hello there, how are you today?\n"
+
+
+def test_cancel_during_translation_writes_no_output(tmp_path):
+    source = write_lines(tmp_path / "doc.md", [f"Paragraph number {index} of the report." for index in range(2000)])
+    job = TranslationJob(make_translator(latency=0.01, batch_size=1), source, "en", "es").submit()
+    for progress in job.progress(timeout=30):
+        if progress.stage == "translate":
+            assert job.cancel()
+    result = job.result(timeout=30)
+    assert result.status == CANCELLED and job.status == CANCELLED
+    assert not (tmp_path / "doc_translated.md").exists()
+
+
+def test_cancel_once_writing_started_completes_the_job(tmp_path):
+    source = write_lines(tmp_path / "doc.md", ["A short paragraph to translate."])
+    job = TranslationJob(make_translator(), source, "en", "es")
+
+    def cancel_when_writing(progress):
+        if progress.stage == "write":
+            job.cancel_event.set()
+
+    job.add_progress_callback(cancel_when_writing)
+    result = job.submit().result(timeout=30)
+    assert result.status == COMPLETED
+    assert (tmp_path / "doc_translated.md").exists()
+    assert not job.cancel()  # finished jobs cannot be cancelled